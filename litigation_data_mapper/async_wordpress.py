@@ -0,0 +1,354 @@
+import asyncio
+import json
+import os
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any, TypeVar
+
+import click
+import httpx
+
+from litigation_data_mapper.rate_limit import RateLimiter, get_rate_limiter
+from litigation_data_mapper.retry_policy import (
+    DEFAULT_RETRY_POLICY,
+    RETRY_STATUSES,
+    WORDPRESS_ENDPOINT_BUDGET_SECONDS,
+    WORDPRESS_RUN_BUDGET_SECONDS,
+    Deadline,
+    DeadlineExceeded,
+    RetryPolicy,
+    get_retry_stats,
+)
+from litigation_data_mapper.wordpress_paging import (
+    dedupe_by_id,
+    page_params,
+    take_modified_records,
+)
+
+T = TypeVar("T")
+
+# Maximum number of requests an async client has in flight to the WordPress host
+WORDPRESS_ASYNC_CONCURRENCY = int(os.getenv("WORDPRESS_ASYNC_CONCURRENCY", "8"))
+
+
+def create_async_client(
+    max_connections: int = WORDPRESS_ASYNC_CONCURRENCY,
+) -> httpx.AsyncClient:
+    """Create an async HTTP client keeping connections to the host alive between requests.
+
+    The client makes no retries of its own, each request is retried on its own within a
+    deadline by `call_with_retries_async` instead.
+
+    :param int max_connections: Maximum number of connections to keep open.
+    :return httpx.AsyncClient: The client, to be closed by the caller.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+    )
+
+
+def is_retryable_async(error: Exception) -> bool:
+    """Whether a failed async request is worth trying again.
+
+    :param Exception error: The error the request failed with.
+    :return bool: True for transport errors, timeouts and retryable status codes.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRY_STATUSES
+    return isinstance(error, httpx.TransportError)
+
+
+async def call_with_retries_async(
+    request: Callable[[float], Awaitable[T]],
+    description: str,
+    deadline: Deadline,
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> T:
+    """Make an async request, retrying it with exponential backoff within a deadline.
+
+    The counterpart of `call_with_retries`, backing off without blocking the event loop.
+
+    :param Callable[[float], Awaitable[T]] request: Makes the request, given the timeout
+        to use.
+    :param str description: What is being requested, used to report retries.
+    :param Deadline deadline: When to give up retrying.
+    :param RetryPolicy policy: How often and how patiently to retry.
+    :raise DeadlineExceeded: If the deadline passes before the request succeeds.
+    :raise httpx.HTTPError: If the request fails and cannot be retried.
+    :return T: The result of the request.
+    """
+    retry = 0
+    while True:
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Ran out of time requesting {description}")
+
+        try:
+            return await request(min(policy.timeout, remaining))
+        except httpx.HTTPError as e:
+            if retry >= policy.retries or not is_retryable_async(e):
+                raise
+
+            retry += 1
+            backoff = min(policy.backoff(retry), deadline.remaining())
+            if backoff <= 0:
+                raise DeadlineExceeded(
+                    f"Ran out of time requesting {description}"
+                ) from e
+
+            click.echo(
+                f"🔁 Retrying {description} in {backoff:.1f}s "
+                f"({retry}/{policy.retries}): {e}"
+            )
+            await asyncio.sleep(backoff)
+            get_retry_stats().record_retry(description, backoff)
+
+
+async def _acquire(limiter: RateLimiter) -> None:
+    """Wait for the rate limiter in a worker thread, without blocking the event loop.
+
+    A thread cannot be cancelled, so if the wait is cancelled the slot is handed back
+    once the thread has acquired it rather than being held forever.
+    """
+    acquire = asyncio.ensure_future(asyncio.to_thread(limiter.acquire))
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+
+        def release(task: asyncio.Future[None]) -> None:
+            if not task.cancelled() and task.exception() is None:
+                limiter.release()
+
+        acquire.add_done_callback(release)
+        raise
+
+
+async def _get(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, Any] | None,
+    timeout: float,
+) -> httpx.Response:
+    """Make a GET request through the shared rate limiter of the URL's host.
+
+    The limiter blocks while the host is paused or busy, so it is waited on in a worker
+    thread rather than on the event loop.
+    """
+    limiter = get_rate_limiter(url)
+    await _acquire(limiter)
+    status_code = None
+    retry_after = None
+    try:
+        response = await client.get(url, params=params, timeout=timeout)
+        status_code = response.status_code
+        retry_after = response.headers.get("Retry-After")
+    finally:
+        limiter.release(status_code, retry_after)
+
+    response.raise_for_status()
+    return response
+
+
+class _AsyncPageFetcher:
+    """Fetches single pages of results from a WordPress endpoint on an event loop.
+
+    At most `max_concurrency` pages are requested at once, and each page is retried on
+    its own according to the retry policy until the deadline for the endpoint passes.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        deadline: Deadline,
+        max_concurrency: int,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    ):
+        self.client = client
+        self.endpoint = endpoint
+        self.deadline = deadline
+        self.retry_policy = retry_policy
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(self, params: dict[str, Any]) -> tuple[list[dict[str, Any]], int]:
+        """Fetch a single page of results.
+
+        :param dict[str, Any] params: The query parameters of the page to fetch.
+        :raise httpx.HTTPError: If the page could not be fetched.
+        :raise json.JSONDecodeError: If the page is not valid JSON.
+        :return tuple[list[dict[str, Any]], int]: The records on the page and the total
+            number of pages reported by WordPress.
+        """
+
+        async def request(timeout: float) -> tuple[list[dict[str, Any]], int]:
+            response = await _get(self.client, self.endpoint, params, timeout)
+            return response.json(), int(response.headers.get("X-WP-TotalPages", 1))
+
+        async with self._semaphore:
+            return await call_with_retries_async(
+                request,
+                f"{self.endpoint} page {params['page']}",
+                self.deadline,
+                self.retry_policy,
+            )
+
+
+async def _fetch_all_pages(
+    fetcher: _AsyncPageFetcher, per_page: int, fields: list[str] | None
+) -> list[list[dict[str, Any]]]:
+    data, total_pages = await fetcher.fetch(page_params(1, per_page, fields=fields))
+    if not data:
+        return []
+
+    # The first page to fail cancels the requests for every other page
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(
+                    fetcher.fetch(page_params(page, per_page, fields=fields))
+                )
+                for page in range(2, total_pages + 1)
+            ]
+    except ExceptionGroup as errors:
+        raise errors.exceptions[0] from errors
+    return [data, *(task.result()[0] for task in tasks)]
+
+
+async def _fetch_modified_pages(
+    fetcher: _AsyncPageFetcher,
+    per_page: int,
+    fields: list[str] | None,
+    modified_after: datetime,
+) -> list[list[dict[str, Any]]]:
+    pages = []
+    page = 1
+    total_pages = 1
+    while page <= total_pages:
+        data, page_total = await fetcher.fetch(
+            page_params(page, per_page, modified_after, fields)
+        )
+        if page == 1:
+            total_pages = page_total
+
+        modified_data, has_more = take_modified_records(data, modified_after)
+        if modified_data:
+            pages.append(modified_data)
+
+        if not has_more:
+            break
+
+        page += 1
+    return pages
+
+
+async def fetch_word_press_data_async(
+    endpoint: str,
+    per_page: int = 100,
+    max_concurrency: int = WORDPRESS_ASYNC_CONCURRENCY,
+    client: httpx.AsyncClient | None = None,
+    modified_after: datetime | None = None,
+    fields: list[str] | None = None,
+    deadline: Deadline | None = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> list[dict[str, Any]]:
+    """Fetch paginated data from a given API endpoint without blocking the event loop.
+
+    The async counterpart of `fetch_word_press_data`. The first page is fetched on its
+    own to learn the total number of pages, then up to `max_concurrency` of the
+    remaining pages are requested at once. Records are returned in page order, deduped
+    by id. Pages are neither cached nor checkpointed.
+
+    :param str endpoint: The API URL to fetch data from.
+    :param int per_page: Number of results per page (default: 100).
+    :param int max_concurrency: Number of pages to request at once.
+    :param httpx.AsyncClient | None client: The client to use, defaults to a client
+        created for this call.
+    :param datetime | None modified_after: Only fetch records whose `modified_gmt` is
+        after this (naive, UTC) time, paging newest first as `iter_word_press_pages`.
+    :param list[str] | None fields: Only fetch these top level fields of each record
+        using the WordPress `_fields` parameter, defaults to every field.
+    :param Deadline | None deadline: When the run fetching this endpoint must finish.
+    :param RetryPolicy retry_policy: How each page is retried.
+    :return list[dict[str, Any]]: A list of data records if successful, or an empty
+        list if an error occurs.
+    """
+    if client is None:
+        async with create_async_client(max_concurrency) as client:
+            return await fetch_word_press_data_async(
+                endpoint,
+                per_page=per_page,
+                max_concurrency=max_concurrency,
+                client=client,
+                modified_after=modified_after,
+                fields=fields,
+                deadline=deadline,
+                retry_policy=retry_policy,
+            )
+
+    endpoint_deadline = (
+        deadline or Deadline.after(WORDPRESS_RUN_BUDGET_SECONDS)
+    ).within(WORDPRESS_ENDPOINT_BUDGET_SECONDS)
+    fetcher = _AsyncPageFetcher(
+        client=client,
+        endpoint=endpoint,
+        deadline=endpoint_deadline,
+        max_concurrency=max_concurrency,
+        retry_policy=retry_policy,
+    )
+
+    click.echo(f"⏳ fetching from {endpoint}...")
+    try:
+        if modified_after is not None:
+            pages = await _fetch_modified_pages(
+                fetcher, per_page, fields, modified_after
+            )
+        else:
+            pages = await _fetch_all_pages(fetcher, per_page, fields)
+    except (httpx.HTTPError, json.JSONDecodeError, DeadlineExceeded) as e:
+        click.echo(f"❌ Error fetching data from {endpoint}: {e}", err=True)
+        return []
+
+    click.echo("✅ Completed fetching from endpoint.")
+    return [record for page in dedupe_by_id(iter(pages)) for record in page]
+
+
+async def fetch_individual_wordpress_resource_async(
+    endpoint: str,
+    client: httpx.AsyncClient | None = None,
+    deadline: Deadline | None = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> dict[str, Any] | None:
+    """Fetch a single WordPress resource without blocking the event loop.
+
+    The async counterpart of `fetch_individual_wordpress_resource`.
+
+    :param str endpoint: The API URL of the resource.
+    :param httpx.AsyncClient | None client: The client to use, defaults to a client
+        created for this call.
+    :param Deadline | None deadline: When to give up retrying the request.
+    :param RetryPolicy retry_policy: How the request is retried.
+    :return dict[str, Any] | None: The resource, or None if it could not be fetched.
+    """
+    if client is None:
+        async with create_async_client(1) as client:
+            return await fetch_individual_wordpress_resource_async(
+                endpoint, client=client, deadline=deadline, retry_policy=retry_policy
+            )
+
+    deadline = deadline or Deadline.after(WORDPRESS_ENDPOINT_BUDGET_SECONDS)
+
+    async def request(timeout: float) -> dict[str, Any]:
+        response = await _get(client, endpoint, None, timeout)
+        return response.json()
+
+    try:
+        click.echo(f"⏳ fetching individual resource from {endpoint}...")
+        return await call_with_retries_async(request, endpoint, deadline, retry_policy)
+    except (httpx.HTTPError, json.JSONDecodeError, DeadlineExceeded) as e:
+        click.echo(
+            f"❌ Error fetching individual resource from {endpoint}: {e}", err=True
+        )
+        return None
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from mypy_boto3_s3.client import S3Client
+
+# Setting this checkpoints every page fetched from WordPress to a local directory
+WORDPRESS_CHECKPOINT_DIR_ENV = "WORDPRESS_CHECKPOINT_DIR"
+
+# Pages checkpointed longer ago than this are refetched rather than resumed from, so
+# a failed run is not stitched together with pages from a much older one
+DEFAULT_CHECKPOINT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+
+class CheckpointStore(Protocol):
+    """Somewhere to persist the pages of an endpoint while it is being fetched."""
+
+    def load_page(self, key: str, page: int) -> dict[str, Any] | None: ...
+
+    def save_page(self, key: str, page: int, entry: dict[str, Any]) -> None: ...
+
+    def clear(self, key: str) -> None: ...
+
+    def clear_all(self) -> None: ...
+
+
+class LocalCheckpointStore:
+    """Checkpoints pages as JSON files in a local directory."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _page_path(self, key: str, page: int) -> str:
+        return os.path.join(self.directory, key, f"page-{page:05}.json")
+
+    def load_page(self, key: str, page: int) -> dict[str, Any] | None:
+        try:
+            with open(self._page_path(key, page), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save_page(self, key: str, page: int, entry: dict[str, Any]) -> None:
+        path = self._page_path(key, page)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def clear(self, key: str) -> None:
+        shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+
+    def clear_all(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class S3CheckpointStore:
+    """Checkpoints pages as JSON objects in the S3 cache bucket."""
+
+    def __init__(
+        self,
+        client: S3Client,
+        bucket: str = "cpr-cache",
+        prefix: str = "litigation/wordpress/checkpoints",
+    ):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def _page_key(self, key: str, page: int) -> str:
+        return f"{self.prefix}/{key}/page-{page:05}.json"
+
+    def load_page(self, key: str, page: int) -> dict[str, Any] | None:
+        try:
+            s3_object = self.client.get_object(
+                Bucket=self.bucket, Key=self._page_key(key, page)
+            )
+        except self.client.exceptions.NoSuchKey:
+            return None
+        return json.loads(s3_object["Body"].read().decode("utf-8"))
+
+    def save_page(self, key: str, page: int, entry: dict[str, Any]) -> None:
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self._page_key(key, page),
+            Body=json.dumps(entry),
+        )
+
+    def clear(self, key: str) -> None:
+        self._delete_prefix(f"{self.prefix}/{key}/")
+
+    def clear_all(self) -> None:
+        self._delete_prefix(f"{self.prefix}/")
+
+    def _delete_prefix(self, prefix: str) -> None:
+        paginator = self.client.get_paginator("list_objects_v2")
+        for result in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            objects = [{"Key": item["Key"]} for item in result.get("Contents", [])]
+            if objects:
+                self.client.delete_objects(
+                    Bucket=self.bucket, Delete={"Objects": objects}
+                )
+
+
+@dataclass(frozen=True, slots=True)
+class PageCheckpoint:
+    """The checkpointed pages of a single fetch of an endpoint."""
+
+    store: CheckpointStore
+    key: str
+    max_age_seconds: float = DEFAULT_CHECKPOINT_MAX_AGE_SECONDS
+
+    @classmethod
+    def for_request(
+        cls,
+        store: CheckpointStore,
+        endpoint: str,
+        params: dict[str, Any],
+        variant: str | None = None,
+    ) -> "PageCheckpoint":
+        """Create the checkpoint for an endpoint fetched with the given parameters.
+
+        :param CheckpointStore store: Where to persist the pages.
+        :param str endpoint: The API URL the pages are fetched from.
+        :param dict[str, Any] params: The query parameters shared by every page.
+        :param str | None variant: How the pages are decoded, if not in full.
+        :return PageCheckpoint: The checkpoint for the fetch.
+        """
+        request: list[Any] = [endpoint, sorted(params.items())]
+        if variant is not None:
+            request.append(variant)
+        digest = hashlib.sha256(
+            json.dumps(request, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        name = endpoint.rstrip("/").rsplit("/", 1)[-1]
+        return cls(store=store, key=f"{name}-{digest}")
+
+    def get(self, page: int) -> tuple[list[dict[str, Any]], int] | None:
+        """Retrieve a checkpointed page.
+
+        :param int page: The page number.
+        :return tuple[list[dict[str, Any]], int] | None: The records on the page and the
+            total number of pages, or None if the page has not been checkpointed or the
+            checkpoint has expired.
+        """
+        entry = self.store.load_page(self.key, page)
+        if entry is None:
+            return None
+        if time.time() - entry.get("saved_at", 0) > self.max_age_seconds:
+            return None
+        return entry["data"], entry["total_pages"]
+
+    def put(self, page: int, data: list[dict[str, Any]], total_pages: int) -> None:
+        """Checkpoint a page that has been fetched successfully.
+
+        :param int page: The page number.
+        :param list[dict[str, Any]] data: The records on the page.
+        :param int total_pages: The total number of pages reported by WordPress.
+        """
+        self.store.save_page(
+            self.key,
+            page,
+            {"saved_at": time.time(), "total_pages": total_pages, "data": data},
+        )
+
+    def clear(self) -> None:
+        """Remove every checkpointed page once the fetch has completed."""
+        self.store.clear(self.key)
+
+
+def get_default_checkpoint_store() -> CheckpointStore | None:
+    """Build the checkpoint store configured through the environment, if any.
+
+    :return CheckpointStore | None: A store in `WORDPRESS_CHECKPOINT_DIR`, or None if
+        the variable is not set.
+    """
+    directory = os.getenv(WORDPRESS_CHECKPOINT_DIR_ENV)
+    return LocalCheckpointStore(directory) if directory else None
@@ -5,9 +5,20 @@ from datetime import datetime, timedelta
 from typing import Any, List, Tuple
 
 import click
+import requests
 import vcr
 
-from litigation_data_mapper.datatypes import Failure, LitigationContext
+from litigation_data_mapper.data_sources import (
+    DATA_SOURCES,
+    DEFAULT_SNAPSHOT_DIR,
+    get_data_source,
+)
+from litigation_data_mapper.datatypes import (
+    Failure,
+    FailureLog,
+    LitigationContext,
+    SkipIndex,
+)
 from litigation_data_mapper.extract_concepts import (
     Concept,
 )
@@ -15,23 +26,25 @@ from litigation_data_mapper.extract_concepts import taxonomies as concept_taxono
 from litigation_data_mapper.extract_concepts import (
     transform_wordpress_concepts_data,
 )
-from litigation_data_mapper.fetch_litigation_data import (
-    LitigationType,
-    fetch_litigation_data,
-)
+from litigation_data_mapper.fetch_litigation_data import LitigationType
+from litigation_data_mapper.litigation_index import LitigationIndex
+from litigation_data_mapper.negative_cache import log_negative_cache_stats
+from litigation_data_mapper.parsers.case import map_cases
 from litigation_data_mapper.parsers.collection import map_collections
-from litigation_data_mapper.parsers.document import map_documents
-from litigation_data_mapper.parsers.event import map_events
 from litigation_data_mapper.parsers.family import (
     get_jurisdiction_iso_codes,
-    map_families,
     process_global_case_data,
     process_us_case_data,
 )
 from litigation_data_mapper.parsers.helpers import map_global_jurisdictions
-from litigation_data_mapper.wordpress import fetch_word_press_data
+from litigation_data_mapper.parsers.shards import map_cases_in_shards
+from litigation_data_mapper.pipeline import stream_litigation_data
+from litigation_data_mapper.wordpress import WORDPRESS_BASE_URL, iter_word_press_data
 from litigation_data_mapper.wordpress_data import fetch_and_write_all_wordpress_data
 
+# Litigation data modified within this window is mapped when only mapping modified data
+UPDATE_WINDOW = timedelta(hours=48)
+
 
 @click.command()
 @click.option(
@@ -45,38 +58,111 @@ from litigation_data_mapper.wordpress_data import fetch_and_write_all_wordpress_
     default=False,
     help="Whether to map only recently modified litigation data",
 )
+@click.option(
+    "--selective-media/--full-media",
+    default=False,
+    help="Whether to fetch only the media files referred to by cases",
+)
+@click.option(
+    "--source",
+    default="api",
+    type=click.Choice(DATA_SOURCES),
+    help="Where to load the litigation data from: the live API, the S3 cache or a "
+    "local snapshot directory",
+)
+@click.option(
+    "--snapshot-dir",
+    default=DEFAULT_SNAPSHOT_DIR,
+    type=click.Path(exists=False),
+    help="The snapshot directory to load from with --source local",
+)
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help="The number of worker processes to map the cases with",
+)
+@click.option(
+    "--stream/--no-stream",
+    default=False,
+    help="Whether to stream the cases through the mapping one at a time, keeping "
+    "memory use flat however large the corpus",
+)
 @click.version_option("0.1.0", "--version", "-v", help="Show the version and exit.")
 def entrypoint(
     output_file: str,
     debug: bool,
     get_modified_data: bool,
+    selective_media: bool,
+    source: str,
+    snapshot_dir: str,
+    workers: int,
+    stream: bool,
 ):
     """Simple program that wrangles litigation data into bulk import format.
 
     :param str output_file: The output filename.
     :param bool debug: Whether debug mode is on.
     :param bool get_modified_data: Whether to map only recently modified litigation data.
+    :param bool selective_media: Whether to fetch only the media files referred to by cases.
+    :param str source: Where to load the litigation data from.
+    :param str snapshot_dir: The snapshot directory to load from with the local source.
+    :param int workers: The number of worker processes to map the cases with.
+    :param bool stream: Whether to stream the cases through the mapping one at a time.
     """
+    if stream and workers > 1:
+        raise click.UsageError("--stream maps the cases one at a time, without workers")
+
     click.echo("🚀 Starting the litigation data mapping process.")
 
-    try:
-        click.echo("🚀 Mapping litigation data")
-        click.echo("🔍 Fetching fresh litigation data")
-        litigation_data: LitigationType = fetch_litigation_data()
-        [mapped_data, _] = wrangle_data(litigation_data, debug, get_modified_data)
-    except Exception as e:
-        click.echo(f"❌ Failed to map litigation data to expected JSON. Error: {e}.")
-        sys.exit(1)
+    last_import_date = datetime.now() - UPDATE_WINDOW
+
+    if stream:
+        try:
+            click.echo(f"🚀 Streaming litigation data from {source}")
+            counts = stream_litigation_data(
+                get_data_source(source, snapshot_dir),
+                output_file,
+                create_context(debug, get_modified_data, last_import_date),
+                selective_media=selective_media,
+            )
+            log_negative_cache_stats()
+        except Exception as e:
+            click.echo(
+                f"❌ Failed to map litigation data to expected JSON. Error: {e}."
+            )
+            sys.exit(1)
+        click.echo("✅ Finished streaming mapped litigation data.")
+    else:
+        try:
+            click.echo("🚀 Mapping litigation data")
+            click.echo(f"🔍 Loading litigation data from {source}")
+            litigation_data: LitigationType = get_data_source(
+                source, snapshot_dir
+            ).load(
+                modified_after=last_import_date if get_modified_data else None,
+                selective_media=selective_media,
+            )
+            [mapped_data, _] = wrangle_data(
+                litigation_data, debug, get_modified_data, last_import_date, workers
+            )
+        except Exception as e:
+            click.echo(
+                f"❌ Failed to map litigation data to expected JSON. Error: {e}."
+            )
+            sys.exit(1)
+
+        click.echo("✅ Finished mapping litigation data.")
+        click.echo("🚀 Dumping litigation data to output file")
+        dump_output(mapped_data, output_file, debug)
+        click.echo("✅ Finished dumping mapped litigation data.")
+        counts = {key: len(entities) for key, entities in mapped_data.items()}
 
-    click.echo("✅ Finished mapping litigation data.")
-    click.echo("🚀 Dumping litigation data to output file")
-    dump_output(mapped_data, output_file, debug)
-    click.echo("✅ Finished dumping mapped litigation data.")
     click.echo("📝 Mapped:")
-    click.echo(f"   {len(mapped_data['collections'])} collections")
-    click.echo(f"   {len(mapped_data['families'])} families")
-    click.echo(f"   {len(mapped_data['documents'])} documents")
-    click.echo(f"   {len(mapped_data['events'])} events")
+    click.echo(f"   {counts['collections']} collections")
+    click.echo(f"   {counts['families']} families")
+    click.echo(f"   {counts['documents']} documents")
+    click.echo(f"   {counts['events']} events")
 
 
 @vcr.use_cassette(".cache/vcr_cassettes/entrypoint_with_vcr.yaml")  # type: ignore
@@ -96,15 +182,16 @@ def load_json_data(taxonomy: str):
 )
 def search_for_concept(concept_id: str):
     [entrypoint, id] = concept_id.split("/")
-    data = fetch_word_press_data(
-        f"https://admin.climatecasechart.com/wp-json/wp/v2/{entrypoint}"
-    )
 
+    # Stream the records so we stop paging as soon as the concept has been found
     found = None
-    for item in data:
-        if item["id"] == int(id):
-            found = item
-            break
+    try:
+        for item in iter_word_press_data(f"{WORDPRESS_BASE_URL}/{entrypoint}"):
+            if item["id"] == int(id):
+                found = item
+                break
+    except requests.RequestException as e:
+        click.echo(f"❌ Error searching for concept {concept_id}: {e}", err=True)
 
     print(found)
 
@@ -129,12 +216,17 @@ def transform_single_case(case_id: str):
         )
         concepts.update(transformed_concepts_data)
 
+    # Only the side tables the case type reads are loaded and indexed
     if entrypoint == "non_us_case":
-        entrypoint_json = load_json_data(entrypoint)
-
-        mapped_jurisdictions = map_global_jurisdictions(load_json_data("jurisdiction"))
+        index = LitigationIndex.from_records(
+            cases=load_json_data(entrypoint),
+            jurisdictions=load_json_data("jurisdiction"),
+        )
+        case = index.cases[int(id)]
+        mapped_jurisdictions = map_global_jurisdictions(
+            list(index.jurisdictions.values())
+        )
 
-        case = next(case for case in entrypoint_json if case["id"] == int(id))
         processed_case = process_global_case_data(
             family_data=case,
             geographies=get_jurisdiction_iso_codes(
@@ -147,16 +239,16 @@ def transform_single_case(case_id: str):
         print(json.dumps(processed_case, indent=2))
 
     if entrypoint == "case":
-        entrypoint_json = load_json_data(entrypoint)
-
         case_bundles = load_json_data("case_bundle")
-
-        case = next(case for case in entrypoint_json if case["id"] == int(id))
+        index = LitigationIndex.from_records(
+            bundles=case_bundles, cases=load_json_data(entrypoint)
+        )
+        case = index.cases[int(id)]
         processed_case = process_us_case_data(
             family_data=case,
             case_id=int(id),
             context=LitigationContext(
-                failures=[],
+                failures=FailureLog(),
                 debug=True,
                 get_modified_data=False,
                 last_import_date=datetime.strptime(
@@ -168,20 +260,44 @@ def transform_single_case(case_id: str):
                     }
                     for case_bundle in case_bundles
                 },
-                skipped_families=[],
-                skipped_documents=[],
+                skipped_families=SkipIndex(),
+                skipped_documents=SkipIndex(),
             ),
             concepts=concepts,
-            collections=case_bundles,
+            collections=index,
         )
 
         print(json.dumps(processed_case, indent=2))
 
 
+def create_context(
+    debug: bool, get_modified_data: bool, last_import_date: datetime | None = None
+) -> LitigationContext:
+    """Create the context of a litigation project import.
+
+    :param bool debug: Whether debug mode is on.
+    :param bool get_modified_data: Whether to map only recently modified data.
+    :param datetime | None last_import_date: Only data modified after this date is
+        mapped when `get_modified_data` is set, defaults to the start of the update window.
+    :return LitigationContext: The context, with nothing mapped yet.
+    """
+    return LitigationContext(
+        failures=FailureLog(),
+        debug=debug,
+        get_modified_data=get_modified_data,
+        last_import_date=last_import_date or datetime.now() - UPDATE_WINDOW,
+        case_bundles={},
+        skipped_families=SkipIndex(),
+        skipped_documents=SkipIndex(),
+    )
+
+
 def wrangle_data(
     data: LitigationType,
     debug: bool,
     get_modified_data: bool,
+    last_import_date: datetime | None = None,
+    workers: int = 1,
 ) -> Tuple[dict[str, list[dict[str, Any]]], List[Failure]]:
     """Put the mapped Litigation data into a dictionary ready for dumping.
 
@@ -191,36 +307,27 @@ def wrangle_data(
     :param dict[str, list[dict]] data: The litigation data.
     :param bool debug: Whether debug mode is on.
     :param bool get_modified_data: Whether to map all available litigation data.
+    :param datetime | None last_import_date: Only data modified after this date is
+        mapped when `get_modified_data` is set, defaults to the start of the update window.
+    :param int workers: The number of worker processes to map the cases with, the
+        output being the same however many there are.
     :return Tuple[dict[str, list[dict[str, Any]]], List[Failure]]: The Litigation data
         mapped to the Document-Family-Collection-Event entity it corresponds to as well as
         a list of ids of data that was skipped with associated errors.
     """
-    context = LitigationContext(
-        failures=[],
-        debug=debug,
-        get_modified_data=get_modified_data,
-        last_import_date=datetime.now() - timedelta(hours=48),
-        case_bundles={},
-        skipped_families=[],
-        skipped_documents=[],
-    )
-
-    return (
-        {
-            "collections": map_collections(data["collections"], context),
-            "families": map_families(
-                families_data=data["families"],
-                concepts=data["concepts"],
-                collections=data["collections"],
-                context=context,
-            ),
-            "documents": map_documents(
-                {"documents": data["documents"], "families": data["families"]}, context
-            ),
-            "events": map_events(data["families"], context),
-        },
-        context.failures,
-    )
+    context = create_context(debug, get_modified_data, last_import_date)
+    index = LitigationIndex.build(data)
+
+    # Collections are mapped first, as they fill in the case bundles of the context
+    collections = map_collections(data["collections"], context)
+    if workers > 1:
+        cases = map_cases_in_shards(data, context, workers, index)
+    else:
+        cases = map_cases(data, context, index)
+    mapped_data = ({"collections": collections, **cases}, list(context.failures))
+
+    log_negative_cache_stats()
+    return mapped_data
 
 
 def dump_output(
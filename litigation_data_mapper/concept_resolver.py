@@ -0,0 +1,156 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+from litigation_data_mapper.extract_concepts import Concept, fetch_individual_concept
+
+ConceptFetcher = Callable[[int, str, dict[int, Concept]], Concept | None]
+
+
+def skip_concept_fetch(
+    concept_id: int, taxonomy: str, concepts: dict[int, Concept]
+) -> Concept | None:
+    """A concept fetcher that fetches nothing, for lookup tables that are complete.
+
+    A snapshot of the taxonomies is all there is to resolve its cases against, so a
+    concept missing from it is left unresolved rather than fetched from WordPress.
+
+    :param int concept_id: The id of the concept.
+    :param str taxonomy: The taxonomy the concept belongs to.
+    :param dict[int, Concept] concepts: The lookup table of concepts.
+    :return Concept | None: Always None.
+    """
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class ConceptResolverStats:
+    hits: int
+    misses: int
+    refetches: int
+    coalesced: int
+
+
+class ConceptResolver:
+    """Resolves concept ids to concepts, refetching those missing from the lookup table.
+
+    The resolver wraps the caller's lookup table rather than copying it, and guards it
+    with a lock so it can be shared by threads and asyncio tasks mapping families at
+    the same time. Concurrent lookups of the same missing concept are coalesced into a
+    single fetch, which every caller waits on. Concepts that are refetched successfully
+    are added to the table.
+    """
+
+    def __init__(
+        self,
+        concepts: dict[int, Concept] | None = None,
+        fetch: ConceptFetcher = fetch_individual_concept,
+    ):
+        self._concepts = concepts if concepts is not None else {}
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        self._in_flight: dict[int, Future[Concept | None]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._refetches = 0
+        self._coalesced = 0
+
+    def get(self, concept_id: int) -> Concept | None:
+        """Look up a concept in the table without counting or refetching it.
+
+        :param int concept_id: The id of the concept.
+        :return Concept | None: The concept, or None if it is not in the table.
+        """
+        return self._concepts.get(concept_id)
+
+    def lookup(self, concept_id: int) -> Concept | None:
+        """Look up a concept in the table, counting a hit or miss.
+
+        :param int concept_id: The id of the concept.
+        :return Concept | None: The concept, or None if it is not in the table.
+        """
+        with self._lock:
+            concept = self._concepts.get(concept_id)
+            if concept is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return concept
+
+    def refetch(self, concept_id: int, taxonomy: str) -> Concept | None:
+        """Fetch a concept missing from the table, sharing any fetch already in flight.
+
+        :param int concept_id: The id of the concept.
+        :param str taxonomy: The taxonomy the concept belongs to.
+        :return Concept | None: The concept, or None if it could not be found.
+        """
+        with self._lock:
+            concept = self._concepts.get(concept_id)
+            if concept is not None:
+                return concept
+
+            future = self._in_flight.get(concept_id)
+            if future is not None:
+                self._coalesced += 1
+                owner = False
+            else:
+                future = Future()
+                self._in_flight[concept_id] = future
+                self._refetches += 1
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            concept = self._fetch(concept_id, taxonomy, self._concepts)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[concept_id]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            if concept is not None:
+                self._concepts[concept_id] = concept
+            del self._in_flight[concept_id]
+        future.set_result(concept)
+        return concept
+
+    def resolve(self, concept_id: int, taxonomy: str) -> Concept | None:
+        """Look up a concept, refetching it if it is missing from the table.
+
+        :param int concept_id: The id of the concept.
+        :param str taxonomy: The taxonomy the concept belongs to.
+        :return Concept | None: The concept, or None if it could not be found.
+        """
+        return self.lookup(concept_id) or self.refetch(concept_id, taxonomy)
+
+    async def resolve_async(self, concept_id: int, taxonomy: str) -> Concept | None:
+        """Look up a concept from an asyncio task, refetching it in a worker thread.
+
+        :param int concept_id: The id of the concept.
+        :param str taxonomy: The taxonomy the concept belongs to.
+        :return Concept | None: The concept, or None if it could not be found.
+        """
+        return await asyncio.to_thread(self.resolve, concept_id, taxonomy)
+
+    def __getstate__(self) -> dict:
+        # A resolver sent to another process takes its table and fetcher, with a lock
+        # of its own and nothing in flight
+        with self._lock:
+            return {"concepts": dict(self._concepts), "fetch": self._fetch}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["concepts"], state["fetch"])
+
+    def stats(self) -> ConceptResolverStats:
+        with self._lock:
+            return ConceptResolverStats(
+                hits=self._hits,
+                misses=self._misses,
+                refetches=self._refetches,
+                coalesced=self._coalesced,
+            )
@@ -0,0 +1,373 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Collection, Iterator, Mapping
+from datetime import datetime
+from typing import Any, Protocol
+
+import boto3
+import click
+from mypy_boto3_s3.client import S3Client
+
+from litigation_data_mapper.checkpoints import CheckpointStore
+from litigation_data_mapper.concept_resolver import ConceptResolver, skip_concept_fetch
+from litigation_data_mapper.extract_concepts import (
+    Concept,
+    extract_concepts,
+    prefetch_concepts,
+    transform_wordpress_concepts_data,
+)
+from litigation_data_mapper.extract_concepts import taxonomies as concept_taxonomies
+from litigation_data_mapper.fetch_litigation_data import (
+    ENDPOINT_FIELDS,
+    ENDPOINTS,
+    MODIFIED_ENDPOINTS,
+    PAGE_WORKERS,
+    LitigationType,
+    fetch_litigation_data,
+    find_referenced_media_ids,
+)
+from litigation_data_mapper.retry_policy import WORDPRESS_RUN_BUDGET_SECONDS, Deadline
+from litigation_data_mapper.schemas import get_record_decoder
+from litigation_data_mapper.wordpress import (
+    fetch_word_press_resources,
+    iter_word_press_data,
+)
+from litigation_data_mapper.wordpress_paging import is_modified_after
+
+# Where `fetch_and_write_all_wordpress_data` writes each endpoint
+DEFAULT_SNAPSHOT_DIR = "./build/wordpress"
+
+# The names of the data sources that can be chosen from the command line
+DATA_SOURCES = ["api", "s3", "local"]
+
+# The snapshot endpoint each of the `ENDPOINTS` is written to
+SNAPSHOT_ENDPOINTS = {
+    "case_bundles": "case_bundle",
+    "document_media": "media",
+    "global_cases": "non_us_case",
+    "jurisdictions": "jurisdiction",
+    "us_cases": "case",
+}
+
+
+class LitigationDataSource(Protocol):
+    """Somewhere to load the litigation data to map from.
+
+    The data can be loaded all at once with `load`, or streamed a record at a time by
+    the other methods.
+    """
+
+    def load(
+        self, modified_after: datetime | None = None, selective_media: bool = False
+    ) -> LitigationType: ...
+
+    def iter_records(
+        self, name: str, modified_after: datetime | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Stream the records of one of the `ENDPOINTS`.
+
+        :param str name: The name of the endpoint in `ENDPOINTS`.
+        :param datetime | None modified_after: Only stream cases modified after this
+            time.
+        :return Iterator[dict[str, Any]]: The records.
+        """
+        ...
+
+    def iter_media(
+        self, media_ids: Collection[int] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Stream the document media.
+
+        :param Collection[int] | None media_ids: Only stream the media with these ids,
+            defaults to the whole media library.
+        :return Iterator[dict[str, Any]]: The media records.
+        """
+        ...
+
+    def load_concepts(
+        self, concept_ids: Mapping[str, Collection[int]]
+    ) -> dict[int, Concept] | ConceptResolver:
+        """Load the concepts lookup table.
+
+        :param Mapping[str, Collection[int]] concept_ids: The ids of the concepts the
+            cases and case bundles refer to, by taxonomy.
+        :return dict[int, Concept] | ConceptResolver: The concepts by id, or a
+            resolver of them when concepts missing from the table must not be fetched
+            while mapping.
+        """
+        ...
+
+
+class WordPressApiSource:
+    """Fetches the litigation data from the live WordPress API."""
+
+    def __init__(
+        self,
+        checkpoints: CheckpointStore | None = None,
+        deadline: Deadline | None = None,
+    ):
+        self.checkpoints = checkpoints
+        self.deadline = deadline
+
+    def load(
+        self, modified_after: datetime | None = None, selective_media: bool = False
+    ) -> LitigationType:
+        return fetch_litigation_data(
+            modified_after=modified_after,
+            checkpoints=self.checkpoints,
+            deadline=self.deadline,
+            selective_media=selective_media,
+        )
+
+    def _get_deadline(self) -> Deadline:
+        # A stream is read one endpoint after another, all within the same budget
+        if self.deadline is None:
+            self.deadline = Deadline.after(WORDPRESS_RUN_BUDGET_SECONDS)
+        return self.deadline
+
+    def iter_records(
+        self, name: str, modified_after: datetime | None = None
+    ) -> Iterator[dict[str, Any]]:
+        return iter_word_press_data(
+            ENDPOINTS[name],
+            max_workers=PAGE_WORKERS,
+            fields=ENDPOINT_FIELDS[name],
+            modified_after=modified_after if name in MODIFIED_ENDPOINTS else None,
+            checkpoints=self.checkpoints,
+            deadline=self._get_deadline(),
+            decoder=get_record_decoder(ENDPOINTS[name]),
+        )
+
+    def iter_media(
+        self, media_ids: Collection[int] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        if media_ids is None:
+            return self.iter_records("document_media")
+
+        click.echo(
+            f"⏳ Fetching the {len(media_ids)} media files referred to by cases..."
+        )
+        media = fetch_word_press_resources(
+            ENDPOINTS["document_media"],
+            media_ids,
+            fields=ENDPOINT_FIELDS["document_media"],
+            deadline=self._get_deadline(),
+            decoder=get_record_decoder(ENDPOINTS["document_media"]),
+        )
+        return iter(media.values())
+
+    def load_concepts(
+        self, concept_ids: Mapping[str, Collection[int]]
+    ) -> dict[int, Concept]:
+        deadline = self._get_deadline()
+        concepts = extract_concepts(deadline=deadline)
+        concepts.update(prefetch_concepts(concept_ids, concepts, deadline=deadline))
+        return concepts
+
+
+class SnapshotSource(ABC):
+    """Loads the litigation data from a snapshot of every WordPress endpoint."""
+
+    @abstractmethod
+    def read_endpoint(self, endpoint: str) -> list[dict[str, Any]]:
+        """Read the records of an endpoint from the snapshot.
+
+        :param str endpoint: The name of the WordPress endpoint, as in
+            `SNAPSHOT_ENDPOINTS`.
+        :return list[dict[str, Any]]: The records.
+        """
+
+    def iter_records(
+        self, name: str, modified_after: datetime | None = None
+    ) -> Iterator[dict[str, Any]]:
+        # Snapshots are read one endpoint at a time, so only one is held in memory
+        for record in self.read_endpoint(SNAPSHOT_ENDPOINTS[name]):
+            if (
+                modified_after is None
+                or name not in MODIFIED_ENDPOINTS
+                or is_modified_after(record, modified_after)
+            ):
+                yield record
+
+    def iter_media(
+        self, media_ids: Collection[int] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        for media in self.iter_records("document_media"):
+            if media_ids is None or media.get("id") in media_ids:
+                yield media
+
+    def load_concepts(
+        self, concept_ids: Mapping[str, Collection[int]]
+    ) -> ConceptResolver:
+        return load_snapshot_concepts(self.read_endpoint)
+
+
+class LocalSnapshotSource(SnapshotSource):
+    """Loads the litigation data from a directory of WordPress endpoint JSON files.
+
+    The directory holds one `<endpoint>.json` file per endpoint, as written by
+    `fetch_and_write_all_wordpress_data`.
+    """
+
+    def __init__(self, directory: str = DEFAULT_SNAPSHOT_DIR):
+        self.directory = directory
+
+    def read_endpoint(self, endpoint: str) -> list[dict[str, Any]]:
+        path = os.path.join(self.directory, f"{endpoint}.json")
+        with open(path, "rb") as f:
+            return decode_snapshot(endpoint, f.read(), path)
+
+    def load(
+        self, modified_after: datetime | None = None, selective_media: bool = False
+    ) -> LitigationType:
+        click.echo(f"⏳ Loading litigation data from {self.directory}...")
+        return load_litigation_snapshot(
+            self.read_endpoint, modified_after, selective_media
+        )
+
+
+class S3SnapshotSource(SnapshotSource):
+    """Loads the litigation data from the WordPress endpoints synced to the S3 cache.
+
+    The bucket holds one `<prefix>/<endpoint>.json` object per endpoint, as written by
+    `sync_wordpress_to_s3`.
+    """
+
+    def __init__(
+        self,
+        client: S3Client,
+        bucket: str = "cpr-cache",
+        prefix: str = "litigation/wordpress",
+    ):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def read_endpoint(self, endpoint: str) -> list[dict[str, Any]]:
+        key = f"{self.prefix}/{endpoint}.json"
+        s3_object = self.client.get_object(Bucket=self.bucket, Key=key)
+        return decode_snapshot(
+            endpoint, s3_object["Body"].read(), f"s3://{self.bucket}/{key}"
+        )
+
+    def load(
+        self, modified_after: datetime | None = None, selective_media: bool = False
+    ) -> LitigationType:
+        click.echo(
+            f"⏳ Loading litigation data from s3://{self.bucket}/{self.prefix}..."
+        )
+        return load_litigation_snapshot(
+            self.read_endpoint, modified_after, selective_media
+        )
+
+
+def decode_snapshot(endpoint: str, payload: bytes, source: str) -> list[dict[str, Any]]:
+    """Decode the records of an endpoint in a snapshot.
+
+    Snapshots hold every field of every record, so when typed decoding is enabled only
+    the fields the parsers read are kept.
+
+    :param str endpoint: The name of the endpoint.
+    :param bytes payload: The JSON payload of the snapshot.
+    :param str source: Where the payload came from.
+    :return list[dict[str, Any]]: The records.
+    """
+    decoder = get_record_decoder(endpoint)
+    if decoder:
+        return decoder.decode_page(payload, source)
+    return json.loads(payload)
+
+
+def load_litigation_snapshot(
+    read_endpoint: Callable[[str], list[dict[str, Any]]],
+    modified_after: datetime | None = None,
+    selective_media: bool = False,
+) -> LitigationType:
+    """Build the litigation data from a snapshot of every WordPress endpoint.
+
+    The snapshot is filtered the way `fetch_litigation_data` filters what it fetches,
+    so mapping a snapshot gives the same output as mapping a fetch made when the
+    snapshot was taken. Concepts missing from the snapshot's taxonomies are left
+    unresolved, so mapping a snapshot never calls WordPress.
+
+    :param Callable[[str], list[dict[str, Any]]] read_endpoint: Reads the records of
+        an endpoint from the snapshot, given the endpoint's name.
+    :param datetime | None modified_after: Only keep cases modified after this time.
+    :param bool selective_media: Whether to only keep the media files referred to by
+        the cases.
+    :return LitigationType: The litigation data.
+    """
+    us_cases = read_endpoint("case")
+    global_cases = read_endpoint("non_us_case")
+    if modified_after is not None:
+        us_cases = [c for c in us_cases if is_modified_after(c, modified_after)]
+        global_cases = [c for c in global_cases if is_modified_after(c, modified_after)]
+
+    document_media = read_endpoint("media")
+    if selective_media:
+        media_ids = set(find_referenced_media_ids([*us_cases, *global_cases]))
+        document_media = [media for media in document_media if media["id"] in media_ids]
+
+    litigation_data: LitigationType = {
+        "collections": read_endpoint("case_bundle"),
+        "families": {
+            "us_cases": us_cases,
+            "global_cases": global_cases,
+            "jurisdictions": read_endpoint("jurisdiction"),
+        },
+        "documents": document_media,
+        "concepts": load_snapshot_concepts(read_endpoint),
+    }
+
+    click.echo("✅ Completed loading litigation data.")
+    return litigation_data
+
+
+def load_snapshot_concepts(
+    read_endpoint: Callable[[str], list[dict[str, Any]]],
+) -> ConceptResolver:
+    """Build the concepts lookup table from the taxonomies in a snapshot.
+
+    The snapshot is all the concepts are resolved against: a concept missing from its
+    taxonomies is not fetched from WordPress while mapping.
+
+    :param Callable[[str], list[dict[str, Any]]] read_endpoint: Reads the records of
+        an endpoint from the snapshot, given the endpoint's name.
+    :return ConceptResolver: A resolver of the concepts in the snapshot.
+    """
+    # Merged in the same order as `extract_concepts`, so a term id found in two
+    # taxonomies resolves the same way
+    concepts: dict[int, Concept] = {}
+    for taxonomy in concept_taxonomies:
+        concepts.update(
+            transform_wordpress_concepts_data(
+                data=read_endpoint(taxonomy), taxonomy=taxonomy
+            )
+        )
+    return ConceptResolver(concepts, fetch=skip_concept_fetch)
+
+
+def get_data_source(
+    source: str,
+    snapshot_dir: str = DEFAULT_SNAPSHOT_DIR,
+    checkpoints: CheckpointStore | None = None,
+) -> LitigationDataSource:
+    """Create the data source with the given name.
+
+    :param str source: One of `DATA_SOURCES`: "api" for the live WordPress API, "s3"
+        for the S3 cache synced by `sync_wordpress_to_s3`, or "local" for a directory
+        written by `fetch_and_write_all_wordpress_data`.
+    :param str snapshot_dir: The directory the "local" source loads from.
+    :param CheckpointStore | None checkpoints: Where the "api" source checkpoints the
+        pages it fetches.
+    :raise ValueError: If there is no data source with the given name.
+    :return LitigationDataSource: The data source.
+    """
+    if source == "api":
+        return WordPressApiSource(checkpoints=checkpoints)
+    if source == "s3":
+        return S3SnapshotSource(boto3.client("s3", region_name="eu-west-1"))
+    if source == "local":
+        return LocalSnapshotSource(snapshot_dir)
+    raise ValueError(f"Unknown litigation data source: {source}")
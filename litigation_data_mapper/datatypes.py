@@ -1,5 +1,7 @@
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from datetime import datetime
+from typing import overload
 
 from pydantic import SecretStr
 
@@ -11,15 +13,135 @@ class Failure:
     reason: str
 
 
+class SkipIndex(Sequence[int]):
+    """The ids skipped while mapping, in the order they were skipped.
+
+    Whether an id was skipped is looked up in a set, while the ordered view keeps
+    every skip, including repeats, for the error log.
+    """
+
+    __slots__ = ("_order", "_ids")
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self._order: list[int] = []
+        self._ids: set[int] = set()
+        self.extend(ids)
+
+    def append(self, id: int) -> None:
+        self._order.append(id)
+        self._ids.add(id)
+
+    def extend(self, ids: Iterable[int]) -> None:
+        for id in ids:
+            self.append(id)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._ids
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[int]: ...
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        return self._order[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (SkipIndex, list)):
+            return self._order == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SkipIndex({self._order!r})"
+
+
+class FailureLog(Sequence[Failure]):
+    """The failures recorded while mapping, in order and bucketed by type."""
+
+    __slots__ = ("_order", "_by_type")
+
+    def __init__(self, failures: Iterable[Failure] = ()):
+        self._order: list[Failure] = []
+        self._by_type: dict[str, list[Failure]] = {}
+        self.extend(failures)
+
+    def append(self, failure: Failure) -> None:
+        self._order.append(failure)
+        self._by_type.setdefault(failure.type, []).append(failure)
+
+    def extend(self, failures: Iterable[Failure]) -> None:
+        for failure in failures:
+            self.append(failure)
+
+    def of_type(self, type: str) -> list[Failure]:
+        """The failures of the given type, such as "document" or "us_case"."""
+        return list(self._by_type.get(type, []))
+
+    def counts(self) -> dict[str, int]:
+        """The number of failures of each type, in the order the types first failed."""
+        return {type: len(failures) for type, failures in self._by_type.items()}
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @overload
+    def __getitem__(self, index: int) -> Failure: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Failure]: ...
+
+    def __getitem__(self, index: int | slice) -> Failure | list[Failure]:
+        return self._order[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (FailureLog, list)):
+            return self._order == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"FailureLog({self._order!r})"
+
+
 @dataclass(frozen=True, slots=True)
 class LitigationContext:
-    failures: list[Failure]
+    failures: FailureLog
     debug: bool
     last_import_date: datetime
     get_modified_data: bool
     case_bundles: dict[int, dict[str, str]]
-    skipped_families: list[int]
-    skipped_documents: list[int]
+    skipped_families: SkipIndex
+    skipped_documents: SkipIndex
+
+    def __post_init__(self):
+        # Plain lists are indexed, so contexts can still be created from them
+        if not isinstance(self.failures, FailureLog):
+            object.__setattr__(self, "failures", FailureLog(self.failures))
+        for name in ("skipped_families", "skipped_documents"):
+            if not isinstance(getattr(self, name), SkipIndex):
+                object.__setattr__(self, name, SkipIndex(getattr(self, name)))
+
+    def merge(self, other: "LitigationContext") -> None:
+        """Add what another context recorded after what this context recorded.
+
+        This combines the contexts of mapping separate parts of the litigation data,
+        for example in separate workers, in the order the parts would be mapped in.
+
+        :param LitigationContext other: The context to merge into this one.
+        """
+        self.failures.extend(other.failures)
+        self.skipped_families.extend(other.skipped_families)
+        self.skipped_documents.extend(other.skipped_documents)
+        self.case_bundles.update(other.case_bundles)
 
 
 @dataclass(frozen=True, slots=True)
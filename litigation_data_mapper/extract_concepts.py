@@ -1,18 +1,24 @@
 import html
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Any, Literal, NamedTuple, cast
 
 import click
 
+from litigation_data_mapper.negative_cache import get_negative_cache
+from litigation_data_mapper.retry_policy import Deadline
+from litigation_data_mapper.schemas import get_record_decoder
 from litigation_data_mapper.wordpress import (
-    fetch_individual_wordpress_resource,
+    WORDPRESS_BASE_URL,
     fetch_word_press_data,
+    fetch_word_press_resources,
 )
 
 US_ROOT_PRINCIPAL_LAW_ID = -1  # Internal ID for the synthetic US principal law concept
 US_ROOT_JURISDICTION_ID = -2  # Internal ID for the synthetic US jurisdiction concept
 
-wordpress_base_url = "https://admin.climatecasechart.com/wp-json/wp/v2"
+wordpress_base_url = WORDPRESS_BASE_URL
 taxonomies = [
     # USA
     "case_category",
@@ -24,6 +30,12 @@ taxonomies = [
     "non_us_case_category",
 ]
 
+# The only fields of a taxonomy term read when mapping it to a concept
+TAXONOMY_FIELDS = ["id", "name", "parent"]
+
+# Number of taxonomies fetched in parallel, each is only a page or two
+TAXONOMY_WORKERS = 3
+
 
 class ConceptType(str, Enum):
     Law = "law"
@@ -211,37 +223,216 @@ def transform_wordpress_concepts_data(data: list[dict[str, Any]], taxonomy: str)
     return concepts_with_synthetic_us_principal_law_and_jurisdiction
 
 
-def extract_concepts() -> dict[int, Concept]:
+def extract_concepts(
+    deadline: Deadline | None = None, max_workers: int = TAXONOMY_WORKERS
+) -> dict[int, Concept]:
     all_concepts: dict[int, Concept] = {}
 
+    # The taxonomies are fetched in parallel but merged in order, so a term id found in
+    # two taxonomies resolves the same way as when they were fetched one at a time
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                fetch_word_press_data,
+                f"{wordpress_base_url}/{taxonomy}",
+                fields=TAXONOMY_FIELDS,
+                deadline=deadline,
+                decoder=get_record_decoder(taxonomy),
+            )
+            for taxonomy in taxonomies
+        ]
+
     # create a lookup table of ConceptWithParentId
-    for taxonomy in taxonomies:
-        data = fetch_word_press_data(f"{wordpress_base_url}/{taxonomy}")
-        parsed_data = transform_wordpress_concepts_data(data=data, taxonomy=taxonomy)
+    for taxonomy, future in zip(taxonomies, futures, strict=True):
+        parsed_data = transform_wordpress_concepts_data(
+            data=future.result(), taxonomy=taxonomy
+        )
         all_concepts.update(parsed_data)
 
     return all_concepts
 
 
+def find_missing_concept_ids(
+    records: Iterable[dict[str, Any]], concepts: dict[int, Concept]
+) -> dict[str, set[int]]:
+    """Find the concepts referenced by cases or case bundles missing from the lookup table.
+
+    :param Iterable[dict[str, Any]] records: The cases and case bundles.
+    :param dict[int, Concept] concepts: The lookup table of concepts.
+    :return dict[str, set[int]]: The missing concept ids by taxonomy.
+    """
+    missing_concept_ids: dict[str, set[int]] = {}
+    for record in records:
+        for taxonomy in taxonomies:
+            for concept_id in record.get(taxonomy) or []:
+                if concept_id not in concepts:
+                    missing_concept_ids.setdefault(taxonomy, set()).add(concept_id)
+    return missing_concept_ids
+
+
+def prefetch_missing_concepts(
+    records: Iterable[dict[str, Any]],
+    concepts: dict[int, Concept],
+    deadline: Deadline | None = None,
+    max_workers: int = TAXONOMY_WORKERS,
+) -> dict[int, Concept]:
+    """Fetch every concept referenced by the cases or case bundles but not yet known.
+
+    Doing this before mapping means the families can be mapped without stopping to
+    fetch concepts one at a time. The concepts of each taxonomy are fetched in batches,
+    with the taxonomies fetched in parallel.
+
+    :param Iterable[dict[str, Any]] records: The cases and case bundles.
+    :param dict[int, Concept] concepts: The lookup table of concepts.
+    :param Deadline | None deadline: When the concepts must have been fetched by.
+    :param int max_workers: Number of taxonomies to fetch in parallel.
+    :return dict[int, Concept]: The missing concepts that were found, by id.
+    """
+    return prefetch_concepts(
+        find_missing_concept_ids(records, concepts),
+        concepts,
+        deadline=deadline,
+        max_workers=max_workers,
+    )
+
+
+def prefetch_concepts(
+    concept_ids: Mapping[str, Iterable[int]],
+    concepts: dict[int, Concept],
+    deadline: Deadline | None = None,
+    max_workers: int = TAXONOMY_WORKERS,
+) -> dict[int, Concept]:
+    """Fetch the concepts with the given ids that are not yet known.
+
+    :param Mapping[str, Iterable[int]] concept_ids: The ids of the concepts to fetch,
+        by taxonomy.
+    :param dict[int, Concept] concepts: The lookup table of concepts.
+    :param Deadline | None deadline: When the concepts must have been fetched by.
+    :param int max_workers: Number of taxonomies to fetch in parallel.
+    :return dict[int, Concept]: The missing concepts that were found, by id.
+    """
+    missing_concept_ids: dict[str, set[int]] = {}
+    for taxonomy, ids in concept_ids.items():
+        missing = {concept_id for concept_id in ids if concept_id not in concepts}
+        if missing:
+            missing_concept_ids[taxonomy] = missing
+    if not missing_concept_ids:
+        return {}
+
+    click.echo(
+        f"🔄 Prefetching {sum(len(ids) for ids in missing_concept_ids.values())} "
+        f"missing concepts from {len(missing_concept_ids)} taxonomies..."
+    )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            taxonomy: executor.submit(
+                fetch_individual_concepts,
+                sorted(concept_ids),
+                taxonomy,
+                concepts,
+                deadline,
+            )
+            for taxonomy, concept_ids in missing_concept_ids.items()
+        }
+
+    fetched_concepts: dict[int, Concept] = {}
+    for taxonomy in taxonomies:
+        if taxonomy in futures:
+            fetched_concepts.update(futures[taxonomy].result())
+
+    click.echo(f"✅ Prefetched {len(fetched_concepts)} missing concepts.")
+    return fetched_concepts
+
+
 def fetch_individual_concept(
     concept_id: int,
     taxonomy: str,
     concepts: dict[int, Concept],
 ) -> Concept | None:
-    try:
-        data = fetch_individual_wordpress_resource(
-            f"{wordpress_base_url}/{taxonomy}/{concept_id}"
-        )
+    return fetch_individual_concepts([concept_id], taxonomy, concepts).get(concept_id)
+
 
-        if not data:
-            return None
+def fetch_individual_concepts(
+    concept_ids: Iterable[int],
+    taxonomy: str,
+    concepts: dict[int, Concept],
+    deadline: Deadline | None = None,
+) -> dict[int, Concept]:
+    """Fetch the concepts of a taxonomy missing from the concepts lookup table.
+
+    The concepts are fetched in batches with the WordPress `include` parameter, along
+    with any of their parents that are not in the lookup table either. Concepts found
+    not to exist are remembered in the negative cache and not requested again.
+
+    :param Iterable[int] concept_ids: The ids of the concepts to fetch.
+    :param str taxonomy: The taxonomy the concepts belong to.
+    :param dict[int, Concept] concepts: The lookup table of concepts already known,
+        used to label the parents of the fetched concepts.
+    :param Deadline | None deadline: When the concepts must have been fetched by.
+    :return dict[int, Concept]: The concepts found by id, ids that do not exist or
+        could not be fetched are left out.
+    """
+    endpoint = f"{wordpress_base_url}/{taxonomy}"
+    decoder = get_record_decoder(taxonomy)
+    negative_cache = get_negative_cache()
+    concept_ids = [
+        concept_id
+        for concept_id in dict.fromkeys(concept_ids)
+        if not negative_cache.is_unresolvable(taxonomy, concept_id)
+    ]
+    if not concept_ids:
+        return {}
 
-        click.echo(f"🔍 Found concept {concept_id} in taxonomy {taxonomy}")
+    try:
+        data = fetch_word_press_resources(
+            endpoint,
+            concept_ids,
+            fields=TAXONOMY_FIELDS,
+            deadline=deadline,
+            decoder=decoder,
+        )
+        # WordPress leaves the ids that do not exist out of the response, a request
+        # that failed outright raises instead and is not remembered
+        negative_cache.add(
+            taxonomy,
+            [concept_id for concept_id in concept_ids if concept_id not in data],
+        )
 
-        concept_with_parent_id = map_wordpress_data_to_concept_with_parent_id(
-            data, taxonomy
+        concepts_with_parent_id = {
+            concept_id: map_wordpress_data_to_concept_with_parent_id(item, taxonomy)
+            for concept_id, item in data.items()
+        }
+        for concept_id in concepts_with_parent_id:
+            click.echo(f"🔍 Found concept {concept_id} in taxonomy {taxonomy}")
+
+        missing_parent_ids = {
+            concept.subconcept_of_id
+            for concept in concepts_with_parent_id.values()
+            if concept.subconcept_of_id
+            and concept.subconcept_of_id not in concepts
+            and concept.subconcept_of_id not in data
+        }
+        parent_data = (
+            fetch_word_press_resources(
+                endpoint,
+                missing_parent_ids,
+                fields=TAXONOMY_FIELDS,
+                deadline=deadline,
+                decoder=decoder,
+            )
+            if missing_parent_ids
+            else {}
+        )
+        parent_data.update(data)
+    except Exception as e:
+        click.echo(
+            f"❌ Error fetching concepts {concept_ids} from taxonomy {taxonomy}: {str(e)}"
         )
+        return {}
 
+    fetched_concepts = {}
+    for concept_id, concept_with_parent_id in concepts_with_parent_id.items():
         parent_id = concept_with_parent_id.subconcept_of_id
         parent_labels = []
 
@@ -249,14 +440,10 @@ def fetch_individual_concept(
             parent_concept = concepts.get(parent_id)
             if parent_concept:
                 parent_labels = [parent_concept.preferred_label]
-            else:
-                parent_data = fetch_individual_wordpress_resource(
-                    f"{wordpress_base_url}/{taxonomy}/{parent_id}"
-                )
-                if parent_data:
-                    parent_labels = [parent_data["name"]]
-
-        concept = Concept(
+            elif parent_id in parent_data:
+                parent_labels = [parent_data[parent_id]["name"]]
+
+        fetched_concepts[concept_id] = Concept(
             internal_id=concept_with_parent_id.internal_id,
             id=concept_with_parent_id.id,
             type=concept_with_parent_id.type,
@@ -265,10 +452,4 @@ def fetch_individual_concept(
             relation=concept_with_parent_id.relation,
         )
 
-        return concept
-
-    except Exception as e:
-        click.echo(
-            f"❌ Error fetching concept {concept_id} from taxonomy {taxonomy}: {str(e)}"
-        )
-        return None
+    return fetched_concepts
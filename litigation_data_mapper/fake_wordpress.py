@@ -0,0 +1,533 @@
+import json
+import math
+import random
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import click
+
+from litigation_data_mapper.extract_concepts import taxonomies as concept_taxonomies
+
+# The path the REST API is served under, as on the live site
+API_PATH = "/wp-json/wp/v2"
+
+# WordPress answers 400 for a `per_page` above this
+MAX_PER_PAGE = 100
+DEFAULT_PER_PAGE = 10
+
+# Every generated record was last modified within this window before `MODIFIED_UNTIL`
+MODIFIED_UNTIL = datetime(2025, 6, 1)
+MODIFIED_WINDOW = timedelta(days=365)
+
+# Root jurisdictions are named after countries so they map to geographies
+JURISDICTION_COUNTRIES = [
+    "Australia",
+    "Brazil",
+    "Canada",
+    "Germany",
+    "India",
+    "Japan",
+    "South Africa",
+    "United Kingdom",
+]
+US_TAXONOMIES = ["case_category", "entity", "principal_law"]
+GLOBAL_TAXONOMIES = ["jurisdiction", "non_us_principal_law", "non_us_case_category"]
+US_STATES = ["CA", "NY", "TX", "WA", "MA", "FL"]
+DOCUMENT_TYPES = ["petition", "complaint", "motion", "order", "judgment"]
+
+
+@dataclass(frozen=True, slots=True)
+class FakeWordPressConfig:
+    """The size of the synthetic corpus and how badly the fake server behaves.
+
+    :param int us_cases: Number of `case` records.
+    :param int global_cases: Number of `non_us_case` records.
+    :param int case_bundles: Number of `case_bundle` records, US cases are spread
+        across them.
+    :param int documents_per_case: Number of documents on each case, each with its
+        own `media` record.
+    :param int unreferenced_media: Number of extra `media` records no case refers to,
+        like the images making up most of the live media library.
+    :param int terms_per_taxonomy: Number of terms in each taxonomy.
+    :param float latency: Seconds every request takes before it is answered.
+    :param float error_rate: Fraction of requests answered with a 502.
+    :param int rate_limit_every: Start a burst of 429 responses every this many
+        requests, 0 never throttles.
+    :param int rate_limit_burst: Number of consecutive requests answered with 429 in
+        each burst.
+    :param float retry_after: Seconds sent in the Retry-After header of a 429.
+    :param int seed: Seeds the generated records and the errors injected.
+    """
+
+    us_cases: int = 200
+    global_cases: int = 200
+    case_bundles: int = 50
+    documents_per_case: int = 3
+    unreferenced_media: int = 0
+    terms_per_taxonomy: int = 20
+    latency: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_every: int = 0
+    rate_limit_burst: int = 1
+    retry_after: float = 1.0
+    seed: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class FakeWordPressStats:
+    requests: int
+    rate_limited: int
+    errors: int
+
+
+def _modified_gmt(rng: random.Random) -> str:
+    modified = MODIFIED_UNTIL - MODIFIED_WINDOW * rng.random()
+    return modified.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def build_corpus(config: FakeWordPressConfig) -> dict[str, list[dict[str, Any]]]:
+    """Generate the records served for each post type and taxonomy.
+
+    The records have the shape of those on the live site, with every field the parsers
+    read, and refer to each other by id: cases to their bundles, documents and terms,
+    bundles to their cases. The same config always generates the same records.
+
+    :param FakeWordPressConfig config: The size of the corpus.
+    :return dict[str, list[dict[str, Any]]]: The records of each post type and
+        taxonomy, keyed by the name of its endpoint.
+    """
+    rng = random.Random(config.seed)
+    ids = iter(range(1, 2**31))
+    corpus: dict[str, list[dict[str, Any]]] = {}
+
+    for taxonomy in concept_taxonomies:
+        terms: list[dict[str, Any]] = []
+        for n in range(config.terms_per_taxonomy):
+            if taxonomy == "jurisdiction" and n < len(JURISDICTION_COUNTRIES):
+                parent, name = None, JURISDICTION_COUNTRIES[n]
+            elif taxonomy == "jurisdiction":
+                # The remaining jurisdictions are regions of the countries
+                parent = rng.choice(terms)
+                name = f"{parent['name']} region {n}"
+            else:
+                parent, name = None, f"{taxonomy} {n}"
+            terms.append(
+                {
+                    "id": next(ids),
+                    "name": name,
+                    "parent": parent["id"] if parent else 0,
+                    "slug": name.lower().replace(" ", "-"),
+                    "taxonomy": taxonomy,
+                }
+            )
+        corpus[taxonomy] = terms
+
+    def term_ids(taxonomy: str) -> list[int]:
+        terms = corpus[taxonomy]
+        if not terms:
+            return []
+        return [term["id"] for term in rng.sample(terms, min(len(terms), 2))]
+
+    bundle_ids = [next(ids) for _ in range(config.case_bundles)]
+    bundle_cases: dict[int, list[int]] = {bundle_id: [] for bundle_id in bundle_ids}
+    media: list[dict[str, Any]] = []
+
+    def document_file() -> int:
+        media_id = next(ids)
+        media.append(
+            {
+                "id": media_id,
+                "modified_gmt": _modified_gmt(rng),
+                "source_url": f"https://example.org/uploads/document-{media_id}.pdf",
+            }
+        )
+        return media_id
+
+    def filing_date() -> str:
+        filed = MODIFIED_UNTIL - MODIFIED_WINDOW * 10 * rng.random()
+        return filed.strftime("%Y%m%d")
+
+    us_cases = []
+    for n in range(config.us_cases):
+        case_id = next(ids)
+        bundle = [rng.choice(bundle_ids)] if bundle_ids else []
+        for bundle_id in bundle:
+            bundle_cases[bundle_id].append(case_id)
+        us_cases.append(
+            {
+                "id": case_id,
+                "type": "case",
+                "slug": f"us-case-{case_id}",
+                "modified_gmt": _modified_gmt(rng),
+                "title": {"rendered": f"US case {n}"},
+                **{taxonomy: term_ids(taxonomy) for taxonomy in US_TAXONOMIES},
+                "acf": {
+                    "ccl_case_bundle": bundle,
+                    "ccl_docket_number": f"1:{n:02d}-cv-{case_id:05d}",
+                    "ccl_entity": next(iter(term_ids("entity")), None),
+                    "ccl_filing_year_for_action": str(rng.randint(1990, 2025)),
+                    "ccl_state": rng.choice(US_STATES),
+                    "ccl_case_documents": [
+                        {
+                            "ccl_document_type": rng.choice(DOCUMENT_TYPES),
+                            "ccl_filing_date": filing_date(),
+                            "ccl_file": document_file(),
+                            "ccl_document_headline": f"US case {n} document {d}",
+                            "ccl_document_summary": f"Summary of document {d}",
+                            "ccl_outcome": "Pending",
+                        }
+                        for d in range(config.documents_per_case)
+                    ],
+                },
+            }
+        )
+
+    global_cases = []
+    for n in range(config.global_cases):
+        case_id = next(ids)
+        global_cases.append(
+            {
+                "id": case_id,
+                "type": "non_us_case",
+                "slug": f"non-us-case-{case_id}",
+                "modified_gmt": _modified_gmt(rng),
+                "title": {"rendered": f"Global case {n}"},
+                **{taxonomy: term_ids(taxonomy) for taxonomy in GLOBAL_TAXONOMIES},
+                "acf": {
+                    "ccl_nonus_case_name": f"Global case {n}",
+                    "ccl_nonus_summary": f"Summary of global case {n}",
+                    "ccl_nonus_reporter_info": f"{case_id}/{n}",
+                    "ccl_nonus_filing_year_for_action": str(rng.randint(1990, 2025)),
+                    "ccl_nonus_status": "Pending",
+                    "ccl_nonus_core_object": f"Core object of global case {n}",
+                    "ccl_nonus_case_documents": [
+                        {
+                            "ccl_nonus_document_type": rng.choice(DOCUMENT_TYPES),
+                            "ccl_nonus_filing_date": filing_date(),
+                            "ccl_nonus_file": document_file(),
+                            "ccl_nonus_document_summary": f"Summary of document {d}",
+                        }
+                        for d in range(config.documents_per_case)
+                    ],
+                },
+            }
+        )
+
+    case_bundles = [
+        {
+            "id": bundle_id,
+            "type": "case_bundle",
+            "slug": f"case-bundle-{bundle_id}",
+            "modified_gmt": _modified_gmt(rng),
+            "title": {"rendered": f"Case bundle {n}"},
+            **{taxonomy: term_ids(taxonomy) for taxonomy in US_TAXONOMIES},
+            "acf": {
+                "ccl_cases": bundle_cases[bundle_id],
+                "ccl_core_object": f"Core object of case bundle {n}",
+                "ccl_case_categories": [],
+                "ccl_principal_law": [],
+            },
+        }
+        for n, bundle_id in enumerate(bundle_ids)
+    ]
+
+    for _ in range(config.unreferenced_media):
+        media_id = next(ids)
+        media.append(
+            {
+                "id": media_id,
+                "modified_gmt": _modified_gmt(rng),
+                "source_url": f"https://example.org/uploads/image-{media_id}.jpg",
+            }
+        )
+
+    corpus.update(
+        {
+            "case": us_cases,
+            "non_us_case": global_cases,
+            "case_bundle": case_bundles,
+            "media": media,
+        }
+    )
+    return corpus
+
+
+class FakeWordPressServer(ThreadingHTTPServer):
+    """A local stand-in for the WordPress REST API serving a synthetic corpus.
+
+    Collections are paged as WordPress pages them, honouring `page`, `per_page`,
+    `orderby`, `order`, `include`, `modified_after` and `_fields`, and answer with the
+    `X-WP-Total` and `X-WP-TotalPages` headers. Single records are served from
+    `<endpoint>/<id>`. Every request is delayed by the configured latency, and may be
+    answered with a 429 burst or a 502 instead.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, config: FakeWordPressConfig, port: int = 0):
+        self.config = config
+        self.corpus = build_corpus(config)
+        self._records_by_id = {
+            endpoint: {record["id"]: record for record in records}
+            for endpoint, records in self.corpus.items()
+        }
+        self._lock = threading.Lock()
+        self._rng = random.Random(config.seed)
+        self._requests = 0
+        self._rate_limited = 0
+        self._errors = 0
+        self._throttle_remaining = 0
+        super().__init__(("127.0.0.1", port), _FakeWordPressHandler)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PATH}"
+
+    def stats(self) -> FakeWordPressStats:
+        with self._lock:
+            return FakeWordPressStats(
+                requests=self._requests,
+                rate_limited=self._rate_limited,
+                errors=self._errors,
+            )
+
+    def inject_fault(self) -> int | None:
+        """Count a request and decide whether it fails.
+
+        :return int | None: The status code to answer the request with instead of its
+            records, or None to answer it normally.
+        """
+        config = self.config
+        with self._lock:
+            self._requests += 1
+
+            if (
+                config.rate_limit_every
+                and self._requests % config.rate_limit_every == 0
+            ):
+                self._throttle_remaining = config.rate_limit_burst
+            if self._throttle_remaining > 0:
+                self._throttle_remaining -= 1
+                self._rate_limited += 1
+                return 429
+
+            if self._rng.random() < config.error_rate:
+                self._errors += 1
+                return 502
+
+        return None
+
+    def get_record(self, endpoint: str, record_id: int) -> dict[str, Any] | None:
+        return self._records_by_id.get(endpoint, {}).get(record_id)
+
+
+def _select_fields(record: dict[str, Any], fields: list[str] | None) -> dict[str, Any]:
+    if not fields:
+        return record
+    return {field: record[field] for field in fields if field in record}
+
+
+class _FakeWordPressHandler(BaseHTTPRequestHandler):
+    server: FakeWordPressServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Logging every request would slow down the benchmarks it is used for
+        pass
+
+    def _send_json(
+        self, status: int, body: Any, headers: dict[str, str] | None = None
+    ) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_error(self, status: int, code: str, message: str) -> None:
+        self._send_json(status, {"code": code, "message": message})
+
+    def do_GET(self) -> None:
+        server = self.server
+        if server.config.latency:
+            time.sleep(server.config.latency)
+
+        fault = server.inject_fault()
+        if fault == 429:
+            self._send_json(
+                429,
+                {"code": "too_many_requests", "message": "Too many requests"},
+                {"Retry-After": str(server.config.retry_after)},
+            )
+            return
+        if fault is not None:
+            self._send_error(fault, "bad_gateway", "Bad gateway")
+            return
+
+        url = urlsplit(self.path)
+        if not url.path.startswith(f"{API_PATH}/"):
+            self._send_error(404, "rest_no_route", "No route was found")
+            return
+
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        fields = params["_fields"].split(",") if params.get("_fields") else None
+        endpoint, _, record_id = url.path[len(API_PATH) + 1 :].partition("/")
+
+        if endpoint not in server.corpus:
+            self._send_error(404, "rest_no_route", "No route was found")
+        elif record_id:
+            self._get_record(endpoint, record_id, fields)
+        else:
+            self._get_collection(endpoint, params, fields)
+
+    def _get_record(
+        self, endpoint: str, record_id: str, fields: list[str] | None
+    ) -> None:
+        record = (
+            self.server.get_record(endpoint, int(record_id))
+            if record_id.isdigit()
+            else None
+        )
+        if record is None:
+            self._send_error(404, "rest_post_invalid_id", "Invalid post ID")
+            return
+        self._send_json(200, _select_fields(record, fields))
+
+    def _get_collection(
+        self, endpoint: str, params: dict[str, str], fields: list[str] | None
+    ) -> None:
+        try:
+            page = int(params.get("page", 1))
+            per_page = int(params.get("per_page", DEFAULT_PER_PAGE))
+        except ValueError:
+            self._send_error(400, "rest_invalid_param", "Invalid parameter(s)")
+            return
+        if page < 1 or not 1 <= per_page <= MAX_PER_PAGE:
+            self._send_error(400, "rest_invalid_param", "Invalid parameter(s)")
+            return
+
+        records = self.server.corpus[endpoint]
+        if params.get("include"):
+            include = {int(i) for i in params["include"].split(",") if i.isdigit()}
+            records = [record for record in records if record["id"] in include]
+        if params.get("modified_after"):
+            records = [
+                record
+                for record in records
+                if record.get("modified_gmt", "") > params["modified_after"]
+            ]
+
+        sort_key = "modified_gmt" if params.get("orderby") == "modified" else "id"
+        records = sorted(
+            records,
+            key=lambda record: record.get(sort_key, ""),
+            reverse=params.get("order", "desc") == "desc",
+        )
+
+        total = len(records)
+        total_pages = math.ceil(total / per_page)
+        if page > max(total_pages, 1):
+            self._send_error(
+                400,
+                "rest_post_invalid_page_number",
+                "The page number requested is larger than the number of pages "
+                "available.",
+            )
+            return
+
+        start = (page - 1) * per_page
+        self._send_json(
+            200,
+            [
+                _select_fields(record, fields)
+                for record in records[start : start + per_page]
+            ],
+            {"X-WP-Total": str(total), "X-WP-TotalPages": str(total_pages)},
+        )
+
+
+@contextmanager
+def run_fake_wordpress(
+    config: FakeWordPressConfig | None = None, port: int = 0
+) -> Iterator[FakeWordPressServer]:
+    """Serve a fake WordPress REST API from a background thread.
+
+    :param FakeWordPressConfig | None config: The corpus to serve and how the server
+        behaves, defaults to a well-behaved server with the default corpus.
+    :param int port: The port to listen on, defaults to any free port.
+    :return Iterator[FakeWordPressServer]: The running server, fetch from its
+        `base_url` in place of `WORDPRESS_BASE_URL`.
+    """
+    server = FakeWordPressServer(config or FakeWordPressConfig(), port=port)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+@click.command()
+@click.option("--port", default=8080, help="The port to listen on.")
+@click.option("--us-cases", default=FakeWordPressConfig.us_cases)
+@click.option("--global-cases", default=FakeWordPressConfig.global_cases)
+@click.option("--case-bundles", default=FakeWordPressConfig.case_bundles)
+@click.option("--documents-per-case", default=FakeWordPressConfig.documents_per_case)
+@click.option("--unreferenced-media", default=FakeWordPressConfig.unreferenced_media)
+@click.option("--terms-per-taxonomy", default=FakeWordPressConfig.terms_per_taxonomy)
+@click.option(
+    "--latency",
+    default=FakeWordPressConfig.latency,
+    help="Seconds every request takes.",
+)
+@click.option(
+    "--error-rate",
+    default=FakeWordPressConfig.error_rate,
+    help="Fraction of requests answered with a 502.",
+)
+@click.option(
+    "--rate-limit-every",
+    default=FakeWordPressConfig.rate_limit_every,
+    help="Start a burst of 429 responses every this many requests.",
+)
+@click.option(
+    "--rate-limit-burst",
+    default=FakeWordPressConfig.rate_limit_burst,
+    help="Number of requests answered with 429 in each burst.",
+)
+@click.option("--retry-after", default=FakeWordPressConfig.retry_after)
+@click.option("--seed", default=FakeWordPressConfig.seed)
+def serve_fake_wordpress(port: int, **options: Any):
+    """Serve a synthetic WordPress REST API locally until interrupted.
+
+    Point the mapper at it by setting `WORDPRESS_BASE_URL` to the URL it prints.
+    """
+    server = FakeWordPressServer(FakeWordPressConfig(**options), port=port)
+    click.echo(f"🚀 Serving fake WordPress at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        stats = server.stats()
+        click.echo(
+            f"📝 Served {stats.requests} requests, {stats.rate_limited} rate limited "
+            f"and {stats.errors} failed."
+        )
+
+
+if __name__ == "__main__":
+    serve_fake_wordpress()
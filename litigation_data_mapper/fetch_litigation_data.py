@@ -1,16 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Any, TypedDict
 
 import click
+import requests
 
-from litigation_data_mapper.extract_concepts import Concept, extract_concepts
-from litigation_data_mapper.wordpress import fetch_word_press_data
+from litigation_data_mapper.checkpoints import CheckpointStore
+from litigation_data_mapper.concept_resolver import ConceptResolver
+from litigation_data_mapper.extract_concepts import (
+    Concept,
+    extract_concepts,
+    prefetch_missing_concepts,
+)
+from litigation_data_mapper.extract_concepts import taxonomies as concept_taxonomies
+from litigation_data_mapper.retry_policy import (
+    WORDPRESS_RUN_BUDGET_SECONDS,
+    Deadline,
+    log_retry_stats,
+    reset_retry_stats,
+)
+from litigation_data_mapper.schemas import get_record_decoder
+from litigation_data_mapper.wordpress import (
+    WORDPRESS_BASE_URL,
+    fetch_word_press_data,
+    fetch_word_press_resources,
+    log_session_stats,
+)
 
 ENDPOINTS = {
-    "case_bundles": "https://admin.climatecasechart.com/wp-json/wp/v2/case_bundle",
-    "document_media": "https://admin.climatecasechart.com/wp-json/wp/v2/media",
-    "global_cases": "https://admin.climatecasechart.com/wp-json/wp/v2/non_us_case",
-    "jurisdictions": "https://admin.climatecasechart.com/wp-json/wp/v2/jurisdiction",
-    "us_cases": "https://admin.climatecasechart.com/wp-json/wp/v2/case",
+    "case_bundles": f"{WORDPRESS_BASE_URL}/case_bundle",
+    "document_media": f"{WORDPRESS_BASE_URL}/media",
+    "global_cases": f"{WORDPRESS_BASE_URL}/non_us_case",
+    "jurisdictions": f"{WORDPRESS_BASE_URL}/jurisdiction",
+    "us_cases": f"{WORDPRESS_BASE_URL}/case",
+}
+
+# The fields of each endpoint read by the parsers, only these are requested through the
+# WordPress `_fields` parameter. Everything else on a record, such as `yoast_head`,
+# `yoast_head_json`, `_links` and most media attributes, is never read.
+# - cases and case bundles: read by parsers/family.py, document.py, event.py and
+#   collection.py, the concept ids are read from the taxonomy fields by get_concepts
+# - document media: only the source url of a file is read by parsers/document.py
+# - jurisdictions: read by map_global_jurisdictions in parsers/helpers.py
+CASE_FIELDS = ["id", "type", "title", "modified_gmt", "acf", *concept_taxonomies]
+ENDPOINT_FIELDS = {
+    "case_bundles": CASE_FIELDS,
+    "document_media": ["id", "source_url"],
+    "global_cases": CASE_FIELDS,
+    "jurisdictions": ["id", "name", "parent"],
+    "us_cases": CASE_FIELDS,
+}
+
+# Number of pages fetched in parallel from each WordPress endpoint. The media and case
+# endpoints span many pages, so fetching them concurrently cuts most of the wait.
+PAGE_WORKERS = 4
+
+# Number of endpoints fetched in parallel. None of the endpoints depend on each other,
+# so a fetch takes about as long as the slowest one. They are started in this order,
+# the media library is by far the largest so it starts first.
+ENDPOINT_WORKERS = 4
+ENDPOINT_FETCH_ORDER = [
+    "document_media",
+    "us_cases",
+    "global_cases",
+    "case_bundles",
+    "jurisdictions",
+]
+
+# Only these endpoints are post types with a modified date to filter on
+MODIFIED_ENDPOINTS = {"us_cases", "global_cases"}
+
+# The documents of each case type, and the field holding the id of each document's file
+# in the media library, as read by process_family_documents in parsers/document.py
+CASE_DOCUMENT_FILE_KEYS = {
+    "case": ("ccl_case_documents", "ccl_file"),
+    "non_us_case": ("ccl_nonus_case_documents", "ccl_nonus_file"),
 }
 
 
@@ -18,22 +82,139 @@ class LitigationType(TypedDict):
     collections: list[dict[str, Any]]
     families: dict[str, list[dict[str, Any]]]
     documents: list[dict[str, Any]]
-    concepts: dict[int, Concept]
+    concepts: dict[int, Concept] | ConceptResolver
+
+
+def find_referenced_media_ids(cases: list[dict[str, Any]]) -> list[int]:
+    """Find the ids of the media files the documents of the cases refer to.
+
+    :param list[dict[str, Any]] cases: The US and global cases.
+    :return list[int]: The unique media ids, in the order they are first referred to.
+        Documents without a file id are left out, they are reported when mapped.
+    """
+    media_ids: dict[int, None] = {}
+    for case in cases:
+        keys = CASE_DOCUMENT_FILE_KEYS.get(case.get("type", ""))
+        if keys is None:
+            continue
+
+        documents_key, file_key = keys
+        for document in (case.get("acf") or {}).get(documents_key) or []:
+            media_id = document.get(file_key)
+            if isinstance(media_id, int):
+                media_ids[media_id] = None
+    return list(media_ids)
 
 
-def fetch_litigation_data() -> LitigationType:
+def fetch_referenced_media(
+    cases: list[dict[str, Any]], deadline: Deadline | None = None
+) -> list[dict[str, Any]]:
+    """Fetch only the media files the documents of the cases refer to.
+
+    The media library holds every image and attachment on the site, while only the
+    files of case documents are mapped. Those are requested by id in `include` batches.
+
+    :param list[dict[str, Any]] cases: The US and global cases.
+    :param Deadline | None deadline: When the media must have been fetched by.
+    :return list[dict[str, Any]]: The media records found, or an empty list if they
+        could not be fetched.
+    """
+    media_ids = find_referenced_media_ids(cases)
+    click.echo(f"⏳ Fetching the {len(media_ids)} media files referred to by cases...")
+    try:
+        media = fetch_word_press_resources(
+            ENDPOINTS["document_media"],
+            media_ids,
+            fields=ENDPOINT_FIELDS["document_media"],
+            deadline=deadline,
+            decoder=get_record_decoder(ENDPOINTS["document_media"]),
+        )
+    except requests.RequestException as e:
+        click.echo(
+            f"❌ Error fetching data from {ENDPOINTS['document_media']}: {e}", err=True
+        )
+        return []
+    return list(media.values())
+
+
+def fetch_litigation_data(
+    modified_after: datetime | None = None,
+    checkpoints: CheckpointStore | None = None,
+    deadline: Deadline | None = None,
+    selective_media: bool = False,
+) -> LitigationType:
     """Fetch litigation data from WordPress API endpoints.
 
+    When `modified_after` is given only the cases changed since then are fetched. The
+    case bundles, jurisdictions, document media and concepts that those cases refer to
+    are still fetched in full, as an unchanged case bundle or media file can belong to
+    a changed case.
+
+    The endpoints, and the taxonomies the concepts are extracted from, are fetched in
+    parallel on a pool of `ENDPOINT_WORKERS` threads, starting with the media library.
+    Concepts the cases and case bundles refer to that are missing from the taxonomies
+    are then fetched in batches, so mapping never has to stop to fetch one.
+
+    With `selective_media` the media library is not fetched in full. Once the cases have
+    been fetched only the media files their documents refer to are fetched, by id.
+
+    :param datetime | None modified_after: Only fetch cases modified after this time.
+    :param CheckpointStore | None checkpoints: Where to checkpoint the fetched pages of
+        each endpoint, so a retried fetch resumes from the last page fetched.
+    :param Deadline | None deadline: When every endpoint must have been fetched by,
+        defaults to `WORDPRESS_RUN_BUDGET_SECONDS` from now.
+    :param bool selective_media: Whether to fetch only the media files referred to by
+        the cases, rather than the whole media library.
     :return Litigation: A dictionary containing collections, families, documents, and events.
     """
     click.echo("⏳ Fetching litigation data from WordPress endpoints...")
 
-    collections_data = fetch_word_press_data(ENDPOINTS["case_bundles"])
-    us_cases_data = fetch_word_press_data(ENDPOINTS["us_cases"])
-    global_cases_data = fetch_word_press_data(ENDPOINTS["global_cases"])
-    jurisdictions_data = fetch_word_press_data(ENDPOINTS["jurisdictions"])
-    document_media = fetch_word_press_data(ENDPOINTS["document_media"])
-    concepts = extract_concepts()
+    # The retry summary logged at the end covers this fetch only
+    reset_retry_stats()
+    deadline = deadline or Deadline.after(WORDPRESS_RUN_BUDGET_SECONDS)
+
+    with ThreadPoolExecutor(max_workers=ENDPOINT_WORKERS) as executor:
+        endpoint_futures = {
+            name: executor.submit(
+                fetch_word_press_data,
+                ENDPOINTS[name],
+                max_workers=PAGE_WORKERS,
+                fields=ENDPOINT_FIELDS[name],
+                modified_after=modified_after if name in MODIFIED_ENDPOINTS else None,
+                checkpoints=checkpoints,
+                deadline=deadline,
+                decoder=get_record_decoder(ENDPOINTS[name]),
+            )
+            for name in ENDPOINT_FETCH_ORDER
+            if not (selective_media and name == "document_media")
+        }
+        concepts_future = executor.submit(extract_concepts, deadline=deadline)
+
+        if selective_media:
+            cases = [
+                *endpoint_futures["us_cases"].result(),
+                *endpoint_futures["global_cases"].result(),
+            ]
+            endpoint_futures["document_media"] = executor.submit(
+                fetch_referenced_media, cases, deadline=deadline
+            )
+
+    collections_data = endpoint_futures["case_bundles"].result()
+    us_cases_data = endpoint_futures["us_cases"].result()
+    global_cases_data = endpoint_futures["global_cases"].result()
+    jurisdictions_data = endpoint_futures["jurisdictions"].result()
+    document_media = endpoint_futures["document_media"].result()
+    concepts = concepts_future.result()
+
+    # Resolve the concepts the cases refer to that were missing from the taxonomies now,
+    # rather than one at a time while the families are mapped
+    missing_concepts = prefetch_missing_concepts(
+        [*collections_data, *us_cases_data, *global_cases_data],
+        concepts,
+        deadline=deadline,
+    )
+    if missing_concepts:
+        concepts.update(missing_concepts)
 
     litigation_data: LitigationType = {
         "collections": collections_data,
@@ -47,4 +228,6 @@ def fetch_litigation_data() -> LitigationType:
     }
 
     click.echo("✅ Completed fetching litigation data.")
+    log_session_stats()
+    log_retry_stats()
     return litigation_data
@@ -2,7 +2,7 @@ import json
 import logging
 import os
 from dataclasses import asdict
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import boto3
 import requests
@@ -11,14 +11,28 @@ from prefect import flow, task
 from prefect.artifacts import create_table_artifact
 from pydantic import SecretStr
 
-from litigation_data_mapper.cli import wrangle_data
-from litigation_data_mapper.datatypes import Config, Credentials
-from litigation_data_mapper.fetch_litigation_data import (
-    LitigationType,
-    fetch_litigation_data,
+from litigation_data_mapper.checkpoints import S3CheckpointStore
+from litigation_data_mapper.cli import create_context, wrangle_data
+from litigation_data_mapper.data_sources import get_data_source
+from litigation_data_mapper.datatypes import Config, Credentials, Failure
+from litigation_data_mapper.extract_concepts import taxonomies
+from litigation_data_mapper.fetch_litigation_data import LitigationType
+from litigation_data_mapper.pipeline import stream_litigation_data
+from litigation_data_mapper.rate_limit import rate_limited_request
+from litigation_data_mapper.retry_policy import (
+    WORDPRESS_RUN_BUDGET_SECONDS,
+    Deadline,
+    get_retry_stats,
+    reset_retry_stats,
 )
 from litigation_data_mapper.utils import SlackNotify
-from litigation_data_mapper.wordpress import fetch_word_press_data
+from litigation_data_mapper.wordpress import (
+    WORDPRESS_BASE_URL,
+    EndpointProbe,
+    fetch_word_press_data,
+    get_session_stats,
+    probe_word_press_endpoint,
+)
 from litigation_data_mapper.wordpress_data import endpoints
 
 logger = logging.getLogger(__name__)
@@ -28,12 +42,62 @@ PARAMETER_ADMIN_BACKEND_APP_DOMAIN_NAME = "/Admin-Backend/API/App-Domain"
 PARAMETER_BACKEND_SUPERUSER_EMAIL_NAME = "/Backend/API/SuperUser/Email"
 PARAMETER_BACKEND_SUPERUSER_PASSWORD_NAME = "/Backend/API/SuperUser/Password"  # nosec
 
+# An endpoint whose probe has not changed is still synced in full once its last sync
+# is this old, as a probe cannot see every change (see EndpointProbe)
+ENDPOINT_PROBE_MAX_AGE = timedelta(days=7)
 
-@task
-def fetch_litigation_data_task() -> LitigationType:
+
+def get_checkpoint_store(checkpoint_pages: bool) -> S3CheckpointStore | None:
+    """
+    Get where the pages fetched from WordPress are checkpointed, if they are.
+
+    Checkpointing costs an S3 PUT for every page fetched, so it is opt in.
+
+    :param bool checkpoint_pages: Whether to checkpoint the fetched pages to S3.
+    :return S3CheckpointStore | None: The S3 checkpoint store, or None if pages are
+        not checkpointed.
+    """
+    if not checkpoint_pages:
+        return None
+    return S3CheckpointStore(boto3.client("s3", region_name="eu-west-1"))
+
+
+@task(retries=2, retry_delay_seconds=60)
+def fetch_litigation_data_task(
+    selective_media: bool = False, source: str = "api", checkpoint_pages: bool = False
+) -> LitigationType:
     try:
-        logger.info("🔍 Fetching litigation data")
-        litigation_data = fetch_litigation_data()
+        logger.info(f"🔍 Fetching litigation data from {source}")
+        # With checkpointing, a retry resumes each endpoint from the last page fetched
+        # instead of starting again from page 1
+        checkpoints = get_checkpoint_store(checkpoint_pages)
+        litigation_data = get_data_source(source, checkpoints=checkpoints).load(
+            selective_media=selective_media
+        )
+
+        # An endpoint that failed after its retries comes back empty, fail the task so
+        # it is retried rather than mapping an incomplete corpus
+        missing_datasets = [
+            name
+            for name, dataset in [
+                ("case_bundles", litigation_data["collections"]),
+                ("us_cases", litigation_data["families"]["us_cases"]),
+                ("global_cases", litigation_data["families"]["global_cases"]),
+                ("jurisdictions", litigation_data["families"]["jurisdictions"]),
+                ("document_media", litigation_data["documents"]),
+            ]
+            if not dataset
+        ]
+        if missing_datasets:
+            raise RuntimeError(
+                f"No data fetched for {', '.join(missing_datasets)}, retrying."
+            )
+
+        # The run is complete, so no retry will resume from the checkpoints left by
+        # this or earlier failed runs
+        if checkpoints is not None:
+            checkpoints.clear_all()
+
         return litigation_data
 
     except Exception as e:
@@ -42,9 +106,11 @@ def fetch_litigation_data_task() -> LitigationType:
 
 
 @task
-def trigger_bulk_import(litigation_data: LitigationType) -> requests.models.Response:
+def trigger_bulk_import(
+    litigation_data: LitigationType, workers: int = 1
+) -> requests.models.Response:
     [mapped_data, failures] = wrangle_data(
-        litigation_data, debug=True, get_modified_data=False
+        litigation_data, debug=True, get_modified_data=False, workers=workers
     )
     logger.info("✅ Finished mapping litigation data.")
     logger.info("📝 Dumping litigation data to output file")
@@ -55,6 +121,42 @@ def trigger_bulk_import(litigation_data: LitigationType) -> requests.models.Resp
     except Exception as e:
         logger.error(f"❌ Failed to dump JSON to file. Error: {e}.")
 
+    return import_output_file(output_file, failures)
+
+
+@task
+def stream_bulk_import(
+    selective_media: bool = False, source: str = "api", checkpoint_pages: bool = False
+) -> requests.models.Response:
+    # The cases are streamed from the source to the output file one at a time, rather
+    # than the whole corpus being held in memory while it is mapped
+    logger.info(f"🔍 Streaming litigation data from {source}")
+    checkpoints = get_checkpoint_store(checkpoint_pages)
+    context = create_context(debug=True, get_modified_data=False)
+    output_file = os.path.join(os.getcwd(), "output.json")
+    stream_litigation_data(
+        get_data_source(source, checkpoints=checkpoints),
+        output_file,
+        context,
+        selective_media=selective_media,
+    )
+    logger.info("✅ Finished streaming mapped litigation data.")
+    if checkpoints is not None:
+        checkpoints.clear_all()
+
+    return import_output_file(output_file, list(context.failures))
+
+
+def import_output_file(
+    output_file: str, failures: list[Failure]
+) -> requests.models.Response:
+    """
+    Record the failures of a mapping and send its output file to the admin service API.
+
+    :param str output_file: The output file of the mapping.
+    :param list[Failure] failures: The failures of the mapping.
+    :return requests.models.Response: The response of the bulk import request.
+    """
     if os.path.exists(output_file):
         logger.info(f"✅ Output file successfully created at: {output_file}.")
     else:
@@ -84,7 +186,8 @@ def trigger_bulk_import(litigation_data: LitigationType) -> requests.models.Resp
     config = get_auth_config()
     auth_token = get_token(config)
 
-    response = requests.post(
+    response = rate_limited_request(
+        "POST",
         f"https://{config.app_domain}/api/v1/bulk-import/{config.corpus_import_id}",
         headers={"Authorization": f"Bearer {auth_token}"},
         files={"data": open(output_file, "rb")},
@@ -113,12 +216,49 @@ def sync_wordpress_to_s3_task():
 
 def sync_wordpress_to_s3():
     client = boto3.client("s3", region_name="eu-west-1")
-    now = datetime.now(tz=timezone.utc).isoformat()
+    synced_at = datetime.now(tz=timezone.utc)
+    now = synced_at.isoformat()
+    reset_retry_stats()
+    deadline = Deadline.after(WORDPRESS_RUN_BUDGET_SECONDS)
+    skipped_endpoints = []
 
     for endpoint in endpoints:
-        data = fetch_word_press_data(
-            f"https://admin.climatecasechart.com/wp-json/wp/v2/{endpoint}"
-        )
+        url = f"{WORDPRESS_BASE_URL}/{endpoint}"
+
+        # One request for the newest record tells us whether anything has changed
+        # since the last sync, most taxonomies go months without changing
+        try:
+            probe = probe_word_press_endpoint(
+                url, has_modified_date=endpoint not in taxonomies, deadline=deadline
+            )
+        except requests.RequestException as e:
+            logger.warning(f"⚠️ Could not probe {endpoint}, syncing it in full: {e}")
+            probe = None
+
+        last_sync = load_endpoint_probe(client, endpoint)
+        if probe is not None and last_sync is not None:
+            last_probe, last_synced_at = last_sync
+            if (
+                probe == last_probe
+                and synced_at - last_synced_at < ENDPOINT_PROBE_MAX_AGE
+            ):
+                logger.info(
+                    f"⏭️ {endpoint} unchanged since {last_synced_at}, skipping."
+                )
+                # Every dated snapshot holds every endpoint, so a run can be
+                # reproduced from one prefix. S3 copies the unchanged object itself.
+                client.copy_object(
+                    Bucket="cpr-cache",
+                    CopySource={
+                        "Bucket": "cpr-cache",
+                        "Key": f"litigation/wordpress/{endpoint}.json",
+                    },
+                    Key=f"litigation/wordpress/{now}/{endpoint}.json",
+                )
+                skipped_endpoints.append(endpoint)
+                continue
+
+        data = fetch_word_press_data(url, deadline=deadline)
 
         client.put_object(
             Bucket="cpr-cache",
@@ -131,6 +271,67 @@ def sync_wordpress_to_s3():
             Body=json.dumps(data),
         )
 
+        # An empty result may be a fetch that failed, so it is only trusted as the
+        # snapshot to compare the next probe against if the endpoint really is empty
+        if probe is not None and (data or probe.total == 0):
+            save_endpoint_probe(client, endpoint, probe, synced_at)
+
+    logger.info(
+        f"⏭️ Skipped {len(skipped_endpoints)} unchanged endpoints: "
+        f"{', '.join(skipped_endpoints) or 'none'}."
+    )
+
+    stats = get_session_stats()
+    logger.info(
+        f"🔌 WordPress session sent {stats.requests_sent} requests over "
+        f"{stats.connections_opened} connections ({stats.connections_reused} reused)."
+    )
+    retry_stats = get_retry_stats()
+    logger.info(
+        f"🔁 Made {retry_stats.total_retries} retries across "
+        f"{len(retry_stats.retries)} requests, sleeping for "
+        f"{retry_stats.sleep_seconds:.1f}s."
+    )
+
+
+def load_endpoint_probe(
+    client: S3Client, endpoint: str
+) -> tuple[EndpointProbe, datetime] | None:
+    """Load the probe of an endpoint taken when it was last synced to S3.
+
+    :param S3Client client: The S3 client.
+    :param str endpoint: The name of the WordPress endpoint.
+    :return tuple[EndpointProbe, datetime] | None: The probe and when the endpoint was
+        synced, or None if it has not been synced since probes were introduced.
+    """
+    try:
+        s3_object = client.get_object(
+            Bucket="cpr-cache", Key=f"litigation/wordpress/probes/{endpoint}.json"
+        )
+    except client.exceptions.NoSuchKey:
+        return None
+
+    entry = json.loads(s3_object["Body"].read().decode("utf-8"))
+    probe = EndpointProbe(total=entry["total"], newest=entry["newest"])
+    return probe, datetime.fromisoformat(entry["synced_at"])
+
+
+def save_endpoint_probe(
+    client: S3Client, endpoint: str, probe: EndpointProbe, synced_at: datetime
+) -> None:
+    """Store the probe of an endpoint that has just been synced to S3.
+
+    :param S3Client client: The S3 client.
+    :param str endpoint: The name of the WordPress endpoint.
+    :param EndpointProbe probe: The probe taken before the endpoint was fetched.
+    :param datetime synced_at: When the endpoint was synced.
+    """
+    client.put_object(
+        Bucket="cpr-cache",
+        Key=f"litigation/wordpress/probes/{endpoint}.json",
+        Body=json.dumps({**asdict(probe), "synced_at": synced_at.isoformat()}),
+    )
+
 
 def load_s3_object(client: S3Client, taxonomy: str):
     s3_object = client.get_object(
@@ -160,7 +361,8 @@ def get_deletions():
     missing_family_ids = []
     page = 1
     while True:
-        resp = requests.get(
+        resp = rate_limited_request(
+            "GET",
             "https://api.climatepolicyradar.org/families/",
             params={
                 "corpus.import_id": "Academic.corpus.Litigation.n0000",
@@ -197,16 +399,42 @@ def get_deletions():
 
 
 @flow(log_prints=True, on_failure=[SlackNotify.message])
-def automatic_updates(debug=True):
+def automatic_updates(
+    debug=True,
+    selective_media=False,
+    source="api",
+    workers=1,
+    stream=False,
+    checkpoint_pages=False,
+):
     """
     Prefect flow which pulls down all data from the Sabin API, filters it to only contain data created or updated in the last 24 hrs,
     maps it to a json file and sends that file to the admin service API to trigger a bulk import/update.
+
+    With `selective_media` only the media files referred to by the cases are fetched, rather than the whole media library.
+    With `source="s3"` the data is loaded from the S3 cache synced by `sync_wordpress_to_s3` instead of the Sabin API.
+    With `workers` above 1 the cases are mapped in that many worker processes.
+    With `stream` the cases are streamed through the mapping one at a time, keeping memory use flat.
+    With `checkpoint_pages` every page fetched from the Sabin API is checkpointed to S3, so a retried fetch resumes where it failed.
     """
     logger.info("🚀 Starting automatic litigation update flow.")
 
-    # Fan-out and start parallel tasks
-    litigation_data = fetch_litigation_data_task.submit().result()
-    bulk_input_response_future = trigger_bulk_import.submit(litigation_data)
+    if stream:
+        bulk_input_response_future = stream_bulk_import.submit(
+            selective_media=selective_media,
+            source=source,
+            checkpoint_pages=checkpoint_pages,
+        )
+    else:
+        # Fan-out and start parallel tasks
+        litigation_data = fetch_litigation_data_task.submit(
+            selective_media=selective_media,
+            source=source,
+            checkpoint_pages=checkpoint_pages,
+        ).result()
+        bulk_input_response_future = trigger_bulk_import.submit(
+            litigation_data, workers=workers
+        )
 
     # Get the results of the paralleltasks
     bulk_input_response = bulk_input_response_future.result()
@@ -228,7 +456,8 @@ def get_token(config: Config) -> str:
     url = f"https://{config.app_domain}/api/tokens"
     logger.info(f"🔒 Getting auth token for url: {url}")
 
-    response = requests.post(
+    response = rate_limited_request(
+        "POST",
         url,
         timeout=10,
         headers={"Content-Type": "application/x-www-form-urlencoded"},
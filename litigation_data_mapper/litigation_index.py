@@ -0,0 +1,83 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from litigation_data_mapper.fetch_litigation_data import LitigationType
+
+Record = dict[str, Any]
+
+
+def _by_id(records: Iterable[Record]) -> dict[int, Record]:
+    # Keeps the first record with each id, as the scans this replaces found the
+    # first, and skips records without an id
+    records_by_id: dict[int, Record] = {}
+    for record in records:
+        record_id = record.get("id")
+        if isinstance(record_id, int) and record_id not in records_by_id:
+            records_by_id[record_id] = record
+    return records_by_id
+
+
+@dataclass(frozen=True, slots=True)
+class LitigationIndex:
+    """The litigation records by id, built once per run.
+
+    The parsers look records up here rather than scanning the lists they were
+    fetched in, so mapping a case no longer gets slower as the corpus grows.
+    """
+
+    bundles: dict[int, Record] = field(default_factory=dict)
+    cases: dict[int, Record] = field(default_factory=dict)
+    media: dict[int, Record] = field(default_factory=dict)
+    jurisdictions: dict[int, Record] = field(default_factory=dict)
+
+    @classmethod
+    def from_records(
+        cls,
+        bundles: Iterable[Record] = (),
+        cases: Iterable[Record] = (),
+        media: Iterable[Record] = (),
+        jurisdictions: Iterable[Record] = (),
+    ) -> "LitigationIndex":
+        """Index lists of records.
+
+        :param Iterable[Record] bundles: The case bundles.
+        :param Iterable[Record] cases: The US and global cases.
+        :param Iterable[Record] media: The document media.
+        :param Iterable[Record] jurisdictions: The jurisdiction taxonomy terms.
+        :return LitigationIndex: The records by id.
+        """
+        return cls(
+            bundles=_by_id(bundles),
+            cases=_by_id(cases),
+            media=_by_id(media),
+            jurisdictions=_by_id(jurisdictions),
+        )
+
+    @classmethod
+    def build(cls, data: LitigationType) -> "LitigationIndex":
+        """Index the litigation data loaded for a run.
+
+        :param LitigationType data: The litigation data.
+        :return LitigationIndex: The records by id.
+        """
+        families = data["families"]
+        return cls.from_records(
+            bundles=data["collections"],
+            cases=[*families.get("us_cases", []), *families.get("global_cases", [])],
+            media=data["documents"],
+            jurisdictions=families.get("jurisdictions", []),
+        )
+
+
+def get_litigation_index(
+    collections: LitigationIndex | list[Record] | None,
+) -> LitigationIndex:
+    """Index a list of case bundles, unless it already is an index.
+
+    :param LitigationIndex | list[Record] | None collections: The case bundles.
+    :return LitigationIndex: An index holding at least the case bundles.
+    """
+    if isinstance(collections, LitigationIndex):
+        return collections
+    return LitigationIndex.from_records(bundles=collections or [])
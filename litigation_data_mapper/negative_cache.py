@@ -0,0 +1,146 @@
+import json
+import os
+import threading
+import time
+
+import click
+
+# Setting this persists the concepts known not to exist between runs
+CONCEPT_NEGATIVE_CACHE_PATH_ENV = "CONCEPT_NEGATIVE_CACHE_PATH"
+CONCEPT_NEGATIVE_CACHE_TTL_SECONDS_ENV = "CONCEPT_NEGATIVE_CACHE_TTL_SECONDS"
+
+# A concept missing today may be published tomorrow, so persisted misses are only
+# trusted for this long
+DEFAULT_NEGATIVE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+class NegativeCache:
+    """Remembers the concepts WordPress could not resolve, keyed by taxonomy and id.
+
+    Cases often refer to the same deleted or unpublished concept, so once a lookup has
+    come back empty the following lookups of the same concept are answered from here
+    instead of making the same failing request again. Misses are kept for the rest of
+    the run and, when a path is given, persisted for `ttl_seconds` across runs.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl_seconds: float = DEFAULT_NEGATIVE_CACHE_TTL_SECONDS,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._expires_at: dict[tuple[str, int], float] = {}
+        self.lookups_avoided = 0
+
+        if path:
+            self._load(path)
+
+    def _load(self, path: str) -> None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        now = time.time()
+        for entry in entries:
+            if entry["expires_at"] > now:
+                key = (entry["taxonomy"], entry["concept_id"])
+                self._expires_at[key] = entry["expires_at"]
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+
+        entries = [
+            {"taxonomy": taxonomy, "concept_id": concept_id, "expires_at": expires_at}
+            for (taxonomy, concept_id), expires_at in self._expires_at.items()
+        ]
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.path)
+
+    def is_unresolvable(self, taxonomy: str, concept_id: int) -> bool:
+        """Whether a concept is known not to exist, counting the lookup avoided if so.
+
+        :param str taxonomy: The taxonomy of the concept.
+        :param int concept_id: The id of the concept.
+        :return bool: True if the concept could not be resolved recently.
+        """
+        with self._lock:
+            expires_at = self._expires_at.get((taxonomy, concept_id))
+            if expires_at is None:
+                return False
+            if expires_at <= time.time():
+                del self._expires_at[(taxonomy, concept_id)]
+                return False
+            self.lookups_avoided += 1
+            return True
+
+    def add(self, taxonomy: str, concept_ids: list[int]) -> None:
+        """Remember concepts WordPress could not resolve.
+
+        :param str taxonomy: The taxonomy of the concepts.
+        :param list[int] concept_ids: The ids of the concepts.
+        """
+        if not concept_ids:
+            return
+
+        with self._lock:
+            expires_at = time.time() + self.ttl_seconds
+            for concept_id in concept_ids:
+                self._expires_at[(taxonomy, concept_id)] = expires_at
+            self._save()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._expires_at)
+
+
+def _create_default_negative_cache() -> NegativeCache:
+    return NegativeCache(
+        path=os.getenv(CONCEPT_NEGATIVE_CACHE_PATH_ENV),
+        ttl_seconds=float(
+            os.getenv(
+                CONCEPT_NEGATIVE_CACHE_TTL_SECONDS_ENV,
+                str(DEFAULT_NEGATIVE_CACHE_TTL_SECONDS),
+            )
+        ),
+    )
+
+
+_negative_cache: NegativeCache | None = None
+_negative_cache_lock = threading.Lock()
+
+
+def get_negative_cache() -> NegativeCache:
+    """Return the negative cache of the current run, creating it on first use.
+
+    :return NegativeCache: The run's negative cache, persisted to the path configured
+        by the `CONCEPT_NEGATIVE_CACHE_PATH` environment variable if set.
+    """
+    global _negative_cache
+    with _negative_cache_lock:
+        if _negative_cache is None:
+            _negative_cache = _create_default_negative_cache()
+        return _negative_cache
+
+
+def reset_negative_cache() -> None:
+    """Forget the negative cache of the current run, reloading it on next use."""
+    global _negative_cache
+    with _negative_cache_lock:
+        _negative_cache = None
+
+
+def log_negative_cache_stats() -> None:
+    """Echo how many concept lookups the negative cache saved."""
+    cache = get_negative_cache()
+    click.echo(
+        f"🚫 Avoided {cache.lookups_avoided} lookups of the {len(cache)} concepts "
+        "known not to exist."
+    )
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+# Setting this enables the page cache for every WordPress fetch
+WORDPRESS_CACHE_DIR_ENV = "WORDPRESS_CACHE_DIR"
+WORDPRESS_CACHE_MAX_BYTES_ENV = "WORDPRESS_CACHE_MAX_BYTES"
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPage:
+    etag: str | None
+    last_modified: str | None
+    total_pages: int
+    data: list[dict[str, Any]]
+
+
+class PageCache:
+    """An on-disk cache of WordPress pages used to make conditional GET requests.
+
+    Each page is stored alongside the ETag and Last-Modified validators WordPress sent
+    with it. On the next fetch those validators are sent back with the request and a
+    304 Not Modified response is served from the stored body instead of re-downloading
+    it. When the cache grows beyond `max_bytes` the least recently used pages are
+    evicted.
+
+    The directory is scanned once, on first use, and the size and use of each page is
+    tracked in memory from then on, so storing a page does not list the directory.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # The size of each page by path, least recently used first
+        self._page_sizes: OrderedDict[str, int] | None = None
+        self._total_size = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(
+        self, url: str, params: dict[str, Any], variant: str | None = None
+    ) -> str:
+        request: list[Any] = [url, sorted(params.items())]
+        if variant is not None:
+            request.append(variant)
+        key = json.dumps(request, default=str)
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(
+        self, url: str, params: dict[str, Any], variant: str | None = None
+    ) -> CachedPage | None:
+        """Retrieve a cached page, marking it as recently used.
+
+        :param str url: The URL the page was fetched from.
+        :param dict[str, Any] params: The query parameters the page was fetched with.
+        :param str | None variant: How the page was decoded, if not in full.
+        :return CachedPage | None: The cached page, or None if it is not cached.
+        """
+        path = self._path(url, params, variant)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        with self._lock:
+            page_sizes = self._load_page_sizes()
+            if path in page_sizes:
+                page_sizes.move_to_end(path)
+
+        return CachedPage(
+            etag=entry.get("etag"),
+            last_modified=entry.get("last_modified"),
+            total_pages=entry.get("total_pages", 1),
+            data=entry.get("data", []),
+        )
+
+    def put(
+        self,
+        url: str,
+        params: dict[str, Any],
+        page: CachedPage,
+        variant: str | None = None,
+    ) -> None:
+        """Store a page, evicting the least recently used pages if over the limit.
+
+        :param str url: The URL the page was fetched from.
+        :param dict[str, Any] params: The query parameters the page was fetched with.
+        :param CachedPage page: The page and its validators.
+        :param str | None variant: How the page was decoded, if not in full.
+        """
+        entry = {
+            "url": url,
+            "etag": page.etag,
+            "last_modified": page.last_modified,
+            "total_pages": page.total_pages,
+            "data": page.data,
+        }
+
+        path = self._path(url, params, variant)
+        with self._lock:
+            page_sizes = self._load_page_sizes()
+            # Write to a temporary file first so a concurrent reader never sees a
+            # partially written page
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+
+            self._total_size += size - page_sizes.pop(path, 0)
+            page_sizes[path] = size
+            self._evict(page_sizes)
+
+    def size(self) -> int:
+        """The total size in bytes of the pages held in the cache."""
+        with self._lock:
+            self._load_page_sizes()
+            return self._total_size
+
+    def _load_page_sizes(self) -> OrderedDict[str, int]:
+        if self._page_sizes is not None:
+            return self._page_sizes
+
+        # Pages used on earlier runs are ordered by their modification time, which
+        # `get` bumps on every use
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+
+        self._page_sizes = OrderedDict(
+            (path, size) for _, path, size in sorted(entries)
+        )
+        self._total_size = sum(self._page_sizes.values())
+        return self._page_sizes
+
+    def _evict(self, page_sizes: OrderedDict[str, int]) -> None:
+        while self._total_size > self.max_bytes and page_sizes:
+            path, size = page_sizes.popitem(last=False)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Still held on disk, so it still counts towards the limit
+                page_sizes[path] = size
+                page_sizes.move_to_end(path, last=False)
+                break
+            self._total_size -= size
+
+
+def get_default_page_cache() -> PageCache | None:
+    """Build the page cache configured through the environment, if any.
+
+    :return PageCache | None: A page cache in `WORDPRESS_CACHE_DIR`, or None if the
+        variable is not set.
+    """
+    directory = os.getenv(WORDPRESS_CACHE_DIR_ENV)
+    if not directory:
+        return None
+
+    max_bytes = int(
+        os.getenv(WORDPRESS_CACHE_MAX_BYTES_ENV, str(DEFAULT_CACHE_MAX_BYTES))
+    )
+    return PageCache(directory, max_bytes=max_bytes)
@@ -0,0 +1,424 @@
+from collections.abc import Iterable, Iterator, Sized
+from dataclasses import dataclass, replace
+from typing import Any
+
+import click
+
+from litigation_data_mapper.concept_resolver import (
+    ConceptResolver,
+    ConceptResolverStats,
+)
+from litigation_data_mapper.datatypes import (
+    Failure,
+    FailureLog,
+    LitigationContext,
+    SkipIndex,
+)
+from litigation_data_mapper.extract_concepts import Concept
+from litigation_data_mapper.fetch_litigation_data import LitigationType
+from litigation_data_mapper.litigation_index import LitigationIndex
+from litigation_data_mapper.parsers import document, event, family
+from litigation_data_mapper.parsers.helpers import (
+    map_global_jurisdictions,
+    sort_documents_by_file_id,
+    write_error_log,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class StepLog:
+    """What mapping the families, documents or events of a case recorded."""
+
+    failures: list[Failure]
+    skipped_families: list[int]
+    skipped_documents: list[int]
+
+    def __bool__(self) -> bool:
+        return bool(self.failures or self.skipped_families or self.skipped_documents)
+
+    def replay(self, context: LitigationContext) -> None:
+        context.failures.extend(self.failures)
+        context.skipped_families.extend(self.skipped_families)
+        context.skipped_documents.extend(self.skipped_documents)
+
+
+@dataclass(frozen=True, slots=True)
+class CaseMapping:
+    """The family, documents and events mapped from a single case."""
+
+    family: dict[str, Any] | None
+    family_log: StepLog
+    documents: list[dict[str, Any]]
+    document_log: StepLog
+    events: list[dict[str, Any]]
+    event_log: StepLog
+
+
+@dataclass(frozen=True, slots=True)
+class CaseMappingSteps:
+    """The mapping steps to run on each case, with what they share between cases.
+
+    A step is None when its required data is missing, in which case the whole step
+    is skipped just as `map_families`, `map_documents` or `map_events` would return
+    nothing.
+    """
+
+    concepts: ConceptResolver
+    index: LitigationIndex
+    mapped_jurisdictions: dict[str, dict[str, str]] | None
+    document_pdf_urls: dict[int, str] | None
+    event_family_counter: dict[str, int] | None
+
+
+def _context_lengths(context: LitigationContext) -> tuple[int, int, int]:
+    return (
+        len(context.failures),
+        len(context.skipped_families),
+        len(context.skipped_documents),
+    )
+
+
+def _step_log(context: LitigationContext, start: tuple[int, int, int]) -> StepLog:
+    failures, skipped_families, skipped_documents = start
+    return StepLog(
+        failures=context.failures[failures:],
+        skipped_families=context.skipped_families[skipped_families:],
+        skipped_documents=context.skipped_documents[skipped_documents:],
+    )
+
+
+def map_case(
+    data: dict[str, Any],
+    is_us_case: bool,
+    indexes: tuple[int, int, int],
+    steps: CaseMappingSteps,
+    context: LitigationContext,
+) -> CaseMapping:
+    """Maps the family, documents and events of a single case in one visit.
+
+    The case is mapped against a context of its own, so what each step records can be
+    replayed into the shared context in the order the separate passes would have
+    recorded it. Later steps still see what earlier steps skipped for the case.
+
+    :param dict[str, Any] data: The case data.
+    :param bool is_us_case: Whether the case is a US case.
+    :param tuple[int, int, int] indexes: The index of the case in the cases mapped by
+        `map_families`, `map_documents` and `map_events`, used for logging purposes.
+    :param CaseMappingSteps steps: The mapping steps to run.
+    :param LitigationContext context: The context of the litigation project import.
+    :return CaseMapping: The family, documents and events of the case.
+    """
+    family_index, document_index, event_index = indexes
+    case_context = replace(
+        context,
+        failures=FailureLog(),
+        skipped_families=SkipIndex(),
+        skipped_documents=SkipIndex(),
+    )
+
+    start = _context_lengths(case_context)
+    mapped_family = None
+    if steps.mapped_jurisdictions is not None:
+        mapped_family = family.map_family(
+            data,
+            family_index,
+            is_us_case,
+            case_context,
+            concepts=steps.concepts,
+            litigation_index=steps.index,
+            mapped_jurisdictions=steps.mapped_jurisdictions,
+        )
+    family_log = _step_log(case_context, start)
+
+    # Sorted once for both the documents and the events, unless neither is mapped
+    sorted_documents = None
+    case_id = data.get("id")
+    case_type = data.get("type")
+    if (
+        isinstance(case_id, int)
+        and case_id not in case_context.skipped_families
+        and case_type
+    ):
+        documents_key = (
+            "ccl_case_documents" if case_type == "case" else "ccl_nonus_case_documents"
+        )
+        documents = data.get("acf", {}).get(documents_key, [])
+        if documents:
+            sorted_documents = sort_documents_by_file_id(documents, case_type)
+
+    start = _context_lengths(case_context)
+    mapped_documents = []
+    if steps.document_pdf_urls is not None:
+        mapped_documents = document.map_family_documents(
+            data,
+            document_index,
+            steps.document_pdf_urls,
+            case_context,
+            sorted_documents,
+        )
+    document_log = _step_log(case_context, start)
+
+    start = _context_lengths(case_context)
+    mapped_events = []
+    if steps.event_family_counter is not None:
+        mapped_events = event.map_family_events(
+            data,
+            event_index,
+            steps.event_family_counter,
+            case_context,
+            sorted_documents,
+        )
+    event_log = _step_log(case_context, start)
+
+    return CaseMapping(
+        family=mapped_family,
+        family_log=family_log,
+        documents=mapped_documents,
+        document_log=document_log,
+        events=mapped_events,
+        event_log=event_log,
+    )
+
+
+def get_case_mapping_steps(
+    context: LitigationContext,
+    concepts: dict[int, Concept] | ConceptResolver,
+    index: LitigationIndex,
+    us_cases: Sized,
+    global_cases: Sized,
+    document_media: Sized,
+    document_pdf_urls: dict[int, str] | None = None,
+) -> CaseMappingSteps:
+    """Validates the litigation data and prepares the steps to map each case with.
+
+    Only whether there are any cases and document media is checked, so they can be
+    given as anything with a length.
+
+    :param LitigationContext context: The context of the litigation project import.
+    :param dict[int, Concept] | ConceptResolver concepts: The concepts.
+    :param LitigationIndex index: The index of the litigation records, holding at
+        least the case bundles and jurisdictions.
+    :param Sized us_cases: The US cases.
+    :param Sized global_cases: The global cases.
+    :param Sized document_media: The document media.
+    :param dict[int, str] | None document_pdf_urls: The source url of each document
+        media file, taken from the media in the index if not given.
+    :return CaseMappingSteps: The mapping steps to run on each case.
+    """
+    if context.debug:
+        click.echo("📝 Wrangling litigation family, document and event data.")
+
+    allow_empty_cases = context.get_modified_data
+    jurisdictions = list(index.jurisdictions.values())
+
+    return CaseMappingSteps(
+        concepts=family.get_concept_resolver(concepts),
+        index=index,
+        mapped_jurisdictions=(
+            map_global_jurisdictions(jurisdictions)
+            if family.validate_data(
+                global_cases, us_cases, jurisdictions, allow_empty_cases
+            )
+            else None
+        ),
+        document_pdf_urls=(
+            (
+                document_pdf_urls
+                if document_pdf_urls is not None
+                else document.get_document_pdf_urls(index.media.values())
+            )
+            if document.validate_data(
+                global_cases, us_cases, document_media, allow_empty_cases
+            )
+            else None
+        ),
+        event_family_counter=(
+            {}
+            if event.validate_data(us_cases, global_cases, allow_empty_cases)
+            else None
+        ),
+    )
+
+
+def prepare_case_mapping(
+    data: LitigationType,
+    context: LitigationContext,
+    index: LitigationIndex | None = None,
+) -> CaseMappingSteps:
+    """Validates the litigation data and prepares the steps to map each case with.
+
+    :param LitigationType data: The litigation data.
+    :param LitigationContext context: The context of the litigation project import.
+    :param LitigationIndex | None index: The index of the litigation records, built
+        from the data if not given.
+    :return CaseMappingSteps: The mapping steps to run on each case.
+    """
+    if index is None:
+        index = LitigationIndex.build(data)
+
+    return get_case_mapping_steps(
+        context,
+        data["concepts"],
+        index,
+        us_cases=data["families"].get("us_cases", []),
+        global_cases=data["families"].get("global_cases", []),
+        document_media=data.get("documents", []),
+    )
+
+
+def get_case_indexes(
+    us_case_count: int, global_case_count: int
+) -> tuple[Iterator[tuple[int, int, int]], Iterator[tuple[int, int, int]]]:
+    """Gets the indexes `map_case` logs each US and global case with.
+
+    :param int us_case_count: The number of US cases.
+    :param int global_case_count: The number of global cases.
+    :return tuple[Iterator[tuple[int, int, int]], Iterator[tuple[int, int, int]]]:
+        The indexes of the US cases and of the global cases, in order.
+    """
+    us_indexes = (
+        (position, global_case_count + position, position)
+        for position in range(us_case_count)
+    )
+    global_indexes = (
+        (position, position, us_case_count + position)
+        for position in range(global_case_count)
+    )
+    return us_indexes, global_indexes
+
+
+def replay_case_logs(
+    family_logs: Iterable[StepLog],
+    document_logs: Iterable[StepLog],
+    event_logs: Iterable[StepLog],
+    steps: CaseMappingSteps,
+    context: LitigationContext,
+    concept_stats: ConceptResolverStats,
+) -> None:
+    """Replays what mapping the cases recorded into the context, one step at a time.
+
+    :param Iterable[StepLog] family_logs: What mapping the families recorded, with
+        the US cases first.
+    :param Iterable[StepLog] document_logs: What mapping the documents recorded, with
+        the global cases first.
+    :param Iterable[StepLog] event_logs: What mapping the events recorded, with the
+        US cases first.
+    :param CaseMappingSteps steps: The mapping steps the cases were mapped with.
+    :param LitigationContext context: The context of the litigation project import.
+    :param ConceptResolverStats concept_stats: The concept lookups made mapping the
+        cases.
+    """
+    failure_count = len(context.failures)
+    for log in family_logs:
+        log.replay(context)
+
+    if steps.mapped_jurisdictions is not None:
+        if context.debug:
+            click.echo(
+                f"🧩 Concept lookups: {concept_stats.hits} hits, "
+                f"{concept_stats.misses} misses, {concept_stats.refetches} refetches "
+                f"({concept_stats.coalesced} shared)."
+            )
+        if len(context.failures) > failure_count:
+            click.echo(
+                "🛑 Some families have been skipped during the mapping process, related events and documents will not be mapped, check the failures log."
+            )
+
+    failure_count = len(context.failures)
+    for log in document_logs:
+        log.replay(context)
+
+    if steps.document_pdf_urls is not None and len(context.failures) > failure_count:
+        click.echo(
+            "🛑 Some documents have been skipped during the mapping process, related events will not be mapped, check the failures log."
+        )
+
+    failure_count = len(context.failures)
+    for log in event_logs:
+        log.replay(context)
+
+    if steps.event_family_counter is not None:
+        if len(context.failures) > failure_count:
+            click.echo(
+                "🛑 Some events have been skipped during the mapping process, check failures log."
+            )
+        write_error_log(context)
+
+
+def assemble_cases(
+    us_mappings: list[CaseMapping],
+    global_mappings: list[CaseMapping],
+    steps: CaseMappingSteps,
+    context: LitigationContext,
+    concept_stats: ConceptResolverStats,
+) -> dict[str, list[dict[str, Any]]]:
+    """Replays the mapped cases into the context in the order of the separate passes.
+
+    :param list[CaseMapping] us_mappings: The mapped US cases, in order.
+    :param list[CaseMapping] global_mappings: The mapped global cases, in order.
+    :param CaseMappingSteps steps: The mapping steps the cases were mapped with.
+    :param LitigationContext context: The context of the litigation project import.
+    :param ConceptResolverStats concept_stats: The concept lookups made mapping the
+        cases.
+    :return dict[str, list[dict[str, Any]]]: The litigation families, documents and
+        events.
+    """
+    # Families and events map the US cases first, documents map the global cases first
+    us_first = us_mappings + global_mappings
+    global_first = global_mappings + us_mappings
+    replay_case_logs(
+        [mapping.family_log for mapping in us_first],
+        [mapping.document_log for mapping in global_first],
+        [mapping.event_log for mapping in us_first],
+        steps,
+        context,
+        concept_stats,
+    )
+    return {
+        "families": [
+            mapping.family for mapping in us_first if mapping.family is not None
+        ],
+        "documents": [
+            document for mapping in global_first for document in mapping.documents
+        ],
+        "events": [event for mapping in us_first for event in mapping.events],
+    }
+
+
+def map_cases(
+    data: LitigationType,
+    context: LitigationContext,
+    index: LitigationIndex | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Maps the litigation cases to families, documents and events in a single pass.
+
+    This gives exactly the same output, failures and skipped ids as running
+    `map_families`, `map_documents` and `map_events` one after the other, but visits
+    each case once rather than three times. Case ids are assumed to be unique, as
+    they are across every WordPress post type.
+
+    :param LitigationType data: The litigation data, with the collections already
+        mapped into the context's case bundles.
+    :param LitigationContext context: The context of the litigation project import.
+    :param LitigationIndex | None index: The index of the litigation records, built
+        from the data if not given.
+    :return dict[str, list[dict[str, Any]]]: The litigation families, documents and
+        events in the 'destination' format described in the Litigation Data Mapper
+        Google Sheet.
+    """
+    steps = prepare_case_mapping(data, context, index)
+    us_cases = data["families"].get("us_cases", [])
+    global_cases = data["families"].get("global_cases", [])
+    us_indexes, global_indexes = get_case_indexes(len(us_cases), len(global_cases))
+
+    us_mappings = [
+        map_case(case, True, indexes, steps, context)
+        for case, indexes in zip(us_cases, us_indexes, strict=True)
+    ]
+    global_mappings = [
+        map_case(case, False, indexes, steps, context)
+        for case, indexes in zip(global_cases, global_indexes, strict=True)
+    ]
+    return assemble_cases(
+        us_mappings, global_mappings, steps, context, steps.concepts.stats()
+    )
@@ -1,5 +1,6 @@
 import html
 import os
+from collections.abc import Iterable, Sized
 from typing import Any, Union
 
 import click
@@ -92,6 +93,7 @@ def process_family_documents(
     case_id: int,
     document_pdf_urls: dict[int, str],
     context: LitigationContext,
+    sorted_documents: list[dict[str, Any]] | None = None,
 ) -> list[dict[str, Any]] | Failure:
     """Processes the family-related case documents and maps them to the internal data structure.
 
@@ -103,6 +105,8 @@ def process_family_documents(
     :param int case_id: The unique identifier for the case, used to link documents to the correct case.
     :param dict[int, str] document_pdf_urls: A dictionary containing URLs to the document PDFs that need to be processed.
     :param LitigationContext context: The context of the litigation project import.
+    :param list[dict[str, Any]] | None sorted_documents: The case documents already
+        sorted by file id, sorted here if not given.
     :return list[dict[str, Any]] | Failure: A list of mapped family case documents in the 'destination' format described in the
         Litigation Data Mapper Google Sheet, or Failure if no documents are found or case has missing information.
     """
@@ -138,7 +142,8 @@ def process_family_documents(
             )
         )
     else:
-        sorted_documents = sort_documents_by_file_id(documents, case_type)
+        if sorted_documents is None:
+            sorted_documents = sort_documents_by_file_id(documents, case_type)
         for doc in sorted_documents:
             document_id_key = "ccl_file" if case_type == "case" else "ccl_nonus_file"
             document_id = doc.get(
@@ -201,18 +206,21 @@ def process_family_documents(
 
 
 def validate_data(
-    global_cases: list[dict[str, Any]],
-    us_cases: list[dict[str, Any]],
-    document_media: list[dict[str, Any]],
+    global_cases: Sized,
+    us_cases: Sized,
+    document_media: Sized,
+    allow_empty_cases: bool = False,
 ) -> bool:
     """Validate that all required datasets are present.
     :param list[dict[str, Any]] global_cases: A list of global case data dictionaries.
     :param list[dict[str, Any]] us_cases: A list of US case data dictionaries.
     :param list[dict[str, Any]] document_media: A list of document media, including source urls.
+    :param bool allow_empty_cases: Whether either list of cases may be empty, which is
+        expected when only recently modified cases have been fetched.
     :return bool: True if all required datasets are present, otherwise False.
     """
 
-    if not global_cases or not us_cases:
+    if not allow_empty_cases and (not global_cases or not us_cases):
         missing_dataset = "global" if not global_cases else "US"
         click.echo(
             f"🛑 No {missing_dataset} cases found in the data. Skipping document litigation."
@@ -228,6 +236,62 @@ def validate_data(
     return True
 
 
+def get_document_pdf_urls(document_media: Iterable[dict[str, Any]]) -> dict[int, str]:
+    """Returns the public source url of each document media file by id.
+
+    :param Iterable[dict[str, Any]] document_media: The document media.
+    :return dict[int, str]: The source urls by media id.
+    """
+    return {
+        document["id"]: document["source_url"].replace("admin.", "")
+        for document in document_media
+        if "id" in document and "source_url" in document
+    }
+
+
+def map_family_documents(
+    family: dict[str, Any],
+    index: int,
+    document_pdf_urls: dict[int, str],
+    context: LitigationContext,
+    sorted_documents: list[dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Maps the documents of a single litigation case, recording any failures.
+
+    :param dict[str, Any] family: The case data.
+    :param int index: The index of the case in the global cases followed by the US
+        cases, used for logging purposes.
+    :param dict[int, str] document_pdf_urls: The source urls of the documents by id.
+    :param LitigationContext context: The context of the litigation project import.
+    :param list[dict[str, Any]] | None sorted_documents: The case documents already
+        sorted by file id, sorted here if not given.
+    :return list[dict[str, Any]]: The mapped documents, empty if the case was skipped.
+    """
+    case_id = family.get("id")
+    if not isinstance(case_id, int):
+        context.failures.append(
+            Failure(
+                id=None,
+                type="case",
+                reason=f"Does not contain a case id at index ({index}). Mapping documents.",
+            )
+        )
+        return []
+
+    if case_id in context.skipped_families:
+        return []
+
+    result = process_family_documents(
+        family, case_id, document_pdf_urls, context, sorted_documents
+    )
+
+    if isinstance(result, Failure):
+        context.failures.append(result)
+        return []
+
+    return result
+
+
 def map_documents(
     documents_data: dict[str, Any], context: LitigationContext
 ) -> list[dict[str, Any]]:
@@ -253,40 +317,24 @@ def map_documents(
     us_cases = documents_data.get("families", {}).get("us_cases", [])
     document_media = documents_data.get("documents", [])
 
-    if not validate_data(global_cases, us_cases, document_media):
+    if not validate_data(
+        global_cases,
+        us_cases,
+        document_media,
+        allow_empty_cases=context.get_modified_data,
+    ):
         return []
 
-    document_pdf_urls = {
-        document["id"]: document["source_url"].replace("admin.", "")
-        for document in document_media
-        if "id" in document and "source_url" in document
-    }
+    document_pdf_urls = get_document_pdf_urls(document_media)
 
     families = global_cases + us_cases
 
     mapped_documents = []
 
     for index, family in enumerate(families):
-        case_id = family.get("id")
-        if not isinstance(case_id, int):
-            context.failures.append(
-                Failure(
-                    id=None,
-                    type="case",
-                    reason=f"Does not contain a case id at index ({index}). Mapping documents.",
-                )
-            )
-            continue
-
-        if case_id in context.skipped_families:
-            continue
-
-        result = process_family_documents(family, case_id, document_pdf_urls, context)
-
-        if isinstance(result, Failure):
-            context.failures.append(result)
-        else:
-            mapped_documents.extend(result)
+        mapped_documents.extend(
+            map_family_documents(family, index, document_pdf_urls, context)
+        )
 
     if len(context.failures) > failure_count:
         click.echo(
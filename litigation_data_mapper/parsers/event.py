@@ -1,3 +1,4 @@
+from collections.abc import Sized
 from datetime import datetime
 from typing import Any
 
@@ -179,6 +180,7 @@ def process_family_events(
     case_id: int,
     event_family_counter: dict[str, int],
     context: LitigationContext,
+    sorted_documents: list[dict[str, Any]] | None = None,
 ) -> list[dict[str, Any]] | Failure:
     """Processes the family- and document-related case events and maps them to the internal data structure.
 
@@ -189,6 +191,8 @@ def process_family_events(
     :param int case_id: The unique identifier for the case, used to link events to the correct case.
     :param dict[str, int] event_family_counter: A dictionary that tracks the count of events types for each family case.
     :param LitigationContext context: The context of the litigation project import.
+    :param list[dict[str, Any]] | None sorted_documents: The case documents already
+        sorted by file id, sorted here if not given.
     :return list[dict[str, Any] | Failure: A list of mapped family case events in the 'destination' format described in the Litigation Data Mapper Google Sheet, or Failure if case contains missing data.
     """
     case_type = family.get("type")
@@ -244,7 +248,8 @@ def process_family_events(
     event_family_counter[family_import_id] += 1
 
     if documents:
-        sorted_documents = sort_documents_by_file_id(documents, case_type)
+        if sorted_documents is None:
+            sorted_documents = sort_documents_by_file_id(documents, case_type)
         for doc in sorted_documents:
             document_id_key = "ccl_file" if case_type == "case" else "ccl_nonus_file"
             document_id = doc.get(document_id_key)
@@ -272,6 +277,72 @@ def process_family_events(
     return family_events
 
 
+def validate_data(
+    us_cases: Sized,
+    global_cases: Sized,
+    allow_empty_cases: bool = False,
+) -> bool:
+    """Validate that all required datasets are present.
+    :param list[dict[str, Any]] us_cases: A list of US case data dictionaries.
+    :param list[dict[str, Any]] global_cases: A list of global case data dictionaries.
+    :param bool allow_empty_cases: Whether either list of cases may be empty, which is
+        expected when only recently modified cases have been fetched.
+    :return bool: True if all required datasets are present, otherwise False.
+    """
+    if not allow_empty_cases and (not us_cases or not global_cases):
+        missing_dataset = "Global" if not global_cases else "US"
+        click.echo(
+            f"🛑 No {missing_dataset} cases found in the data. Skipping document litigation."
+        )
+        return False
+
+    return True
+
+
+def map_family_events(
+    family: dict[str, Any],
+    index: int,
+    event_family_counter: dict[str, int],
+    context: LitigationContext,
+    sorted_documents: list[dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Maps the events of a single litigation case, recording any failures.
+
+    :param dict[str, Any] family: The case data.
+    :param int index: The index of the case in the US cases followed by the global
+        cases, used for logging purposes.
+    :param dict[str, int] event_family_counter: A dictionary that tracks the count of
+        events types for each family case.
+    :param LitigationContext context: The context of the litigation project import.
+    :param list[dict[str, Any]] | None sorted_documents: The case documents already
+        sorted by file id, sorted here if not given.
+    :return list[dict[str, Any]]: The mapped events, empty if the case was skipped.
+    """
+    case_id = family.get("id")
+    if not isinstance(case_id, int):
+        context.failures.append(
+            Failure(
+                id=None,
+                type="case",
+                reason=f"Does not contain a case id at index ({index}). Mapping events.",
+            )
+        )
+        return []
+
+    if case_id in context.skipped_families:
+        return []
+
+    result = process_family_events(
+        family, case_id, event_family_counter, context, sorted_documents
+    )
+
+    if isinstance(result, Failure):
+        context.failures.append(result)
+        return []
+
+    return result
+
+
 def map_events(
     events_data: dict[str, Any], context: LitigationContext
 ) -> list[dict[str, Any]]:
@@ -296,11 +367,9 @@ def map_events(
     us_cases = events_data.get("us_cases", [])
     global_cases = events_data.get("global_cases", [])
 
-    if not us_cases or not global_cases:
-        missing_dataset = "Global" if not global_cases else "US"
-        click.echo(
-            f"🛑 No {missing_dataset} cases found in the data. Skipping document litigation."
-        )
+    if not validate_data(
+        us_cases, global_cases, allow_empty_cases=context.get_modified_data
+    ):
         return []
 
     families = us_cases + global_cases
@@ -309,25 +378,9 @@ def map_events(
     mapped_events = []
 
     for index, family in enumerate(families):
-        case_id = family.get("id")
-        if not isinstance(case_id, int):
-            context.failures.append(
-                Failure(
-                    id=None,
-                    type="case",
-                    reason=f"Does not contain a case id at index ({index}). Mapping events.",
-                )
-            )
-            continue
-        if case_id in context.skipped_families:
-            continue
-
-        result = process_family_events(family, case_id, event_family_counter, context)
-
-        if isinstance(result, Failure):
-            context.failures.append(result)
-        else:
-            mapped_events.extend(result)
+        mapped_events.extend(
+            map_family_events(family, index, event_family_counter, context)
+        )
 
     if len(context.failures) > failures_count:
         click.echo(
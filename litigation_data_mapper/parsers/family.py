@@ -1,8 +1,10 @@
 import html
+from collections.abc import Sized
 from typing import Any
 
 import click
 
+from litigation_data_mapper.concept_resolver import ConceptResolver
 from litigation_data_mapper.datatypes import Failure, LitigationContext
 from litigation_data_mapper.extract_concepts import (
     US_ROOT_JURISDICTION_ID,
@@ -11,6 +13,10 @@ from litigation_data_mapper.extract_concepts import (
     fetch_individual_concept,
 )
 from litigation_data_mapper.extract_concepts import taxonomies as concept_taxonomies
+from litigation_data_mapper.litigation_index import (
+    LitigationIndex,
+    get_litigation_index,
+)
 from litigation_data_mapper.parsers.helpers import (
     map_global_jurisdictions,
     parse_document_filing_date,
@@ -87,7 +93,7 @@ def process_global_case_data(
     family_data: dict[str, Any],
     geographies: list[str],
     case_id: int,
-    concepts: dict[int, Concept],
+    concepts: dict[int, Concept] | ConceptResolver,
 ) -> dict[str, Any] | Failure:
     """
     Maps the data of a global case to the internal family structure.
@@ -205,8 +211,8 @@ def process_us_case_data(
     family_data: dict[str, Any],
     case_id: int,
     context: LitigationContext,
-    concepts: dict[int, Concept],
-    collections: list[dict[str, Any]],
+    concepts: dict[int, Concept] | ConceptResolver,
+    collections: LitigationIndex | list[dict[str, Any]],
 ) -> dict[str, Any] | Failure:
     """
     Maps the data of a US case to the internal family structure.
@@ -214,6 +220,8 @@ def process_us_case_data(
     :param dict[str, Any] family_data: The family data containing the case information.
     :param int case_id: The ID of the case.
     :param LitigationContext context: The context of the litigation project import.
+    :param LitigationIndex | list[dict[str, Any]] collections: The index of the
+        litigation records, or a list of the case bundles to index.
 
     :return dict[str, Any] | Failure: The mapped family data, or Failure if any required fields are missing.
     """
@@ -228,14 +236,9 @@ def process_us_case_data(
     # - calculate which bundles are associated with the case
     # - read the concepts from that bundle
     # - associate those concepts with the case AKA family
-    bundles = []
-    for bundle_id in bundle_ids:
-        matched_bundle = next(
-            (collection for collection in collections if collection["id"] == bundle_id),
-            None,
-        )
-        if matched_bundle:
-            bundles.append(matched_bundle)
+    concepts = get_concept_resolver(concepts)
+    index = get_litigation_index(collections)
+    bundles = [index.bundles[id] for id in bundle_ids if id in index.bundles]
 
     family_concepts = []
     for bundle in bundles:
@@ -363,18 +366,21 @@ def get_fallback_iso_code(
 
 
 def validate_data(
-    global_cases: list[dict[str, Any]],
-    us_cases: list[dict[str, Any]],
+    global_cases: Sized,
+    us_cases: Sized,
     jurisdictions: list[dict[str, Any]],
+    allow_empty_cases: bool = False,
 ) -> bool:
     """Validate that all required datasets are present.
     :param list[dict[str, Any]] global_cases: A list of global case data dictionaries.
     :param list[dict[str, Any]] us_cases: A list of US case data dictionaries.
     :param list[dict[str, Any]] jurisdictions: A list of jurisdiction data dictionaries.
+    :param bool allow_empty_cases: Whether either list of cases may be empty, which is
+        expected when only recently modified cases have been fetched.
     :return bool: True if all required datasets are present, otherwise False.
     """
 
-    if not global_cases or not us_cases:
+    if not allow_empty_cases and (not global_cases or not us_cases):
         missing_dataset = "global" if not global_cases else "US"
         click.echo(
             f"🛑 No {missing_dataset} cases found in the data. Skipping family litigation."
@@ -425,11 +431,61 @@ def required_fields_present(
     return True
 
 
+def map_family(
+    data: dict[str, Any],
+    index: int,
+    is_us_case: bool,
+    context: LitigationContext,
+    concepts: ConceptResolver,
+    litigation_index: LitigationIndex,
+    mapped_jurisdictions: dict[str, dict[str, str]],
+) -> dict[str, Any] | None:
+    """Maps a single litigation case to a family, recording why it was skipped if not.
+
+    :param dict[str, Any] data: The case data.
+    :param int index: The index of the case in its list of US or global cases.
+    :param bool is_us_case: Whether the case is a US case.
+    :param LitigationContext context: The context of the litigation project import.
+    :param ConceptResolver concepts: The resolver of the concepts the case refers to.
+    :param LitigationIndex litigation_index: The index of the litigation records.
+    :param dict[str, dict[str, str]] mapped_jurisdictions: The ISO codes of the
+        jurisdictions by id.
+    :return dict[str, Any] | None: The mapped family, or None if the case was skipped.
+    """
+    if not required_fields_present(data, context, index):
+        return None
+
+    case_id = data.get("id")
+
+    should_process = (
+        not context.get_modified_data
+        or last_modified_date(data) > context.last_import_date
+    )
+    if not should_process:
+        context.skipped_families.append(case_id)
+        return None
+
+    if is_us_case:
+        result = process_us_case_data(
+            data, case_id, context, concepts=concepts, collections=litigation_index
+        )
+    else:
+        geographies = get_jurisdiction_iso_codes(data, mapped_jurisdictions)
+        result = process_global_case_data(data, geographies, case_id, concepts=concepts)
+
+    if isinstance(result, Failure):
+        context.failures.append(result)
+        context.skipped_families.append(case_id)
+        return None
+
+    return result
+
+
 def map_families(
     families_data: dict[str, Any],
     context: LitigationContext,
-    collections: list[dict[str, Any]],
-    concepts: dict[int, Concept],
+    collections: LitigationIndex | list[dict[str, Any]],
+    concepts: dict[int, Concept] | ConceptResolver,
 ) -> list[dict[str, Any]]:
     """Maps the litigation case information to the internal data structure.
 
@@ -440,7 +496,10 @@ def map_families(
     :parm dict[str, Any] families_data: The case related data, structured as global cases,
         us cases and information related to global jurisdictions.
     :param LitigationContext context: The context of the litigation project import.
-    :param dict[int, Concept] | None concepts: Optional dictionary mapping concept IDs to Concept objects.
+    :param LitigationIndex | list[dict[str, Any]] collections: The index of the
+        litigation records, or a list of the case bundles to index.
+    :param dict[int, Concept] | ConceptResolver concepts: The concepts by ID, or a
+        resolver shared with other threads mapping families.
     :return list[dict[str, Any]]: A list of litigation families in
         the 'destination' format described in the Litigation Data Mapper Google
         Sheet.
@@ -450,67 +509,45 @@ def map_families(
 
     failure_count = len(context.failures)
 
-    concepts = concepts or {}
+    concepts = get_concept_resolver(concepts)
+    litigation_index = get_litigation_index(collections)
 
     global_cases = families_data.get("global_cases", [])
     us_cases = families_data.get("us_cases", [])
     jurisdictions = families_data.get("jurisdictions", [])
 
-    if not validate_data(global_cases, us_cases, jurisdictions):
+    if not validate_data(
+        global_cases,
+        us_cases,
+        jurisdictions,
+        allow_empty_cases=context.get_modified_data,
+    ):
         return []
 
     mapped_jurisdictions = map_global_jurisdictions(jurisdictions)
 
     mapped_families = []
 
-    # Process US Cases
-    for index, data in enumerate(us_cases):
-        if not required_fields_present(data, context, index):
-            continue
-
-        case_id = data.get("id")
-
-        should_process = (
-            not context.get_modified_data
-            or last_modified_date(data) > context.last_import_date
-        )
-
-        if should_process:
-            result = process_us_case_data(
-                data, case_id, context, concepts=concepts, collections=collections
+    for is_us_case, cases in ((True, us_cases), (False, global_cases)):
+        for index, data in enumerate(cases):
+            result = map_family(
+                data,
+                index,
+                is_us_case,
+                context,
+                concepts=concepts,
+                litigation_index=litigation_index,
+                mapped_jurisdictions=mapped_jurisdictions,
             )
-
-            if isinstance(result, Failure):
-                context.failures.append(result)
-                context.skipped_families.append(case_id)
-            else:
+            if result is not None:
                 mapped_families.append(result)
-        else:
-            context.skipped_families.append(case_id)
 
-    # Process Global cases
-    for index, data in enumerate(global_cases):
-        if not required_fields_present(data, context, index):
-            continue
-
-        case_id = data.get("id")
-
-        should_process = (
-            not context.get_modified_data
-            or last_modified_date(data) > context.last_import_date
+    if context.debug:
+        stats = concepts.stats()
+        click.echo(
+            f"🧩 Concept lookups: {stats.hits} hits, {stats.misses} misses, "
+            f"{stats.refetches} refetches ({stats.coalesced} shared)."
         )
-        if should_process:
-            geographies = get_jurisdiction_iso_codes(data, mapped_jurisdictions)
-            result = process_global_case_data(
-                data, geographies, case_id, concepts=concepts
-            )
-            if isinstance(result, Failure):
-                context.failures.append(result)
-                context.skipped_families.append(case_id)
-            else:
-                mapped_families.append(result)
-        else:
-            context.skipped_families.append(case_id)
 
     if len(context.failures) > failure_count:
         click.echo(
@@ -521,7 +558,8 @@ def map_families(
 
 
 def add_root_us_principal_law_concept(
-    family_concepts: list[dict[str, Any]], concepts: dict[int, Concept]
+    family_concepts: list[dict[str, Any]],
+    concepts: dict[int, Concept] | ConceptResolver,
 ):
     """
     Adds the synthetic US principal law concept to the family concepts list
@@ -562,7 +600,8 @@ def add_root_us_principal_law_concept(
 
 
 def add_root_us_jurisdiction_concept(
-    family_concepts: list[dict[str, Any]], concepts: dict[int, Concept]
+    family_concepts: list[dict[str, Any]],
+    concepts: dict[int, Concept] | ConceptResolver,
 ):
     """
     Adds the synthetic US jurisdiction concept to the family concepts list
@@ -603,20 +642,34 @@ def add_root_us_jurisdiction_concept(
     return family_concepts
 
 
+def get_concept_resolver(
+    concepts: dict[int, Concept] | ConceptResolver | None,
+) -> ConceptResolver:
+    """Wrap a lookup table of concepts in a resolver, unless it already is one.
+
+    :param dict[int, Concept] | ConceptResolver | None concepts: The concepts.
+    :return ConceptResolver: A resolver refetching concepts missing from the table.
+    """
+    if isinstance(concepts, ConceptResolver):
+        return concepts
+    return ConceptResolver(concepts, fetch=fetch_individual_concept)
+
+
 def get_concepts(
-    case: dict[str, Any], concepts: dict[int, Concept]
+    case: dict[str, Any], concepts: dict[int, Concept] | ConceptResolver
 ) -> list[dict[str, Any]]:
     click.echo(f"📝 Mapping concepts for family: {case.get('id')}")
 
+    resolver = get_concept_resolver(concepts)
     family_concepts = []
     is_us_case = case.get("type") in ["case", "case_bundle"]
-    us_root_principal_law = concepts.get(US_ROOT_PRINCIPAL_LAW_ID)
-    us_root_jurisdiction = concepts.get(US_ROOT_JURISDICTION_ID)
+    us_root_principal_law = resolver.get(US_ROOT_PRINCIPAL_LAW_ID)
+    us_root_jurisdiction = resolver.get(US_ROOT_JURISDICTION_ID)
 
     for taxonomy in concept_taxonomies:
         concept_ids = case.get(taxonomy, [])
         for concept_id in concept_ids:
-            concept = concepts.get(concept_id)
+            concept = resolver.lookup(concept_id)
 
             if concept is None:
                 click.echo(
@@ -626,13 +679,9 @@ def get_concepts(
                     click.echo(
                         f"🔄 Attempting to refetch concept {concept_id} from {taxonomy}..."
                     )
-                    refetched_concept = fetch_individual_concept(
-                        concept_id, taxonomy, concepts
-                    )
+                    refetched_concept = resolver.refetch(concept_id, taxonomy)
 
                     if refetched_concept:
-                        # Add to the concepts dictionary immediately
-                        concepts[concept_id] = refetched_concept
                         concept = refetched_concept
                         click.echo(f"✅ Successfully refetched concept {concept_id}")
                     else:
@@ -0,0 +1,184 @@
+import heapq
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any
+
+from litigation_data_mapper.concept_resolver import ConceptResolverStats
+from litigation_data_mapper.datatypes import LitigationContext
+from litigation_data_mapper.fetch_litigation_data import LitigationType
+from litigation_data_mapper.litigation_index import LitigationIndex
+from litigation_data_mapper.parsers.case import (
+    CaseMapping,
+    CaseMappingSteps,
+    assemble_cases,
+    get_case_indexes,
+    map_case,
+    prepare_case_mapping,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ShardedCase:
+    """A case to map in a shard, with where it sits among the cases."""
+
+    is_us_case: bool
+    position: int
+    indexes: tuple[int, int, int]
+    data: dict[str, Any]
+
+
+def _case_weight(case: dict[str, Any]) -> int:
+    acf = case.get("acf")
+    if not isinstance(acf, dict):
+        return 1
+    documents = acf.get("ccl_case_documents") or acf.get("ccl_nonus_case_documents")
+    return 1 + (len(documents) if isinstance(documents, list) else 0)
+
+
+def shard_cases(cases: list[ShardedCase], shard_count: int) -> list[list[ShardedCase]]:
+    """Splits the cases into shards of about as many documents each.
+
+    The heaviest cases are handed out first, each to the lightest shard so far, with
+    ties broken on the position of the case so the shards are the same on every run.
+
+    :param list[ShardedCase] cases: The cases to split.
+    :param int shard_count: The number of shards to split the cases into.
+    :return list[list[ShardedCase]]: The non-empty shards.
+    """
+    shards: list[list[ShardedCase]] = [[] for _ in range(shard_count)]
+    loads = [(0, shard) for shard in range(shard_count)]
+    heapq.heapify(loads)
+
+    for case in sorted(
+        cases,
+        key=lambda case: (-_case_weight(case.data), not case.is_us_case, case.position),
+    ):
+        load, shard = heapq.heappop(loads)
+        shards[shard].append(case)
+        heapq.heappush(loads, (load + _case_weight(case.data), shard))
+
+    return [shard for shard in shards if shard]
+
+
+# What every case in a worker process is mapped with, set once per process
+_worker_steps: CaseMappingSteps | None = None
+_worker_context: LitigationContext | None = None
+
+
+def _init_worker(steps: CaseMappingSteps, context: LitigationContext) -> None:
+    global _worker_steps, _worker_context
+    _worker_steps = steps
+    _worker_context = context
+
+
+def _map_shard(
+    shard: list[ShardedCase],
+) -> tuple[list[tuple[bool, int, CaseMapping]], ConceptResolverStats]:
+    assert _worker_steps is not None and _worker_context is not None
+    before = _worker_steps.concepts.stats()
+    mappings = [
+        (
+            case.is_us_case,
+            case.position,
+            map_case(
+                case.data,
+                case.is_us_case,
+                case.indexes,
+                _worker_steps,
+                _worker_context,
+            ),
+        )
+        for case in shard
+    ]
+    after = _worker_steps.concepts.stats()
+    return mappings, ConceptResolverStats(
+        hits=after.hits - before.hits,
+        misses=after.misses - before.misses,
+        refetches=after.refetches - before.refetches,
+        coalesced=after.coalesced - before.coalesced,
+    )
+
+
+def map_cases_in_shards(
+    data: LitigationType,
+    context: LitigationContext,
+    workers: int,
+    index: LitigationIndex | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Maps the litigation cases like `map_cases`, in shards across worker processes.
+
+    Each worker maps whole cases, so everything a case records stays with it, and the
+    mapped cases are put back in their original order before being replayed into the
+    context. The output, failures, skipped ids and error log are therefore the same as
+    mapping the cases serially: event numbering is counted per family and a family
+    belongs to a single case.
+
+    Each worker resolves concepts against its own copy of the lookup table, so a
+    concept missing from the table may be refetched once per worker.
+
+    :param LitigationType data: The litigation data, with the collections already
+        mapped into the context's case bundles.
+    :param LitigationContext context: The context of the litigation project import.
+    :param int workers: The number of worker processes to map the cases with.
+    :param LitigationIndex | None index: The index of the litigation records, built
+        from the data if not given.
+    :return dict[str, list[dict[str, Any]]]: The litigation families, documents and
+        events.
+    """
+    steps = prepare_case_mapping(data, context, index)
+    us_cases = data["families"].get("us_cases", [])
+    global_cases = data["families"].get("global_cases", [])
+    us_indexes, global_indexes = get_case_indexes(len(us_cases), len(global_cases))
+
+    cases = [
+        ShardedCase(True, position, indexes, case)
+        for position, (case, indexes) in enumerate(
+            zip(us_cases, us_indexes, strict=True)
+        )
+    ] + [
+        ShardedCase(False, position, indexes, case)
+        for position, (case, indexes) in enumerate(
+            zip(global_cases, global_indexes, strict=True)
+        )
+    ]
+    shards = shard_cases(cases, workers)
+
+    # The workers only look case bundles up, so the rest of the index stays behind
+    worker_steps = replace(steps, index=LitigationIndex(bundles=steps.index.bundles))
+    worker_context = replace(
+        context, failures=[], skipped_families=[], skipped_documents=[]
+    )
+
+    us_mappings: list[CaseMapping | None] = [None] * len(us_cases)
+    global_mappings: list[CaseMapping | None] = [None] * len(global_cases)
+    concept_stats = ConceptResolverStats(hits=0, misses=0, refetches=0, coalesced=0)
+
+    if shards:
+        # Spawned rather than forked, as the parent may hold locks in other threads
+        with ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(worker_steps, worker_context),
+        ) as executor:
+            for mappings, stats in executor.map(_map_shard, shards):
+                for is_us_case, position, mapping in mappings:
+                    if is_us_case:
+                        us_mappings[position] = mapping
+                    else:
+                        global_mappings[position] = mapping
+                concept_stats = ConceptResolverStats(
+                    hits=concept_stats.hits + stats.hits,
+                    misses=concept_stats.misses + stats.misses,
+                    refetches=concept_stats.refetches + stats.refetches,
+                    coalesced=concept_stats.coalesced + stats.coalesced,
+                )
+
+    return assemble_cases(
+        [mapping for mapping in us_mappings if mapping is not None],
+        [mapping for mapping in global_mappings if mapping is not None],
+        steps,
+        context,
+        concept_stats,
+    )
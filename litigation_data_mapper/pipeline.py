@@ -0,0 +1,302 @@
+import json
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from itertools import chain
+from typing import IO, Any
+
+import click
+
+from litigation_data_mapper.data_sources import LitigationDataSource
+from litigation_data_mapper.datatypes import LitigationContext
+from litigation_data_mapper.extract_concepts import taxonomies as concept_taxonomies
+from litigation_data_mapper.fetch_litigation_data import (
+    CASE_FIELDS,
+    find_referenced_media_ids,
+)
+from litigation_data_mapper.litigation_index import LitigationIndex
+from litigation_data_mapper.parsers.case import (
+    StepLog,
+    get_case_indexes,
+    get_case_mapping_steps,
+    map_case,
+    replay_case_logs,
+)
+from litigation_data_mapper.parsers.collection import map_collections
+
+
+class RecordSpool:
+    """Records spooled to a temporary file as JSON lines, read back in order.
+
+    Spooled records cost disk rather than memory, so a corpus of any size can be
+    streamed through the pipeline with only the record being worked on in memory.
+    """
+
+    def __init__(self):
+        self._file: IO[bytes] = tempfile.TemporaryFile()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        self._file.flush()
+        self._file.seek(0)
+        # Lines are split on newlines alone, which JSON always escapes in strings
+        for line in self._file:
+            yield json.loads(line)
+        self._file.seek(0, 2)
+
+    def __enter__(self) -> "RecordSpool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def append(self, record: dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+        self._file.write(b"\n")
+        self._count += 1
+
+    def extend(self, records: Iterable[dict[str, Any]]) -> None:
+        for record in records:
+            self.append(record)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def normalise_case(case: dict[str, Any]) -> dict[str, Any]:
+    """Keeps only the fields of a case the parsers read.
+
+    Cases fetched from the API only hold these already, cases read from a snapshot
+    hold every field.
+
+    :param dict[str, Any] case: The case.
+    :return dict[str, Any]: The case with only the fields the parsers read.
+    """
+    return {field: case[field] for field in CASE_FIELDS if field in case}
+
+
+def spool_cases(
+    cases: Iterable[dict[str, Any]],
+    spool: RecordSpool,
+    concept_ids: dict[str, set[int]],
+    media_ids: dict[int, None] | None = None,
+) -> None:
+    """Normalises cases into a spool, noting the concepts and media they refer to.
+
+    :param Iterable[dict[str, Any]] cases: The cases.
+    :param RecordSpool spool: The spool to write the cases to.
+    :param dict[str, set[int]] concept_ids: The ids of the concepts referred to by
+        taxonomy, added to as the cases are spooled.
+    :param dict[int, None] | None media_ids: The ids of the media files referred to,
+        in the order they are first referred to, added to as the cases are spooled
+        if given.
+    """
+    for case in cases:
+        case = normalise_case(case)
+        note_concept_ids(case, concept_ids)
+        if media_ids is not None:
+            media_ids.update(dict.fromkeys(find_referenced_media_ids([case])))
+        spool.append(case)
+
+
+def note_concept_ids(record: dict[str, Any], concept_ids: dict[str, set[int]]) -> None:
+    """Notes the ids of the concepts a case or case bundle refers to.
+
+    :param dict[str, Any] record: The case or case bundle.
+    :param dict[str, set[int]] concept_ids: The ids of the concepts referred to by
+        taxonomy, added to.
+    """
+    for taxonomy in concept_taxonomies:
+        ids = record.get(taxonomy)
+        if ids:
+            concept_ids.setdefault(taxonomy, set()).update(ids)
+
+
+def collect_document_pdf_urls(
+    document_media: Iterable[dict[str, Any]],
+) -> tuple[dict[int, str], int]:
+    """Keeps the public source url of each media file, rather than the whole record.
+
+    Like `LitigationIndex`, the first media record with each id is the one kept.
+
+    :param Iterable[dict[str, Any]] document_media: The document media.
+    :return tuple[dict[int, str], int]: The source urls by media id, and the number of
+        media records streamed.
+    """
+    urls: dict[int, str | None] = {}
+    count = 0
+    for media in document_media:
+        count += 1
+        media_id = media.get("id")
+        if isinstance(media_id, int) and media_id not in urls:
+            source_url = media.get("source_url")
+            urls[media_id] = (
+                source_url.replace("admin.", "") if source_url is not None else None
+            )
+    return {media_id: url for media_id, url in urls.items() if url is not None}, count
+
+
+def write_json_sections(
+    output: IO[str], sections: dict[str, Iterable[dict[str, Any]]]
+) -> dict[str, int]:
+    """Writes lists of records as a JSON object, a record at a time.
+
+    The output is the same as `json.dump(sections, output, ensure_ascii=False,
+    indent=2)` would write, without holding every record in memory.
+
+    :param IO[str] output: The file to write to.
+    :param dict[str, Iterable[dict[str, Any]]] sections: The records of each key.
+    :return dict[str, int]: The number of records written for each key.
+    """
+    counts = {}
+    output.write("{")
+    for section_number, (key, records) in enumerate(sections.items()):
+        if section_number:
+            output.write(",")
+        output.write(f"\n  {json.dumps(key, ensure_ascii=False)}: [")
+
+        count = 0
+        for record in records:
+            if count:
+                output.write(",")
+            # JSON escapes newlines in strings, so every newline is indentation
+            record_json = json.dumps(record, ensure_ascii=False, indent=2)
+            output.write("\n    " + record_json.replace("\n", "\n    "))
+            count += 1
+
+        output.write("\n  ]" if count else "]")
+        counts[key] = count
+    output.write("\n}" if sections else "}")
+    return counts
+
+
+def stream_litigation_data(
+    source: LitigationDataSource,
+    output_file: str,
+    context: LitigationContext,
+    selective_media: bool = False,
+) -> dict[str, int]:
+    """Maps the litigation data to the output file, streaming it a case at a time.
+
+    The pipeline runs fetch → normalise → map → write:
+
+    - the cases are fetched and normalised into spools on disk, noting the media
+      files and concepts they refer to
+    - the case bundles, jurisdictions, concepts and the source urls of the media are
+      kept in memory, as small side tables
+    - the cases are read back and mapped one at a time, with the families, documents
+      and events they map to spooled on disk
+    - the spooled entities are written to the output file
+
+    Peak memory therefore grows with the side tables, not with the number of cases.
+    The output file, failures and error log are the same as mapping the data loaded
+    by `source.load` with `wrangle_data` and dumping it with `dump_output`.
+
+    :param LitigationDataSource source: Where to stream the litigation data from.
+    :param str output_file: The output filename.
+    :param LitigationContext context: The context of the litigation project import.
+    :param bool selective_media: Whether to fetch only the media files referred to by
+        the cases.
+    :return dict[str, int]: The number of collections, families, documents and events
+        mapped.
+    """
+    modified_after = context.last_import_date if context.get_modified_data else None
+
+    with ExitStack() as stack:
+        us_cases, global_cases, families, us_documents, global_documents, events = (
+            stack.enter_context(RecordSpool()) for _ in range(6)
+        )
+
+        # Fetch and normalise
+        concept_ids: dict[str, set[int]] = {}
+        media_ids: dict[int, None] | None = {} if selective_media else None
+        spool_cases(
+            source.iter_records("us_cases", modified_after),
+            us_cases,
+            concept_ids,
+            media_ids,
+        )
+        spool_cases(
+            source.iter_records("global_cases", modified_after),
+            global_cases,
+            concept_ids,
+            media_ids,
+        )
+
+        # The side tables
+        bundles = list(source.iter_records("case_bundles"))
+        for bundle in bundles:
+            note_concept_ids(bundle, concept_ids)
+        index = LitigationIndex.from_records(
+            bundles=bundles, jurisdictions=source.iter_records("jurisdictions")
+        )
+        document_pdf_urls, media_count = collect_document_pdf_urls(
+            source.iter_media(list(media_ids) if media_ids is not None else None)
+        )
+        concepts = source.load_concepts(concept_ids)
+        click.echo(
+            f"✅ Streamed {len(us_cases)} US cases and {len(global_cases)} global cases."
+        )
+
+        # Map, one case at a time
+        collections = map_collections(bundles, context)
+        steps = get_case_mapping_steps(
+            context,
+            concepts,
+            index,
+            us_cases=us_cases,
+            global_cases=global_cases,
+            document_media=range(media_count),
+            document_pdf_urls=document_pdf_urls,
+        )
+        us_indexes, global_indexes = get_case_indexes(len(us_cases), len(global_cases))
+        family_logs: list[StepLog] = []
+        document_logs: dict[bool, list[StepLog]] = {True: [], False: []}
+        event_logs: list[StepLog] = []
+        for is_us_case, cases, indexes, documents in (
+            (True, us_cases, us_indexes, us_documents),
+            (False, global_cases, global_indexes, global_documents),
+        ):
+            for case, case_indexes in zip(cases, indexes, strict=True):
+                mapping = map_case(case, is_us_case, case_indexes, steps, context)
+                if mapping.family is not None:
+                    families.append(mapping.family)
+                documents.extend(mapping.documents)
+                events.extend(mapping.events)
+                # Only the steps that recorded something are kept for the replay
+                if mapping.family_log:
+                    family_logs.append(mapping.family_log)
+                if mapping.document_log:
+                    document_logs[is_us_case].append(mapping.document_log)
+                if mapping.event_log:
+                    event_logs.append(mapping.event_log)
+                # Events are numbered per family, and each family is mapped from a
+                # single case, so the counts of the case just mapped are done with
+                if steps.event_family_counter is not None:
+                    steps.event_family_counter.clear()
+
+        replay_case_logs(
+            family_logs,
+            document_logs[False] + document_logs[True],
+            event_logs,
+            steps,
+            context,
+            steps.concepts.stats(),
+        )
+
+        # Write, documents map the global cases first
+        if context.debug:
+            click.echo(f"📝 Output file {click.format_filename(output_file)}")
+        with open(output_file, "w+", encoding="utf-8") as f:
+            return write_json_sections(
+                f,
+                {
+                    "collections": collections,
+                    "families": families,
+                    "documents": chain(global_documents, us_documents),
+                    "events": events,
+                },
+            )
@@ -0,0 +1,259 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Responses telling us to slow down, both pause every caller of the host
+RATE_LIMITED_STATUSES = (429, 503)
+
+# Only requests that are safe to repeat are sent again after being throttled, a
+# throttled POST may still have been acted on
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+RATE_LIMIT_PER_SECOND = float(os.getenv("RATE_LIMIT_PER_SECOND", "10"))
+RATE_LIMIT_MAX_CONCURRENCY = int(os.getenv("RATE_LIMIT_MAX_CONCURRENCY", "8"))
+
+# How long to pause when a host throttles us without saying for how long, and the
+# longest we will honour a Retry-After header for
+DEFAULT_PAUSE_SECONDS = 5.0
+MAX_PAUSE_SECONDS = 300.0
+
+_limiters: dict[str, "RateLimiter"] = {}
+_limiters_lock = threading.Lock()
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimiterStats:
+    requests: int
+    throttled: int
+    concurrency_limit: int
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header, given either in seconds or as an HTTP date.
+
+    :param str | None value: The value of the Retry-After header.
+    :return float | None: The number of seconds to wait, or None if the header is
+        missing or invalid.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RateLimiter:
+    """A token bucket with adaptive concurrency, shared by every caller of a host.
+
+    Requests are started at no more than `rate_per_second` (with bursts of up to
+    `burst`) and no more than the current concurrency limit are in flight at once.
+    The concurrency limit grows by one for every window of successful requests and
+    halves whenever the host answers 429 or 503, down to `min_concurrency`. Those
+    responses also pause every caller for as long as the Retry-After header asks.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = RATE_LIMIT_PER_SECOND,
+        burst: int | None = None,
+        max_concurrency: int = RATE_LIMIT_MAX_CONCURRENCY,
+        min_concurrency: int = 1,
+    ):
+        self.rate_per_second = rate_per_second
+        self.burst = burst or max(int(rate_per_second), 1)
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+
+        self._condition = threading.Condition()
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._concurrency_limit = float(max_concurrency)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._requests = 0
+        self._throttled = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(int(self._concurrency_limit), self.min_concurrency)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._tokens = min(self._tokens + elapsed * self.rate_per_second, self.burst)
+        self._last_refill = now
+
+    def acquire(self) -> None:
+        """Block until a request may be started."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._in_flight >= self.concurrency_limit:
+                    # Woken up by release once a request in flight completes
+                    wait = None
+                elif self._tokens < 1:
+                    wait = (1 - self._tokens) / self.rate_per_second
+                else:
+                    self._tokens -= 1
+                    self._in_flight += 1
+                    self._requests += 1
+                    return
+
+                self._condition.wait(timeout=wait)
+
+    def release(
+        self, status_code: int | None = None, retry_after: str | None = None
+    ) -> None:
+        """Record the outcome of a request started with `acquire`.
+
+        :param int | None status_code: The status code of the response, or None if no
+            response was received.
+        :param str | None retry_after: The Retry-After header of the response.
+        """
+        with self._condition:
+            self._in_flight -= 1
+
+            if status_code in RATE_LIMITED_STATUSES:
+                self._throttled += 1
+                # A Retry-After of 0 asks for no pause at all
+                requested_pause = parse_retry_after(retry_after)
+                pause = min(
+                    (
+                        requested_pause
+                        if requested_pause is not None
+                        else DEFAULT_PAUSE_SECONDS
+                    ),
+                    MAX_PAUSE_SECONDS,
+                )
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+                self._concurrency_limit = max(
+                    self._concurrency_limit / 2, self.min_concurrency
+                )
+            elif status_code is not None and status_code < 400:
+                self._concurrency_limit = min(
+                    self._concurrency_limit + 1 / self._concurrency_limit,
+                    self.max_concurrency,
+                )
+
+            self._condition.notify_all()
+
+    def stats(self) -> RateLimiterStats:
+        with self._condition:
+            return RateLimiterStats(
+                requests=self._requests,
+                throttled=self._throttled,
+                concurrency_limit=self.concurrency_limit,
+            )
+
+
+def get_rate_limiter(url: str) -> RateLimiter:
+    """Return the rate limiter shared by every request made to the host of a URL.
+
+    :param str url: A URL on the host.
+    :return RateLimiter: The host's rate limiter.
+    """
+    host = urlsplit(url).netloc
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = RateLimiter()
+        return _limiters[host]
+
+
+def reset_rate_limiters() -> None:
+    """Forget every rate limiter, along with any pause or backoff they are under."""
+    with _limiters_lock:
+        _limiters.clear()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """An HTTP adapter sending every request through the host's shared rate limiter.
+
+    A 429 or 503 response pauses every caller of the host, then the request is sent
+    again, up to `rate_limit_retries` times. Requests that are not idempotent, such as
+    a POST, are never sent again.
+    """
+
+    def __init__(self, *args: Any, rate_limit_retries: int = 5, **kwargs: Any):
+        self.rate_limit_retries = rate_limit_retries
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args, **kwargs) -> requests.Response:  # type: ignore[override]
+        limiter = get_rate_limiter(request.url or "")
+
+        attempt = 0
+        while True:
+            limiter.acquire()
+            status_code = None
+            retry_after = None
+            try:
+                response = super().send(request, *args, **kwargs)
+                status_code = response.status_code
+                retry_after = response.headers.get("Retry-After")
+            finally:
+                limiter.release(status_code, retry_after)
+
+            if (
+                status_code not in RATE_LIMITED_STATUSES
+                or request.method not in IDEMPOTENT_METHODS
+                or attempt >= self.rate_limit_retries
+            ):
+                return response
+
+            response.close()
+            attempt += 1
+
+
+def get_rate_limited_session() -> requests.Session:
+    """Return the process-wide session used for one-off rate limited requests.
+
+    The session is created on first use and shared between threads, so connections
+    are kept alive and reused across requests to the same host.
+
+    :return requests.Session: The shared session.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.mount("https://", RateLimitedAdapter())
+        return _session
+
+
+def close_rate_limited_session() -> None:
+    """Close the shared session of one-off requests, if one exists."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def rate_limited_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Make a one-off request through the shared rate limiter of the URL's host.
+
+    :param str method: The HTTP method.
+    :param str url: The URL to request.
+    :return requests.Response: The response.
+    """
+    return get_rate_limited_session().request(method, url, **kwargs)
@@ -0,0 +1,180 @@
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+import click
+import requests
+
+T = TypeVar("T")
+
+# The nightly run as a whole, and each endpoint within it, must finish within these
+WORDPRESS_RUN_BUDGET_SECONDS = float(os.getenv("WORDPRESS_RUN_BUDGET_SECONDS", "7200"))
+WORDPRESS_ENDPOINT_BUDGET_SECONDS = float(
+    os.getenv("WORDPRESS_ENDPOINT_BUDGET_SECONDS", "1800")
+)
+
+# Server errors worth trying again, any other 4xx or 5xx response fails straight away
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class DeadlineExceeded(requests.Timeout):
+    """Raised when a request cannot be made or retried within its deadline."""
+
+
+@dataclass(frozen=True, slots=True)
+class Deadline:
+    """The point in time, on the monotonic clock, some work has to finish by."""
+
+    expires_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Create a deadline the given number of seconds from now.
+
+        :param float seconds: The budget in seconds.
+        :return Deadline: The deadline.
+        """
+        return cls(expires_at=time.monotonic() + seconds)
+
+    def within(self, seconds: float) -> "Deadline":
+        """Create a deadline for part of this work, never later than this deadline.
+
+        :param float seconds: The budget for the part in seconds.
+        :return Deadline: The earlier of this deadline and `seconds` from now.
+        """
+        return Deadline(expires_at=min(self.expires_at, time.monotonic() + seconds))
+
+    def remaining(self) -> float:
+        """The number of seconds left before the deadline, zero if it has passed."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """How often, and how patiently, a single request is retried.
+
+    Retries are counted per request, so one slow page cannot use up the retries of
+    every page after it. Every backoff and request timeout is capped by the time left
+    before the deadline.
+    """
+
+    retries: int = 5
+    backoff_factor: float = 1.0
+    max_backoff: float = 60.0
+    timeout: float = 10.0
+
+    def backoff(self, retry: int) -> float:
+        """The number of seconds to wait before the given retry.
+
+        :param int retry: The retry about to be made, starting at 1.
+        :return float: The backoff in seconds.
+        """
+        return min(self.backoff_factor * 2 ** (retry - 1), self.max_backoff)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class RetryStats:
+    """The retries made, and time spent waiting between them, across a run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries: dict[str, int] = {}
+        self.sleep_seconds = 0.0
+
+    def record_retry(self, description: str, slept: float) -> None:
+        with self._lock:
+            self.retries[description] = self.retries.get(description, 0) + 1
+            self.sleep_seconds += slept
+
+    @property
+    def total_retries(self) -> int:
+        with self._lock:
+            return sum(self.retries.values())
+
+
+_retry_stats = RetryStats()
+
+
+def get_retry_stats() -> RetryStats:
+    """Return the retry statistics collected since they were last reset."""
+    return _retry_stats
+
+
+def reset_retry_stats() -> None:
+    """Start collecting retry statistics afresh."""
+    global _retry_stats
+    _retry_stats = RetryStats()
+
+
+def log_retry_stats() -> None:
+    """Echo the requests that needed retrying and the time spent backing off."""
+    stats = get_retry_stats()
+    click.echo(
+        f"🔁 Made {stats.total_retries} retries across {len(stats.retries)} requests, "
+        f"sleeping for {stats.sleep_seconds:.1f}s."
+    )
+    for description, retries in sorted(stats.retries.items()):
+        click.echo(f"   {description}: {retries} retries")
+
+
+def is_retryable(error: requests.RequestException) -> bool:
+    """Whether a failed request is worth trying again.
+
+    :param requests.RequestException error: The error the request failed with.
+    :return bool: True for connection errors, timeouts and retryable status codes.
+    """
+    if isinstance(error, DeadlineExceeded):
+        return False
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in RETRY_STATUSES
+    return False
+
+
+def call_with_retries(
+    request: Callable[[float], T],
+    description: str,
+    deadline: Deadline,
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> T:
+    """Make a request, retrying it with exponential backoff within a deadline.
+
+    :param Callable[[float], T] request: Makes the request, given the timeout to use.
+    :param str description: What is being requested, used to report retries.
+    :param Deadline deadline: When to give up retrying.
+    :param RetryPolicy policy: How often and how patiently to retry.
+    :raise DeadlineExceeded: If the deadline passes before the request succeeds.
+    :raise requests.RequestException: If the request fails and cannot be retried.
+    :return T: The result of the request.
+    """
+    retry = 0
+    while True:
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Ran out of time requesting {description}")
+
+        try:
+            return request(min(policy.timeout, remaining))
+        except requests.RequestException as e:
+            if retry >= policy.retries or not is_retryable(e):
+                raise
+
+            retry += 1
+            backoff = min(policy.backoff(retry), deadline.remaining())
+            if backoff <= 0:
+                raise DeadlineExceeded(
+                    f"Ran out of time requesting {description}"
+                ) from e
+
+            click.echo(
+                f"🔁 Retrying {description} in {backoff:.1f}s "
+                f"({retry}/{policy.retries}): {e}"
+            )
+            time.sleep(backoff)
+            get_retry_stats().record_retry(description, backoff)
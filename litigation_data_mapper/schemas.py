@@ -0,0 +1,219 @@
+import hashlib
+import json
+import os
+from functools import cache
+from typing import Annotated, Any, Required
+
+import click
+import requests
+from pydantic import BeforeValidator, TypeAdapter, ValidationError
+
+# Pydantic only validates TypedDicts from typing_extensions before Python 3.12
+from typing_extensions import TypedDict
+
+# Setting this decodes every WordPress payload through the schemas below
+WORDPRESS_TYPED_DECODING_ENV = "WORDPRESS_TYPED_DECODING"
+
+# The value of an ACF field the parsers read as a scalar. ACF sends `false` for some
+# empty fields, so booleans are allowed alongside the strings and numbers.
+AcfScalar = str | int | float | bool | None
+
+# The ids of an ACF relationship field, kept as they were sent. ACF sends `false` or
+# an empty string for an empty relationship, which must not reject the whole record.
+AcfIds = list[Any] | AcfScalar
+
+
+class MalformedPayload(requests.RequestException):
+    """Raised when a WordPress payload is not a JSON list of records."""
+
+
+def _empty_acf_as_object(value: Any) -> Any:
+    # ACF sends an empty list rather than an empty object for a record without any
+    # custom fields
+    return {} if value == [] else value
+
+
+EmptyAcfAsObject = BeforeValidator(_empty_acf_as_object)
+
+
+class WordPressRecord(TypedDict, total=False):
+    """A record, or part of a record, holding only the fields the parsers read.
+
+    Records are validated straight into dicts. Every other field is dropped while
+    decoding, and fields missing from the payload are left out, so the parsers see the
+    same missing keys as they would in the raw record.
+    """
+
+
+class Rendered(WordPressRecord, total=False):
+    rendered: str | None
+
+
+class UsCaseDocument(WordPressRecord, total=False):
+    ccl_document_type: AcfScalar
+    ccl_filing_date: AcfScalar
+    ccl_file: AcfScalar
+    ccl_document_headline: AcfScalar
+    ccl_document_summary: AcfScalar
+    ccl_outcome: AcfScalar
+
+
+class UsCaseAcf(WordPressRecord, total=False):
+    ccl_case_bundle: AcfIds
+    ccl_docket_number: AcfScalar
+    ccl_entity: AcfScalar
+    ccl_filing_year_for_action: AcfScalar
+    ccl_state: AcfScalar
+    ccl_core_object: AcfScalar
+    ccl_case_documents: list[UsCaseDocument] | AcfScalar
+
+
+class GlobalCaseDocument(WordPressRecord, total=False):
+    ccl_nonus_document_type: AcfScalar
+    ccl_nonus_filing_date: AcfScalar
+    ccl_nonus_file: AcfScalar
+    ccl_nonus_document_summary: AcfScalar
+
+
+class GlobalCaseAcf(WordPressRecord, total=False):
+    ccl_nonus_case_name: AcfScalar
+    ccl_nonus_summary: AcfScalar
+    ccl_nonus_reporter_info: AcfScalar
+    ccl_nonus_filing_year_for_action: AcfScalar
+    ccl_nonus_status: AcfScalar
+    ccl_nonus_core_object: AcfScalar
+    ccl_nonus_case_country: AcfScalar
+    ccl_nonus_case_documents: list[GlobalCaseDocument] | AcfScalar
+
+
+class CaseBundleAcf(WordPressRecord, total=False):
+    ccl_cases: AcfIds
+    ccl_core_object: AcfScalar
+    ccl_case_categories: AcfIds
+    ccl_principal_law: AcfIds
+
+
+class Post(WordPressRecord, total=False):
+    id: Required[int]
+    type: str | None
+    slug: str | None
+    modified_gmt: str | None
+    title: Rendered | None
+    # The ids of the concepts a case or case bundle refers to, by taxonomy
+    case_category: list[int] | None
+    entity: list[int] | None
+    principal_law: list[int] | None
+    jurisdiction: list[int] | None
+    non_us_principal_law: list[int] | None
+    non_us_case_category: list[int] | None
+
+
+class UsCase(Post, total=False):
+    acf: Annotated[UsCaseAcf | None, EmptyAcfAsObject]
+
+
+class GlobalCase(Post, total=False):
+    acf: Annotated[GlobalCaseAcf | None, EmptyAcfAsObject]
+
+
+class CaseBundle(Post, total=False):
+    acf: Annotated[CaseBundleAcf | None, EmptyAcfAsObject]
+
+
+class Media(WordPressRecord, total=False):
+    id: Required[int]
+    modified_gmt: str | None
+    source_url: str | None
+
+
+class TaxonomyTerm(WordPressRecord):
+    id: int
+    name: str
+    parent: int
+
+
+# The schema of each post type, every other endpoint is a taxonomy
+POST_TYPE_SCHEMAS: dict[str, type[WordPressRecord]] = {
+    "case": UsCase,
+    "non_us_case": GlobalCase,
+    "case_bundle": CaseBundle,
+    "media": Media,
+}
+
+
+class RecordDecoder:
+    """Decodes WordPress payloads straight from JSON into the records of a schema.
+
+    A page is validated as a whole while it is parsed, without first building a dict
+    of every field of every record. Only if that fails is each record validated on its
+    own, so the malformed records can be rejected and reported while the rest of the
+    page is kept.
+    """
+
+    def __init__(self, schema: type[WordPressRecord]):
+        self.schema = schema
+        self._record = TypeAdapter(schema)
+        self._page = TypeAdapter(list[schema])  # type: ignore[valid-type]
+        # Pages decoded through different schemas hold different fields, so the
+        # schema is part of where decoded pages are cached and checkpointed
+        json_schema = json.dumps(self._page.json_schema(), sort_keys=True)
+        digest = hashlib.sha256(json_schema.encode("utf-8")).hexdigest()[:12]
+        self.key = f"{schema.__name__}-{digest}"
+
+    def decode_page(self, payload: bytes | str, source: str) -> list[dict[str, Any]]:
+        """Decode a page of records.
+
+        :param bytes | str payload: The JSON payload of the page.
+        :param str source: Where the payload came from, used to report rejections.
+        :raise MalformedPayload: If the payload is not a JSON list.
+        :return list[dict[str, Any]]: The valid records, holding only the fields of
+            the schema.
+        """
+        try:
+            return self._page.validate_json(payload)
+        except ValidationError:
+            return self._decode_each(payload, source)
+
+    def _decode_each(self, payload: bytes | str, source: str) -> list[dict[str, Any]]:
+        try:
+            data = json.loads(payload)
+        except ValueError as e:
+            raise MalformedPayload(f"Invalid JSON from {source}: {e}") from e
+        if not isinstance(data, list):
+            raise MalformedPayload(f"Expected a list of records from {source}")
+
+        records = []
+        for item in data:
+            try:
+                records.append(self._record.validate_python(item))
+            except ValidationError as e:
+                record_id = item.get("id") if isinstance(item, dict) else None
+                fields = [".".join(map(str, error["loc"])) for error in e.errors()]
+                click.echo(
+                    f"🛑 Rejected malformed {self.schema.__name__} record {record_id} "
+                    f"from {source}, invalid fields: {', '.join(fields)}",
+                    err=True,
+                )
+        return records
+
+
+def typed_decoding_enabled() -> bool:
+    """Whether WordPress payloads are decoded through the schemas."""
+    return os.getenv(WORDPRESS_TYPED_DECODING_ENV, "").lower() in ("1", "true", "yes")
+
+
+@cache
+def _decoder_for(schema: type[WordPressRecord]) -> RecordDecoder:
+    return RecordDecoder(schema)
+
+
+def get_record_decoder(endpoint: str) -> RecordDecoder | None:
+    """Return the decoder for the records of an endpoint, if typed decoding is enabled.
+
+    :param str endpoint: The name of the post type or taxonomy, or its API URL.
+    :return RecordDecoder | None: The decoder, or None to decode payloads in full.
+    """
+    if not typed_decoding_enabled():
+        return None
+    name = endpoint.rstrip("/").rsplit("/", 1)[-1]
+    return _decoder_for(POST_TYPE_SCHEMAS.get(name, TaxonomyTerm))
@@ -1,89 +1,640 @@
+import os
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
 from typing import Any
 
 import click
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
+from requests.adapters import DEFAULT_POOLSIZE
 
+from litigation_data_mapper.checkpoints import (
+    CheckpointStore,
+    PageCheckpoint,
+    get_default_checkpoint_store,
+)
+from litigation_data_mapper.page_cache import (
+    CachedPage,
+    PageCache,
+    get_default_page_cache,
+)
+from litigation_data_mapper.rate_limit import RateLimitedAdapter
+from litigation_data_mapper.retry_policy import (
+    DEFAULT_RETRY_POLICY,
+    WORDPRESS_ENDPOINT_BUDGET_SECONDS,
+    WORDPRESS_RUN_BUDGET_SECONDS,
+    Deadline,
+    RetryPolicy,
+    call_with_retries,
+)
+from litigation_data_mapper.schemas import RecordDecoder
+from litigation_data_mapper.wordpress_paging import (
+    dedupe_by_id,
+    page_params,
+    take_modified_records,
+)
 
-def create_retry_session(
-    retries: int = 5, backoff_factor: float = 5
-) -> requests.Session:
-    """Create a requests session with automatic retries.
+# The WordPress REST API every endpoint is fetched from. Point this at a local stand-in,
+# such as the one in `fake_wordpress`, to run without the network.
+WORDPRESS_BASE_URL = os.getenv(
+    "WORDPRESS_BASE_URL", "https://admin.climatecasechart.com/wp-json/wp/v2"
+).rstrip("/")
 
-    :param int retries: Number of retry attempts before failing.
-    :param float backoff_factor: Delay multiplier for exponential backoff.
-    :return requests.Session: A requests session with retry handling.
+# Maximum number of keep-alive connections held open to the WordPress host by the
+# shared session. This should be at least the number of threads fetching at once.
+WORDPRESS_POOL_SIZE = int(os.getenv("WORDPRESS_POOL_SIZE", "16"))
+
+# The most records WordPress returns for a single request, and so the most ids that can
+# be fetched at once with the `include` parameter
+INCLUDE_BATCH_SIZE = 100
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class SessionStats:
+    connections_opened: int
+    requests_sent: int
+
+    @property
+    def connections_reused(self) -> int:
+        return max(self.requests_sent - self.connections_opened, 0)
+
+
+def create_session(pool_maxsize: int = DEFAULT_POOLSIZE) -> requests.Session:
+    """Create a requests session sending every request through the host's rate limiter.
+
+    The session makes no retries of its own, each request is retried on its own within
+    a deadline by `call_with_retries` instead.
+
+    :param int pool_maxsize: Maximum number of connections to keep open per host.
+    :return requests.Session: A requests session.
     """
     session = requests.Session()
-    retry = Retry(
-        total=retries,
-        read=retries,
-        connect=retries,
-        backoff_factor=backoff_factor,
-        status_forcelist=[429, 500, 502, 503, 504],
-    )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = RateLimitedAdapter(pool_maxsize=pool_maxsize, rate_limit_retries=0)
     session.mount("https://", adapter)
+    session.mount("http://", adapter)
     return session
 
 
-def fetch_word_press_data(endpoint: str, per_page: int = 100) -> list[dict[str, Any]]:
-    """Fetch paginated data from a given API endpoint.
+def get_session() -> requests.Session:
+    """Return the process-wide session used for all WordPress requests.
 
-    :param str endpoint: The API URL to fetch data from.
-    :param int per_page: Number of results per page (default: 100).
-    :return Optional[list[dict]]: A list of data records if successful, or None if an error occurs.
+    The session is created on first use and shared between threads, so connections to
+    the WordPress host are kept alive and reused instead of paying a new TCP and TLS
+    handshake for every request.
+
+    :return requests.Session: The shared session.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session(pool_maxsize=WORDPRESS_POOL_SIZE)
+        return _session
+
+
+def configure_session(pool_size: int) -> requests.Session:
+    """Replace the shared session with one holding up to `pool_size` connections.
+
+    :param int pool_size: Maximum number of connections to keep open to the host.
+    :return requests.Session: The new shared session.
     """
-    all_data = []
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = create_session(pool_maxsize=pool_size)
+        return _session
+
+
+def close_session() -> None:
+    """Close the shared session and its pooled connections, if one exists."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def get_session_stats() -> SessionStats:
+    """Report how many connections the shared session has opened and reused.
+
+    :return SessionStats: The number of connections opened and requests sent across
+        every connection pool held by the shared session.
+    """
+    connections_opened = 0
+    requests_sent = 0
+
+    with _session_lock:
+        session = _session
+
+    if session is None:
+        return SessionStats(connections_opened=0, requests_sent=0)
+
+    # The same adapter may be mounted on several prefixes, only count it once
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+        if pools is None:
+            continue
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            connections_opened += pool.num_connections
+            requests_sent += pool.num_requests
+
+    return SessionStats(
+        connections_opened=connections_opened, requests_sent=requests_sent
+    )
+
+
+def log_session_stats() -> None:
+    """Echo the connection reuse statistics of the shared session."""
+    stats = get_session_stats()
+    click.echo(
+        f"🔌 WordPress session sent {stats.requests_sent} requests over "
+        f"{stats.connections_opened} connections "
+        f"({stats.connections_reused} reused)."
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _PageFetcher:
+    """Fetches single pages of results from a WordPress endpoint.
+
+    When a cache is given the validators of the cached copy of the page are sent with
+    the request, and a 304 Not Modified response is served from the cache.
+
+    When a checkpoint is given a page already checkpointed by an earlier, failed
+    attempt is resumed from instead of being fetched again, and every page fetched is
+    checkpointed.
+
+    Each page is retried on its own according to the retry policy, giving up once the
+    deadline for the endpoint has passed.
+
+    When a decoder is given pages are decoded through its schema rather than in full.
+    """
+
+    session: requests.Session
+    endpoint: str
+    deadline: Deadline
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY
+    cache: PageCache | None = None
+    checkpoint: PageCheckpoint | None = None
+    decoder: RecordDecoder | None = None
+
+    def fetch(self, params: dict[str, Any]) -> tuple[list[dict[str, Any]], int]:
+        """Fetch a single page of results.
+
+        :param dict[str, Any] params: The query parameters of the page to fetch.
+        :raise requests.RequestException: If the page could not be fetched.
+        :return tuple[list[dict[str, Any]], int]: The records on the page and the total
+            number of pages reported by WordPress.
+        """
+        page = params["page"]
+        checkpointed_page = self.checkpoint.get(page) if self.checkpoint else None
+        if checkpointed_page is not None:
+            click.echo(f"♻️ Resumed page {page} of {self.endpoint} from checkpoint")
+            return checkpointed_page
+
+        data, total_pages = call_with_retries(
+            lambda timeout: _request_page(
+                self.session, self.endpoint, params, self.cache, timeout, self.decoder
+            ),
+            f"{self.endpoint} page {page}",
+            self.deadline,
+            self.retry_policy,
+        )
+
+        if self.checkpoint:
+            self.checkpoint.put(page, data, total_pages)
+
+        return data, total_pages
+
+
+def _request_page(
+    session: requests.Session,
+    endpoint: str,
+    params: dict[str, Any],
+    cache: PageCache | None,
+    timeout: float,
+    decoder: RecordDecoder | None = None,
+) -> tuple[list[dict[str, Any]], int]:
+    # Pages decoded through a schema are cached apart from pages decoded in full
+    variant = decoder.key if decoder else None
+    cached_page = cache.get(endpoint, params, variant) if cache else None
+    headers = {}
+    if cached_page and cached_page.etag:
+        headers["If-None-Match"] = cached_page.etag
+    if cached_page and cached_page.last_modified:
+        headers["If-Modified-Since"] = cached_page.last_modified
+
+    with session.get(
+        endpoint, params=params, headers=headers, timeout=timeout
+    ) as response:
+        if cached_page and response.status_code == 304:
+            return cached_page.data, cached_page.total_pages
+
+        response.raise_for_status()
+        # We know that the word press endpoint provides details of the total
+        # pages in the headers, when iterating we will handle instances where this
+        # value does not exist
+        total_pages = int(response.headers.get("X-WP-TotalPages", 1))
+        data = (
+            decoder.decode_page(response.content, f"{endpoint} page {params['page']}")
+            if decoder
+            else response.json()
+        )
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        # Without a validator there is nothing to revalidate the page with next time
+        if cache and (etag or last_modified):
+            cache.put(
+                endpoint,
+                params,
+                CachedPage(
+                    etag=etag,
+                    last_modified=last_modified,
+                    total_pages=total_pages,
+                    data=data,
+                ),
+                variant,
+            )
+
+        return data, total_pages
+
+
+def _iter_pages_concurrently(
+    fetcher: _PageFetcher,
+    per_page: int,
+    max_workers: int,
+    fields: list[str] | None,
+) -> Iterator[list[dict[str, Any]]]:
+    data, total_pages = fetcher.fetch(page_params(1, per_page, fields=fields))
+    yield data
+
+    def fetch(page: int) -> list[dict[str, Any]]:
+        return fetcher.fetch(page_params(page, per_page, fields=fields))[0]
+
+    # Only a couple of pages per worker are requested ahead of the page being yielded,
+    # so a slow consumer does not end up holding the whole endpoint in memory
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    in_flight: deque[Future[list[dict[str, Any]]]] = deque()
+    pages = iter(range(2, total_pages + 1))
+    try:
+        for page in islice(pages, max_workers * 2):
+            in_flight.append(executor.submit(fetch, page))
+
+        while in_flight:
+            data = in_flight.popleft().result()
+            for page in islice(pages, 1):
+                in_flight.append(executor.submit(fetch, page))
+            yield data
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _iter_pages_sequentially(
+    fetcher: _PageFetcher, per_page: int, fields: list[str] | None
+) -> Iterator[list[dict[str, Any]]]:
     page = 1
     total_pages = 1
+    while page <= total_pages:
+        data, page_total = fetcher.fetch(page_params(page, per_page, fields=fields))
+        if page == 1:
+            total_pages = page_total
 
-    session = create_retry_session()
+        if not data:
+            break
 
-    click.echo(f"⏳ fetching from {endpoint}...")
+        yield data
+        page += 1
 
+
+def _iter_modified_pages(
+    fetcher: _PageFetcher,
+    per_page: int,
+    fields: list[str] | None,
+    modified_after: datetime,
+) -> Iterator[list[dict[str, Any]]]:
+    page = 1
+    total_pages = 1
     while page <= total_pages:
-        try:
-            with session.get(
-                endpoint,
-                params={
-                    "page": page,
-                    "per_page": per_page,
-                    "orderby": "id",
-                    "order": "desc",
-                },
-                timeout=10,
-            ) as response:
-                response.raise_for_status()
-                if page == 1:
-                    # We know that the word press endpoint provides details of the total
-                    # pages in the headers, when iterating we will handle instances where this
-                    # value does not exist
-                    total_pages = int(response.headers.get("X-WP-TotalPages", 1))
+        data, page_total = fetcher.fetch(
+            page_params(page, per_page, modified_after, fields)
+        )
+        if page == 1:
+            total_pages = page_total
+
+        modified_data, has_more = take_modified_records(data, modified_after)
+        if modified_data:
+            yield modified_data
+
+        if not has_more:
+            break
+
+        page += 1
+
+
+def iter_word_press_pages(
+    endpoint: str,
+    per_page: int = 100,
+    max_workers: int = 1,
+    session: requests.Session | None = None,
+    cache: PageCache | None = None,
+    modified_after: datetime | None = None,
+    fields: list[str] | None = None,
+    checkpoints: CheckpointStore | None = None,
+    deadline: Deadline | None = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    decoder: RecordDecoder | None = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """Fetch paginated data from a given API endpoint, yielding each page as it arrives.
 
-                data = response.json()
-                if not data:
-                    break
+    Pages are yielded in page order as soon as they are fetched, so downstream work can
+    start before the last page lands and only a few pages are held in memory at once.
 
-                all_data.extend(data)
-                page += 1
+    The first page is always fetched on its own to learn the total number of pages.
+    When `max_workers` is greater than one the remaining pages are fetched concurrently
+    and yielded in page order, with records deduped by id.
 
-        except requests.RequestException as e:
-            click.echo(f"❌ Error fetching data from {endpoint}: {e}", err=True)
-            return []
+    When `modified_after` is given only records changed since then are fetched. Pages
+    are requested newest first and paging stops at the first page reaching records
+    older than the watermark, so an update costs a few pages instead of the whole
+    endpoint. This only applies to post types, taxonomies have no modified date.
+
+    When a checkpoint store is given every page is checkpointed as it is fetched. If a
+    page then fails after retries, the next attempt resumes from the pages already
+    checkpointed instead of starting again from page 1. The checkpoints are cleared
+    once every page has been fetched.
+
+    Each page is retried on its own according to `retry_policy`. The endpoint has
+    `WORDPRESS_ENDPOINT_BUDGET_SECONDS` to complete in, cut short by `deadline` (the
+    budget of the whole run) if that passes first, and backoffs never sleep past it.
+
+    :param str endpoint: The API URL to fetch data from.
+    :param int per_page: Number of results per page (default: 100).
+    :param int max_workers: Number of pages to fetch in parallel (default: 1).
+    :param requests.Session | None session: The session to use, defaults to the shared
+        session.
+    :param PageCache | None cache: A cache of previously fetched pages to make
+        conditional requests against, defaults to the cache configured by the
+        `WORDPRESS_CACHE_DIR` environment variable.
+    :param datetime | None modified_after: Only fetch records whose `modified_gmt` is
+        after this (naive, UTC) time.
+    :param list[str] | None fields: Only fetch these top level fields of each record
+        using the WordPress `_fields` parameter, defaults to every field.
+    :param CheckpointStore | None checkpoints: Where to checkpoint fetched pages,
+        defaults to the directory configured by the `WORDPRESS_CHECKPOINT_DIR`
+        environment variable.
+    :param Deadline | None deadline: When the run fetching this endpoint must finish.
+    :param RetryPolicy retry_policy: How each page is retried.
+    :param RecordDecoder | None decoder: Decodes each page through a schema, keeping
+        only the fields the parsers read and rejecting malformed records, defaults to
+        decoding pages in full.
+    :raise requests.RequestException: If a page could not be fetched.
+    :return Iterator[list[dict[str, Any]]]: The pages of data records.
+    """
+    session = session or get_session()
+    cache = cache or get_default_page_cache()
+    checkpoints = checkpoints or get_default_checkpoint_store()
+
+    checkpoint = None
+    if checkpoints:
+        shared_params = page_params(0, per_page, modified_after, fields)
+        del shared_params["page"]
+        checkpoint = PageCheckpoint.for_request(
+            checkpoints, endpoint, shared_params, decoder.key if decoder else None
+        )
+
+    endpoint_deadline = (
+        deadline or Deadline.after(WORDPRESS_RUN_BUDGET_SECONDS)
+    ).within(WORDPRESS_ENDPOINT_BUDGET_SECONDS)
+    fetcher = _PageFetcher(
+        session=session,
+        endpoint=endpoint,
+        deadline=endpoint_deadline,
+        retry_policy=retry_policy,
+        cache=cache,
+        checkpoint=checkpoint,
+        decoder=decoder,
+    )
+
+    click.echo(f"⏳ fetching from {endpoint}...")
+
+    if modified_after is not None:
+        yield from _iter_modified_pages(fetcher, per_page, fields, modified_after)
+    elif max_workers > 1:
+        yield from dedupe_by_id(
+            _iter_pages_concurrently(fetcher, per_page, max_workers, fields)
+        )
+    else:
+        yield from _iter_pages_sequentially(fetcher, per_page, fields)
+
+    if checkpoint:
+        checkpoint.clear()
 
     click.echo("✅ Completed fetching from endpoint.")
-    return all_data
 
 
-def fetch_individual_wordpress_resource(endpoint: str) -> dict[str, Any] | None:
-    session = create_retry_session()
+def iter_word_press_data(endpoint: str, **kwargs: Any) -> Iterator[dict[str, Any]]:
+    """Fetch paginated data from a given API endpoint, yielding each record as it arrives.
+
+    Accepts the same keyword arguments as `iter_word_press_pages`.
+
+    :param str endpoint: The API URL to fetch data from.
+    :raise requests.RequestException: If a page could not be fetched.
+    :return Iterator[dict[str, Any]]: The data records.
+    """
+    for page in iter_word_press_pages(endpoint, **kwargs):
+        yield from page
+
+
+def fetch_word_press_data(
+    endpoint: str,
+    per_page: int = 100,
+    max_workers: int = 1,
+    session: requests.Session | None = None,
+    cache: PageCache | None = None,
+    modified_after: datetime | None = None,
+    fields: list[str] | None = None,
+    checkpoints: CheckpointStore | None = None,
+    deadline: Deadline | None = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    decoder: RecordDecoder | None = None,
+) -> list[dict[str, Any]]:
+    """Fetch paginated data from a given API endpoint.
+
+    See `iter_word_press_pages` for a description of the parameters.
+
+    :param str endpoint: The API URL to fetch data from.
+    :return list[dict[str, Any]]: A list of data records if successful, or an empty
+        list if an error occurs.
+    """
     try:
-        click.echo(f"⏳ fetching individual resource from {endpoint}...")
-        response = session.get(endpoint, timeout=10)
+        return list(
+            iter_word_press_data(
+                endpoint,
+                per_page=per_page,
+                max_workers=max_workers,
+                session=session,
+                cache=cache,
+                modified_after=modified_after,
+                fields=fields,
+                checkpoints=checkpoints,
+                deadline=deadline,
+                retry_policy=retry_policy,
+                decoder=decoder,
+            )
+        )
+    except requests.RequestException as e:
+        click.echo(f"❌ Error fetching data from {endpoint}: {e}", err=True)
+        return []
+
+
+def fetch_word_press_resources(
+    endpoint: str,
+    ids: Iterable[int],
+    fields: list[str] | None = None,
+    session: requests.Session | None = None,
+    deadline: Deadline | None = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    decoder: RecordDecoder | None = None,
+) -> dict[int, dict[str, Any]]:
+    """Fetch the records of a post type or taxonomy with the given ids.
+
+    The records are requested with the WordPress `include` parameter in batches of
+    `INCLUDE_BATCH_SIZE`, so a few hundred records cost a few requests rather than one
+    request each.
+
+    :param str endpoint: The API URL of the post type or taxonomy.
+    :param Iterable[int] ids: The ids of the records to fetch.
+    :param list[str] | None fields: Only fetch these top level fields of each record,
+        defaults to every field.
+    :param requests.Session | None session: The session to use, defaults to the shared
+        session.
+    :param Deadline | None deadline: When every batch must have been fetched by.
+    :param RetryPolicy retry_policy: How each batch is retried.
+    :param RecordDecoder | None decoder: Decodes each batch through a schema, defaults
+        to decoding batches in full.
+    :raise requests.RequestException: If a batch could not be fetched.
+    :return dict[int, dict[str, Any]]: The records found by id, ids that do not exist
+        are left out.
+    """
+    session = session or get_session()
+    deadline = deadline or Deadline.after(WORDPRESS_ENDPOINT_BUDGET_SECONDS)
+    unique_ids = list(dict.fromkeys(ids))
+
+    records: dict[int, dict[str, Any]] = {}
+    for start in range(0, len(unique_ids), INCLUDE_BATCH_SIZE):
+        batch = unique_ids[start : start + INCLUDE_BATCH_SIZE]
+        params: dict[str, Any] = {
+            "include": ",".join(str(record_id) for record_id in batch),
+            "per_page": len(batch),
+        }
+        if fields:
+            params["_fields"] = ",".join(fields)
+
+        def request(timeout: float, params: dict[str, Any] = params) -> Any:
+            with session.get(endpoint, params=params, timeout=timeout) as response:
+                response.raise_for_status()
+                if decoder:
+                    return decoder.decode_page(response.content, endpoint)
+                return response.json()
+
+        click.echo(f"⏳ fetching {len(batch)} resources from {endpoint}...")
+        for record in call_with_retries(
+            request,
+            f"{endpoint} include batch {start // INCLUDE_BATCH_SIZE + 1}",
+            deadline,
+            retry_policy,
+        ):
+            records[record["id"]] = record
+
+    return records
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointProbe:
+    """A cheap fingerprint of the records behind a WordPress endpoint.
+
+    For post types `newest` is the `modified_gmt` of the most recently modified record,
+    so the probe changes whenever a record is added, removed or edited. Taxonomy terms
+    have no modified date, so for taxonomies `newest` is the highest term id instead.
+    That catches terms being added or removed, but not an existing term being renamed.
+    """
+
+    total: int
+    newest: str | None
+
+
+def probe_word_press_endpoint(
+    endpoint: str,
+    has_modified_date: bool = True,
+    session: requests.Session | None = None,
+    deadline: Deadline | None = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> EndpointProbe:
+    """Fingerprint an endpoint with a single request for its newest record.
+
+    :param str endpoint: The API URL to probe.
+    :param bool has_modified_date: Whether the records are post types with a
+        `modified_gmt` date, rather than taxonomy terms.
+    :param requests.Session | None session: The session to use, defaults to the shared
+        session.
+    :param Deadline | None deadline: When to give up retrying the request.
+    :param RetryPolicy retry_policy: How the request is retried.
+    :raise requests.RequestException: If the endpoint could not be probed.
+    :return EndpointProbe: The total number of records and the newest record.
+    """
+    session = session or get_session()
+    deadline = deadline or Deadline.after(WORDPRESS_ENDPOINT_BUDGET_SECONDS)
+    newest_field = "modified_gmt" if has_modified_date else "id"
+    params = {
+        "page": 1,
+        "per_page": 1,
+        "orderby": "modified" if has_modified_date else "id",
+        "order": "desc",
+        "_fields": ",".join(dict.fromkeys(["id", newest_field])),
+    }
+
+    def request(timeout: float) -> EndpointProbe:
+        with session.get(endpoint, params=params, timeout=timeout) as response:
+            response.raise_for_status()
+            records = response.json()
+            newest = records[0].get(newest_field) if records else None
+            return EndpointProbe(
+                total=int(response.headers.get("X-WP-Total", len(records))),
+                newest=None if newest is None else str(newest),
+            )
+
+    return call_with_retries(request, f"{endpoint} probe", deadline, retry_policy)
+
+
+def fetch_individual_wordpress_resource(
+    endpoint: str,
+    session: requests.Session | None = None,
+    deadline: Deadline | None = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> dict[str, Any] | None:
+    session = session or get_session()
+    deadline = deadline or Deadline.after(WORDPRESS_ENDPOINT_BUDGET_SECONDS)
+
+    def request(timeout: float) -> dict[str, Any]:
+        response = session.get(endpoint, timeout=timeout)
         response.raise_for_status()
         return response.json()
+
+    try:
+        click.echo(f"⏳ fetching individual resource from {endpoint}...")
+        return call_with_retries(request, endpoint, deadline, retry_policy)
     except requests.RequestException as e:
         click.echo(
             f"❌ Error fetching individual resource from {endpoint}: {e}", err=True
@@ -1,7 +1,17 @@
 import json
 import os
 
-from litigation_data_mapper.wordpress import fetch_word_press_data
+from litigation_data_mapper.retry_policy import (
+    WORDPRESS_RUN_BUDGET_SECONDS,
+    Deadline,
+    log_retry_stats,
+    reset_retry_stats,
+)
+from litigation_data_mapper.wordpress import (
+    WORDPRESS_BASE_URL,
+    fetch_word_press_data,
+    log_session_stats,
+)
 
 endpoints = [
     "case_bundle",
@@ -22,10 +32,13 @@ endpoints = [
 def fetch_and_write_all_wordpress_data():
     all_data = {}
     os.makedirs("./build/wordpress", exist_ok=True)
+    reset_retry_stats()
+    deadline = Deadline.after(WORDPRESS_RUN_BUDGET_SECONDS)
 
     for endpoint in endpoints:
         data = fetch_word_press_data(
-            f"https://admin.climatecasechart.com/wp-json/wp/v2/{endpoint}"
+            f"{WORDPRESS_BASE_URL}/{endpoint}",
+            deadline=deadline,
         )
 
         with open(f"./build/wordpress/{endpoint}.json", "w") as f:
@@ -33,4 +46,6 @@ def fetch_and_write_all_wordpress_data():
 
         all_data[endpoint] = data
 
+    log_session_stats()
+    log_retry_stats()
     return all_data
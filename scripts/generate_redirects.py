@@ -1,7 +1,8 @@
 import json
 
 import boto3
-import requests
+
+from litigation_data_mapper.rate_limit import rate_limited_request
 
 
 def main():
@@ -26,7 +27,7 @@ def main():
         slug = case["slug"]
 
         api_url = f"https://api.climatepolicyradar.org/families/Sabin.family.{id}.0"
-        r = requests.get(api_url, timeout=10)
+        r = rate_limited_request("GET", api_url, timeout=10)
         api_json = r.json()
 
         if r.status_code != 200:
@@ -43,7 +44,7 @@ def main():
         slug = case_bundle["slug"]
 
         api_url = f"https://api.climatepolicyradar.org/families/collections/Sabin.collection.{id}.0"
-        r = requests.get(api_url, timeout=10)
+        r = rate_limited_request("GET", api_url, timeout=10)
         api_json = r.json()
 
         if r.status_code != 200:
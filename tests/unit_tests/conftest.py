@@ -8,6 +8,29 @@ from moto import mock_aws
 from mypy_boto3_s3 import S3Client
 from prefect import Flow, State
 
+from litigation_data_mapper.negative_cache import reset_negative_cache
+from litigation_data_mapper.rate_limit import (
+    close_rate_limited_session,
+    reset_rate_limiters,
+)
+from litigation_data_mapper.retry_policy import reset_retry_stats
+from litigation_data_mapper.wordpress import close_session
+
+
+@pytest.fixture(autouse=True)
+def reset_wordpress_session():
+    """Make sure every test starts without shared WordPress session state."""
+    close_session()
+    close_rate_limited_session()
+    reset_rate_limiters()
+    reset_retry_stats()
+    reset_negative_cache()
+    yield
+    close_session()
+    close_rate_limited_session()
+    reset_rate_limiters()
+    reset_negative_cache()
+
 
 @pytest.fixture
 def mock_prefect_slack_webhook():
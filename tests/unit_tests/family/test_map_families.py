@@ -404,3 +404,5 @@ def test_fetches_and_maps_any_missing_concepts_when_mapping_families(mock_contex
         )
 
         assert family_data == expected_family_data
+        # Refetched concepts are written back to the caller's lookup table
+        assert extracted_concepts[24].preferred_label == "Australian State Courts"
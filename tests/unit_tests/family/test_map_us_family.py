@@ -5,6 +5,7 @@ import pytest
 
 from litigation_data_mapper.datatypes import Failure, LitigationContext
 from litigation_data_mapper.extract_concepts import Concept, ConceptType
+from litigation_data_mapper.litigation_index import LitigationIndex
 from litigation_data_mapper.parsers.family import process_us_case_data
 
 
@@ -558,3 +559,32 @@ def tests_gets_concepts_from_case_bundles(
         }
         for c in matching_concepts.values()
     ]
+
+
+@patch("litigation_data_mapper.parsers.family.fetch_individual_concept")
+def test_maps_us_cases_the_same_from_an_index_as_from_a_list(
+    mock_fetch_individual_concept,
+    mock_us_case: dict,
+    mock_context: LitigationContext,
+):
+    mock_fetch_individual_concept.return_value = None
+    mock_us_case["acf"]["ccl_case_bundle"] = [1]
+    mock_context.case_bundles[1] = {"description": "Bundle description"}
+    bundles = [
+        {"id": 1, "type": "case_bundle", "principal_law": []},
+        {"id": 2, "type": "case_bundle", "principal_law": []},
+    ]
+
+    from_list = process_us_case_data(
+        mock_us_case, 1, mock_context, concepts={}, collections=bundles
+    )
+    from_index = process_us_case_data(
+        mock_us_case,
+        1,
+        mock_context,
+        concepts={},
+        collections=LitigationIndex.from_records(bundles=bundles),
+    )
+
+    assert not isinstance(from_index, Failure)
+    assert from_index == from_list
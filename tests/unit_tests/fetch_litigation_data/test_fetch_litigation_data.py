@@ -1,21 +1,61 @@
+import threading
+import time
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import pytest
 import requests
 
 from litigation_data_mapper.fetch_litigation_data import (
+    ENDPOINT_FIELDS,
     ENDPOINTS,
     LitigationType,
     fetch_litigation_data,
     fetch_word_press_data,
+    find_referenced_media_ids,
+)
+from litigation_data_mapper.retry_policy import RetryPolicy, get_retry_stats
+from litigation_data_mapper.wordpress import (
+    EndpointProbe,
+    configure_session,
+    fetch_individual_wordpress_resource,
+    fetch_word_press_resources,
+    get_session,
+    get_session_stats,
+    iter_word_press_data,
+    iter_word_press_pages,
+    probe_word_press_endpoint,
 )
-from litigation_data_mapper.wordpress import create_retry_session
 
 
-def test_create_retry_session():
+def test_get_session_is_shared_between_calls():
     with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
-        session = create_retry_session()
-        assert session is not None
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"id": 1}
+        mock_session.return_value.get.return_value = mock_response
+
+        fetch_individual_wordpress_resource(f"{ENDPOINTS['jurisdictions']}/1")
+        fetch_individual_wordpress_resource(f"{ENDPOINTS['jurisdictions']}/2")
+
+        assert get_session() is mock_session.return_value
         mock_session.assert_called_once()
+        assert mock_session.return_value.get.call_count == 2
+
+
+def test_configure_session_sets_pool_size():
+    session = configure_session(pool_size=32)
+
+    adapter = session.get_adapter("https://admin.climatecasechart.com")
+    assert adapter._pool_maxsize == 32  # type: ignore[attr-defined]
+    assert get_session() is session
+
+
+def test_get_session_stats_without_session():
+    stats = get_session_stats()
+
+    assert stats.connections_opened == 0
+    assert stats.requests_sent == 0
+    assert stats.connections_reused == 0
 
 
 def test_fetch_word_press_data_success():
@@ -48,6 +88,121 @@ def test_fetch_word_press_data_failure():
         assert data == []
 
 
+def _mock_page_response(data, total_pages):
+    mock_response = MagicMock()
+    mock_response.json.return_value = data
+    mock_response.headers = {"X-WP-TotalPages": str(total_pages)}
+    mock_response.__enter__.return_value = mock_response
+    mock_response.__exit__.return_value = None
+    return mock_response
+
+
+def test_fetch_word_press_data_concurrently_keeps_page_order_and_dedupes():
+    pages = {
+        1: [{"id": 6}, {"id": 5}],
+        2: [{"id": 5}, {"id": 4}],
+        3: [{"id": 3}, {"id": 2}],
+    }
+
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_session.return_value.get.side_effect = (
+            lambda endpoint, params, headers, timeout: _mock_page_response(
+                pages[params["page"]], total_pages=3
+            )
+        )
+
+        data = fetch_word_press_data(ENDPOINTS["document_media"], max_workers=3)
+
+    assert [record["id"] for record in data] == [6, 5, 4, 3, 2]
+
+
+def test_fetch_word_press_data_concurrently_returns_empty_list_on_failure():
+    def get(endpoint, params, headers, timeout):
+        if params["page"] == 2:
+            raise requests.ConnectionError("Error")
+        return _mock_page_response([{"id": params["page"]}], total_pages=3)
+
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_session.return_value.get.side_effect = get
+
+        data = fetch_word_press_data(
+            ENDPOINTS["document_media"],
+            max_workers=3,
+            retry_policy=RetryPolicy(retries=0),
+        )
+
+    assert data == []
+
+
+def test_iter_word_press_pages_yields_each_page_before_fetching_the_next():
+    pages = {1: [{"id": 2}], 2: [{"id": 1}]}
+
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_get = mock_session.return_value.get
+        mock_get.side_effect = lambda endpoint, params, headers, timeout: (
+            _mock_page_response(pages[params["page"]], total_pages=2)
+        )
+
+        page_iterator = iter_word_press_pages(ENDPOINTS["us_cases"])
+
+        assert next(page_iterator) == [{"id": 2}]
+        assert mock_get.call_count == 1
+        assert list(page_iterator) == [[{"id": 1}]]
+        assert mock_get.call_count == 2
+
+
+def test_iter_word_press_data_raises_on_failure():
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_response = _mock_page_response([], total_pages=1)
+        mock_response.raise_for_status.side_effect = requests.HTTPError("Error")
+        mock_session.return_value.get.return_value = mock_response
+
+        with pytest.raises(requests.HTTPError):
+            list(iter_word_press_data(ENDPOINTS["us_cases"]))
+
+
+def test_fetch_word_press_data_requests_only_the_given_fields():
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_get = mock_session.return_value.get
+        mock_get.return_value = _mock_page_response([{"id": 1}], total_pages=1)
+
+        fetch_word_press_data(
+            ENDPOINTS["document_media"], fields=ENDPOINT_FIELDS["document_media"]
+        )
+
+    assert mock_get.call_args.kwargs["params"]["_fields"] == "id,source_url"
+
+
+def test_fetch_word_press_data_modified_after_stops_at_older_records():
+    pages = {
+        1: [
+            {"id": 3, "modified_gmt": "2025-06-03T00:00:00"},
+            {"id": 1, "modified_gmt": "2025-06-02T00:00:00"},
+        ],
+        2: [
+            {"id": 2, "modified_gmt": "2025-06-01T12:00:00"},
+            {"id": 4, "modified_gmt": "2025-05-20T00:00:00"},
+        ],
+        3: [{"id": 5, "modified_gmt": "2025-05-01T00:00:00"}],
+    }
+
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_get = mock_session.return_value.get
+        mock_get.side_effect = lambda endpoint, params, headers, timeout: (
+            _mock_page_response(pages[params["page"]], total_pages=3)
+        )
+
+        data = fetch_word_press_data(
+            ENDPOINTS["us_cases"], modified_after=datetime(2025, 6, 1)
+        )
+
+    assert [record["id"] for record in data] == [3, 1, 2]
+    assert mock_get.call_count == 2
+    params = mock_get.call_args.kwargs["params"]
+    assert params["orderby"] == "modified"
+    assert params["modified_after"] == "2025-05-31T00:00:00"
+
+
 @patch("litigation_data_mapper.fetch_litigation_data.extract_concepts")
 @patch("litigation_data_mapper.fetch_litigation_data.fetch_word_press_data")
 def test_fetch_litigation_data(mock_extract_concepts, mock_fetch_word_press_data):
@@ -69,3 +224,210 @@ def test_fetch_litigation_data(mock_extract_concepts, mock_fetch_word_press_data
         "concepts": mock_return_value,  # type: ignore
     }
     assert result == expected_result
+
+
+@patch("litigation_data_mapper.fetch_litigation_data.extract_concepts", return_value={})
+@patch("litigation_data_mapper.fetch_litigation_data.fetch_word_press_data")
+def test_fetch_litigation_data_reports_only_its_own_retries(
+    mock_fetch_word_press_data, mock_extract_concepts
+):
+    mock_fetch_word_press_data.side_effect = lambda *args, **kwargs: (
+        get_retry_stats().record_retry("page 1", 1) or []
+    )
+    # Left over from an earlier run in the same process
+    get_retry_stats().record_retry("earlier page", 5)
+
+    fetch_litigation_data()
+
+    # One retry for each endpoint fetched
+    assert get_retry_stats().retries == {"page 1": len(ENDPOINTS)}
+    assert get_retry_stats().sleep_seconds == len(ENDPOINTS)
+
+
+@patch("litigation_data_mapper.fetch_litigation_data.extract_concepts")
+@patch("litigation_data_mapper.fetch_litigation_data.fetch_word_press_data")
+def test_fetch_litigation_data_fetches_endpoints_in_parallel(
+    mock_fetch_word_press_data, mock_extract_concepts
+):
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def fetch(endpoint, **kwargs):
+        with lock:
+            in_flight.append(endpoint)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.1)
+        with lock:
+            in_flight.remove(endpoint)
+        return [{"endpoint": endpoint}]
+
+    mock_fetch_word_press_data.side_effect = fetch
+    mock_extract_concepts.return_value = {}
+
+    result = fetch_litigation_data()
+
+    assert result["documents"] == [{"endpoint": ENDPOINTS["document_media"]}]
+    assert result["families"]["us_cases"] == [{"endpoint": ENDPOINTS["us_cases"]}]
+    assert result["collections"] == [{"endpoint": ENDPOINTS["case_bundles"]}]
+    assert max(max_in_flight) == 4
+
+
+@patch("litigation_data_mapper.fetch_litigation_data.ENDPOINT_WORKERS", 1)
+@patch("litigation_data_mapper.fetch_litigation_data.extract_concepts")
+@patch("litigation_data_mapper.fetch_litigation_data.fetch_word_press_data")
+def test_fetch_litigation_data_starts_with_the_media_library(
+    mock_fetch_word_press_data, mock_extract_concepts
+):
+    mock_fetch_word_press_data.return_value = []
+    mock_extract_concepts.return_value = {}
+
+    fetch_litigation_data(modified_after=datetime(2025, 6, 1))
+
+    calls = mock_fetch_word_press_data.call_args_list
+    assert calls[0].args[0] == ENDPOINTS["document_media"]
+    modified_after = {call.args[0]: call.kwargs["modified_after"] for call in calls}
+    assert modified_after[ENDPOINTS["us_cases"]] == datetime(2025, 6, 1)
+    assert modified_after[ENDPOINTS["document_media"]] is None
+
+
+def test_probe_word_press_endpoint_requests_only_the_newest_record():
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_get = mock_session.return_value.get
+        mock_response = _mock_page_response(
+            [{"id": 7, "modified_gmt": "2025-06-01T00:00:00"}], total_pages=40
+        )
+        mock_response.headers["X-WP-Total"] = "40"
+        mock_get.return_value = mock_response
+
+        post_probe = probe_word_press_endpoint(ENDPOINTS["us_cases"])
+        taxonomy_probe = probe_word_press_endpoint(
+            ENDPOINTS["jurisdictions"], has_modified_date=False
+        )
+
+    assert post_probe == EndpointProbe(total=40, newest="2025-06-01T00:00:00")
+    assert taxonomy_probe == EndpointProbe(total=40, newest="7")
+    post_params, taxonomy_params = [
+        call.kwargs["params"] for call in mock_get.call_args_list
+    ]
+    assert post_params["per_page"] == 1
+    assert post_params["orderby"] == "modified"
+    assert taxonomy_params["orderby"] == "id"
+    assert taxonomy_params["_fields"] == "id"
+
+
+def test_fetch_word_press_resources_requests_ids_in_batches():
+    def get(endpoint, params, timeout):
+        ids = [int(record_id) for record_id in params["include"].split(",")]
+        # Ids that do not exist are left out of the response
+        return _mock_page_response(
+            [{"id": record_id} for record_id in ids if record_id != 7], total_pages=1
+        )
+
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_get = mock_session.return_value.get
+        mock_get.side_effect = get
+
+        records = fetch_word_press_resources(
+            ENDPOINTS["jurisdictions"], [*range(1, 151), 3], fields=["id", "name"]
+        )
+
+    assert sorted(records) == [
+        record_id for record_id in range(1, 151) if record_id != 7
+    ]
+    batch_sizes = [
+        len(call.kwargs["params"]["include"].split(","))
+        for call in mock_get.call_args_list
+    ]
+    assert batch_sizes == [100, 50]
+    assert mock_get.call_args.kwargs["params"]["_fields"] == "id,name"
+
+
+@patch("litigation_data_mapper.fetch_litigation_data.prefetch_missing_concepts")
+@patch("litigation_data_mapper.fetch_litigation_data.extract_concepts")
+@patch("litigation_data_mapper.fetch_litigation_data.fetch_word_press_data")
+def test_fetch_litigation_data_prefetches_concepts_missing_from_the_taxonomies(
+    mock_fetch_word_press_data, mock_extract_concepts, mock_prefetch_missing_concepts
+):
+    case = {"id": 1, "entity": [5]}
+    mock_fetch_word_press_data.return_value = [case]
+    mock_extract_concepts.return_value = {4: "known concept"}
+    mock_prefetch_missing_concepts.return_value = {5: "missing concept"}
+
+    result = fetch_litigation_data()
+
+    assert result["concepts"] == {4: "known concept", 5: "missing concept"}
+    records = mock_prefetch_missing_concepts.call_args.args[0]
+    assert records == [case, case, case]
+
+
+def test_find_referenced_media_ids():
+    cases = [
+        {
+            "type": "case",
+            "acf": {"ccl_case_documents": [{"ccl_file": 3}, {"ccl_file": ""}]},
+        },
+        {
+            "type": "non_us_case",
+            "acf": {
+                "ccl_nonus_case_documents": [
+                    {"ccl_nonus_file": 2},
+                    {"ccl_nonus_file": 3},
+                    {},
+                ]
+            },
+        },
+        {"type": "case", "acf": {"ccl_case_documents": False}},
+    ]
+
+    assert find_referenced_media_ids(cases) == [3, 2]
+
+
+@patch("litigation_data_mapper.fetch_litigation_data.fetch_word_press_resources")
+@patch("litigation_data_mapper.fetch_litigation_data.extract_concepts")
+@patch("litigation_data_mapper.fetch_litigation_data.fetch_word_press_data")
+def test_fetch_litigation_data_selective_media_fetches_only_referenced_files(
+    mock_fetch_word_press_data, mock_extract_concepts, mock_fetch_word_press_resources
+):
+    cases = {
+        ENDPOINTS["us_cases"]: [
+            {"id": 1, "type": "case", "acf": {"ccl_case_documents": [{"ccl_file": 8}]}}
+        ],
+        ENDPOINTS["global_cases"]: [
+            {
+                "id": 2,
+                "type": "non_us_case",
+                "acf": {"ccl_nonus_case_documents": [{"ccl_nonus_file": 9}]},
+            }
+        ],
+    }
+    mock_fetch_word_press_data.side_effect = lambda endpoint, **kwargs: cases.get(
+        endpoint, []
+    )
+    mock_extract_concepts.return_value = {}
+    media = {8: {"id": 8, "source_url": "a.pdf"}, 9: {"id": 9, "source_url": "b.pdf"}}
+    mock_fetch_word_press_resources.return_value = media
+
+    result = fetch_litigation_data(selective_media=True)
+
+    assert result["documents"] == list(media.values())
+    fetched = [call.args[0] for call in mock_fetch_word_press_data.call_args_list]
+    assert ENDPOINTS["document_media"] not in fetched
+    call = mock_fetch_word_press_resources.call_args
+    assert call.args == (ENDPOINTS["document_media"], [8, 9])
+    assert call.kwargs["fields"] == ENDPOINT_FIELDS["document_media"]
+
+
+@patch("litigation_data_mapper.fetch_litigation_data.fetch_word_press_resources")
+@patch("litigation_data_mapper.fetch_litigation_data.extract_concepts")
+@patch("litigation_data_mapper.fetch_litigation_data.fetch_word_press_data")
+def test_fetch_litigation_data_selective_media_returns_no_documents_on_failure(
+    mock_fetch_word_press_data, mock_extract_concepts, mock_fetch_word_press_resources
+):
+    mock_fetch_word_press_data.return_value = []
+    mock_extract_concepts.return_value = {}
+    mock_fetch_word_press_resources.side_effect = requests.ConnectionError("down")
+
+    result = fetch_litigation_data(selective_media=True)
+
+    assert result["documents"] == []
@@ -0,0 +1,225 @@
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+from litigation_data_mapper.async_wordpress import (
+    _get,
+    fetch_individual_wordpress_resource_async,
+    fetch_word_press_data_async,
+)
+from litigation_data_mapper.rate_limit import get_rate_limiter
+from litigation_data_mapper.retry_policy import RetryPolicy, get_retry_stats
+
+ENDPOINT = "https://example.com/wp-json/wp/v2/case"
+
+FAST_RETRY_POLICY = RetryPolicy(retries=2, backoff_factor=0.01)
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _pages_handler(pages: list[list[dict]], in_flight: list[int] | None = None):
+    state = {"current": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if in_flight is not None:
+            state["current"] += 1
+            in_flight.append(state["current"])
+            await asyncio.sleep(0.01)
+            state["current"] -= 1
+        return httpx.Response(
+            200,
+            json=pages[page - 1],
+            headers={"X-WP-TotalPages": str(len(pages))},
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_fetch_word_press_data_async_keeps_page_order_and_dedupes():
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 2}, {"id": 3}], [{"id": 4}]]
+    in_flight: list[int] = []
+
+    async with _client(_pages_handler(pages, in_flight)) as client:
+        data = await fetch_word_press_data_async(
+            ENDPOINT, per_page=2, max_concurrency=2, client=client
+        )
+
+    assert data == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+    assert max(in_flight) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_word_press_data_async_requests_only_the_given_fields():
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params["_fields"])
+        return httpx.Response(200, json=[{"id": 1}])
+
+    async with _client(handler) as client:
+        await fetch_word_press_data_async(ENDPOINT, client=client, fields=["id", "acf"])
+
+    assert requested == ["id,acf"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_word_press_data_async_modified_after_stops_at_older_records():
+    pages = [
+        [
+            {"id": 1, "modified_gmt": "2025-06-03T00:00:00"},
+            {"id": 2, "modified_gmt": "2025-05-01T00:00:00"},
+        ],
+        [{"id": 3, "modified_gmt": "2025-04-01T00:00:00"}],
+    ]
+    requested_pages = []
+    handler = _pages_handler(pages)
+
+    async def recording_handler(request: httpx.Request) -> httpx.Response:
+        requested_pages.append(request.url.params["page"])
+        assert request.url.params["orderby"] == "modified"
+        return await handler(request)
+
+    async with _client(recording_handler) as client:
+        data = await fetch_word_press_data_async(
+            ENDPOINT, client=client, modified_after=datetime(2025, 6, 1)
+        )
+
+    assert data == [{"id": 1, "modified_gmt": "2025-06-03T00:00:00"}]
+    assert requested_pages == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_word_press_data_async_retries_failed_pages():
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.url.params["page"])
+        if len(attempts) == 1:
+            return httpx.Response(502)
+        return httpx.Response(200, json=[{"id": 1}])
+
+    async with _client(handler) as client:
+        data = await fetch_word_press_data_async(
+            ENDPOINT, client=client, retry_policy=FAST_RETRY_POLICY
+        )
+
+    assert data == [{"id": 1}]
+    assert attempts == ["1", "1"]
+    assert get_retry_stats().total_retries == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_word_press_data_async_returns_empty_list_on_failure():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    async with _client(handler) as client:
+        data = await fetch_word_press_data_async(
+            ENDPOINT, client=client, retry_policy=FAST_RETRY_POLICY
+        )
+
+    assert data == []
+
+
+@pytest.mark.asyncio
+async def test_fetch_word_press_data_async_cancels_pending_pages_on_failure():
+    cancelled = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page == 2:
+            return httpx.Response(404)
+        if page > 2:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+        return httpx.Response(
+            200, json=[{"id": page}], headers={"X-WP-TotalPages": "4"}
+        )
+
+    async with _client(handler) as client:
+        data = await asyncio.wait_for(
+            fetch_word_press_data_async(
+                ENDPOINT, client=client, retry_policy=FAST_RETRY_POLICY
+            ),
+            timeout=5,
+        )
+
+    assert data == []
+    assert sorted(cancelled) == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_requests_hand_their_rate_limiter_slot_back():
+    limiter = get_rate_limiter(ENDPOINT)
+    limiter.max_concurrency = 1
+    limiter._concurrency_limit = 1
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(10)
+        return httpx.Response(200, json={})
+
+    async with _client(handler) as client:
+        # The first request holds the only slot, so the second is still waiting for
+        # the limiter when both are cancelled
+        requests = [
+            asyncio.create_task(_get(client, ENDPOINT, None, timeout=10))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.1)
+        for request in requests:
+            request.cancel()
+        await asyncio.gather(*requests, return_exceptions=True)
+
+    # The worker thread of the second request acquires its slot once the first
+    # request hands its back, and must then hand it back too
+    for _ in range(50):
+        if limiter.stats().requests == 2 and limiter._in_flight == 0:
+            break
+        await asyncio.sleep(0.1)
+    assert limiter.stats().requests == 2
+    assert limiter._in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_individual_wordpress_resource_async():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/1"):
+            return httpx.Response(200, json={"id": 1, "name": "Concept"})
+        raise httpx.ConnectError("down", request=request)
+
+    async with _client(handler) as client:
+        found = await fetch_individual_wordpress_resource_async(
+            f"{ENDPOINT}/1", client=client, retry_policy=FAST_RETRY_POLICY
+        )
+        missing = await fetch_individual_wordpress_resource_async(
+            f"{ENDPOINT}/2", client=client, retry_policy=FAST_RETRY_POLICY
+        )
+
+    assert found == {"id": 1, "name": "Concept"}
+    assert missing is None
+
+
+@pytest.mark.asyncio
+async def test_async_fetchers_treat_a_malformed_body_as_a_failure():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=b"<html>Error</html>", headers={"X-WP-TotalPages": "1"}
+        )
+
+    async with _client(handler) as client:
+        data = await fetch_word_press_data_async(ENDPOINT, client=client)
+        resource = await fetch_individual_wordpress_resource_async(
+            f"{ENDPOINT}/1", client=client
+        )
+
+    assert data == []
+    assert resource is None
@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from litigation_data_mapper.checkpoints import (
+    LocalCheckpointStore,
+    PageCheckpoint,
+    S3CheckpointStore,
+)
+from litigation_data_mapper.retry_policy import RetryPolicy
+from litigation_data_mapper.wordpress import fetch_word_press_data
+
+ENDPOINT = "https://admin.climatecasechart.com/wp-json/wp/v2/media"
+
+
+def _mock_page_response(data, total_pages):
+    mock_response = MagicMock()
+    mock_response.json.return_value = data
+    mock_response.headers = {"X-WP-TotalPages": str(total_pages)}
+    mock_response.__enter__.return_value = mock_response
+    mock_response.__exit__.return_value = None
+    return mock_response
+
+
+def test_fetch_word_press_data_resumes_from_the_last_checkpointed_page(tmp_path):
+    store = LocalCheckpointStore(str(tmp_path))
+    pages = {1: [{"id": 3}], 2: [{"id": 2}], 3: [{"id": 1}]}
+    requested_pages = []
+    failing_pages = {3}
+
+    def get(endpoint, params, headers, timeout):
+        requested_pages.append(params["page"])
+        if params["page"] in failing_pages:
+            raise requests.ConnectionError("Error")
+        return _mock_page_response(pages[params["page"]], total_pages=3)
+
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_session.return_value.get.side_effect = get
+
+        assert (
+            fetch_word_press_data(
+                ENDPOINT, checkpoints=store, retry_policy=RetryPolicy(retries=0)
+            )
+            == []
+        )
+        assert requested_pages == [1, 2, 3]
+
+        failing_pages.clear()
+        requested_pages.clear()
+        data = fetch_word_press_data(ENDPOINT, checkpoints=store)
+
+    assert data == [{"id": 3}, {"id": 2}, {"id": 1}]
+    assert requested_pages == [3]
+    # Checkpoints are cleared once the endpoint has been fetched completely
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_expired_checkpoints_are_not_resumed_from(tmp_path):
+    checkpoint = PageCheckpoint(
+        store=LocalCheckpointStore(str(tmp_path)), key="media", max_age_seconds=0
+    )
+
+    checkpoint.put(1, [{"id": 1}], total_pages=2)
+
+    assert checkpoint.get(1) is None
+
+
+def test_s3_checkpoint_store(mock_aws_creds, mock_s3_client):
+    mock_s3_client.create_bucket(
+        Bucket="cpr-cache",
+        CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+    )
+    checkpoint = PageCheckpoint(store=S3CheckpointStore(mock_s3_client), key="media")
+
+    assert checkpoint.get(1) is None
+
+    checkpoint.put(1, [{"id": 1}], total_pages=2)
+    checkpoint.put(2, [{"id": 2}], total_pages=2)
+    assert checkpoint.get(2) == ([{"id": 2}], 2)
+
+    checkpoint.clear()
+    assert checkpoint.get(1) is None
+    assert "Contents" not in mock_s3_client.list_objects_v2(Bucket="cpr-cache")
+
+
+def test_clear_all_removes_the_checkpoints_of_every_fetch(
+    mock_aws_creds, mock_s3_client, tmp_path
+):
+    mock_s3_client.create_bucket(
+        Bucket="cpr-cache",
+        CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+    )
+    mock_s3_client.put_object(Bucket="cpr-cache", Key="litigation/wordpress/case.json")
+
+    for store in [
+        LocalCheckpointStore(str(tmp_path / "checkpoints")),
+        S3CheckpointStore(mock_s3_client),
+    ]:
+        checkpoints = [
+            PageCheckpoint(store=store, key=key) for key in ["case", "media"]
+        ]
+        for checkpoint in checkpoints:
+            checkpoint.put(1, [{"id": 1}], total_pages=2)
+
+        store.clear_all()
+
+        assert all(checkpoint.get(1) is None for checkpoint in checkpoints)
+
+    # Only the checkpoints are removed from the cache bucket
+    assert [
+        item["Key"]
+        for item in mock_s3_client.list_objects_v2(Bucket="cpr-cache")["Contents"]
+    ] == ["litigation/wordpress/case.json"]
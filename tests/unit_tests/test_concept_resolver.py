@@ -0,0 +1,92 @@
+import asyncio
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from litigation_data_mapper.concept_resolver import ConceptResolver
+from litigation_data_mapper.extract_concepts import Concept, ConceptType
+
+
+def _concept(concept_id: int) -> Concept:
+    return Concept(
+        internal_id=concept_id,
+        id=f"Concept {concept_id}",
+        type=ConceptType.LegalEntity,
+        preferred_label=f"Concept {concept_id}",
+    )
+
+
+def test_counts_hits_misses_and_refetches_into_the_callers_table():
+    concepts = {1: _concept(1)}
+    fetch = MagicMock(side_effect=lambda concept_id, taxonomy, table: _concept(2))
+    resolver = ConceptResolver(concepts, fetch=fetch)
+
+    assert resolver.resolve(1, "entity") == _concept(1)
+    assert resolver.resolve(2, "entity") == _concept(2)
+    assert resolver.resolve(2, "entity") == _concept(2)
+
+    stats = resolver.stats()
+    assert (stats.hits, stats.misses, stats.refetches) == (2, 1, 1)
+    fetch.assert_called_once()
+    assert concepts == {1: _concept(1), 2: _concept(2)}
+
+
+def test_coalesces_concurrent_lookups_of_the_same_concept():
+    release = threading.Event()
+
+    def fetch(concept_id, taxonomy, table):
+        release.wait(timeout=5)
+        return _concept(concept_id)
+
+    fetch_mock = MagicMock(side_effect=fetch)
+    resolver = ConceptResolver(fetch=fetch_mock)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(resolver.resolve, 3, "entity") for _ in range(5)]
+        # Only let the fetch finish once every other lookup is waiting on it
+        deadline = time.monotonic() + 5
+        while resolver.stats().coalesced < 4 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+
+    assert [future.result() for future in futures] == [_concept(3)] * 5
+    fetch_mock.assert_called_once()
+    assert resolver.stats().refetches == 1
+
+
+def test_failed_fetches_are_raised_to_every_caller_and_can_be_retried():
+    fetch = MagicMock(side_effect=[RuntimeError("Error"), _concept(4)])
+    resolver = ConceptResolver(fetch=fetch)
+
+    with pytest.raises(RuntimeError):
+        resolver.resolve(4, "entity")
+
+    assert resolver.resolve(4, "entity") == _concept(4)
+
+
+def test_resolves_concepts_from_asyncio_tasks():
+    fetch = MagicMock(side_effect=lambda concept_id, taxonomy, table: None)
+    resolver = ConceptResolver({1: _concept(1)}, fetch=fetch)
+
+    async def resolve_all():
+        return await asyncio.gather(
+            resolver.resolve_async(1, "entity"), resolver.resolve_async(5, "entity")
+        )
+
+    assert asyncio.run(resolve_all()) == [_concept(1), None]
+    assert resolver.stats().misses == 1
+
+
+def test_pickles_the_table_and_fetcher_with_fresh_counters():
+    resolver = ConceptResolver({1: _concept(1)})
+    resolver.resolve(1, "entity")
+
+    copied = pickle.loads(pickle.dumps(resolver))
+
+    assert copied.get(1) == _concept(1)
+    assert copied.stats().hits == 0
+    assert copied.resolve(1, "entity") == _concept(1)
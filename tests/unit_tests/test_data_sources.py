@@ -0,0 +1,190 @@
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from litigation_data_mapper.data_sources import (
+    LocalSnapshotSource,
+    S3SnapshotSource,
+    SnapshotSource,
+    WordPressApiSource,
+    get_data_source,
+)
+from litigation_data_mapper.extract_concepts import taxonomies
+from litigation_data_mapper.fetch_litigation_data import ENDPOINT_FIELDS, ENDPOINTS
+from litigation_data_mapper.parsers.family import get_concept_resolver
+
+SNAPSHOT = {
+    "case": [
+        {
+            "id": 1,
+            "type": "case",
+            "modified_gmt": "2025-06-03T00:00:00",
+            "acf": {"ccl_case_documents": [{"ccl_file": 10}]},
+        },
+        {
+            "id": 2,
+            "type": "case",
+            "modified_gmt": "2025-05-01T00:00:00",
+            "acf": {"ccl_case_documents": [{"ccl_file": 11}]},
+        },
+    ],
+    "non_us_case": [
+        {
+            "id": 3,
+            "type": "non_us_case",
+            "modified_gmt": "2025-06-02T00:00:00",
+            "acf": {"ccl_nonus_case_documents": [{"ccl_nonus_file": 12}]},
+        }
+    ],
+    "case_bundle": [{"id": 4, "type": "case_bundle"}],
+    "media": [
+        {"id": 10, "source_url": "https://example.org/10.pdf"},
+        {"id": 11, "source_url": "https://example.org/11.pdf"},
+        {"id": 12, "source_url": "https://example.org/12.pdf"},
+        {"id": 13, "source_url": "https://example.org/13.jpg"},
+    ],
+    **{taxonomy: [] for taxonomy in taxonomies},
+    "jurisdiction": [{"id": 5, "name": "Canada", "parent": 0}],
+}
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path):
+    for endpoint, data in SNAPSHOT.items():
+        (tmp_path / f"{endpoint}.json").write_text(json.dumps(data))
+    yield str(tmp_path)
+
+
+def test_loads_litigation_data_from_a_local_snapshot(snapshot_dir):
+    data = LocalSnapshotSource(snapshot_dir).load()
+
+    assert data["collections"] == SNAPSHOT["case_bundle"]
+    assert data["families"]["us_cases"] == SNAPSHOT["case"]
+    assert data["families"]["global_cases"] == SNAPSHOT["non_us_case"]
+    assert data["families"]["jurisdictions"] == SNAPSHOT["jurisdiction"]
+    assert data["documents"] == SNAPSHOT["media"]
+    assert data["concepts"].get(5).preferred_label == "Canada"  # type: ignore[union-attr]
+
+
+@patch("litigation_data_mapper.extract_concepts.fetch_individual_concepts")
+def test_snapshot_concepts_are_never_fetched_from_word_press(
+    mock_fetch_individual_concepts, snapshot_dir
+):
+    source = LocalSnapshotSource(snapshot_dir)
+
+    for concepts in [source.load()["concepts"], source.load_concepts({})]:
+        resolver = get_concept_resolver(concepts)
+        assert resolver.resolve(5, "jurisdiction").preferred_label == "Canada"  # type: ignore[union-attr]
+        assert resolver.resolve(6, "jurisdiction") is None
+
+    mock_fetch_individual_concepts.assert_not_called()
+
+
+def test_filters_a_snapshot_like_a_fetch(snapshot_dir):
+    data = LocalSnapshotSource(snapshot_dir).load(
+        modified_after=datetime(2025, 6, 1), selective_media=True
+    )
+
+    assert [case["id"] for case in data["families"]["us_cases"]] == [1]
+    assert [case["id"] for case in data["families"]["global_cases"]] == [3]
+    assert [media["id"] for media in data["documents"]] == [10, 12]
+
+
+def test_streams_a_snapshot_like_a_fetch(snapshot_dir):
+    source = LocalSnapshotSource(snapshot_dir)
+
+    cases = source.iter_records("us_cases", modified_after=datetime(2025, 6, 1))
+    bundles = source.iter_records("case_bundles", modified_after=datetime(2025, 6, 1))
+
+    assert [case["id"] for case in cases] == [1]
+    assert list(bundles) == SNAPSHOT["case_bundle"]
+    assert [media["id"] for media in source.iter_media([12, 10])] == [10, 12]
+    assert list(source.iter_media()) == SNAPSHOT["media"]
+    assert source.load_concepts({}).get(5).preferred_label == "Canada"  # type: ignore[union-attr]
+
+
+def test_loads_litigation_data_from_the_s3_cache(
+    mock_aws_creds, mock_s3_client, snapshot_dir
+):
+    mock_s3_client.create_bucket(
+        Bucket="cpr-cache",
+        CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+    )
+    for endpoint, data in SNAPSHOT.items():
+        mock_s3_client.put_object(
+            Bucket="cpr-cache",
+            Key=f"litigation/wordpress/{endpoint}.json",
+            Body=json.dumps(data),
+        )
+
+    s3_data = S3SnapshotSource(mock_s3_client).load()
+    local_data = LocalSnapshotSource(snapshot_dir).load()
+    s3_concepts = get_concept_resolver(s3_data.pop("concepts"))  # type: ignore[misc]
+    local_concepts = get_concept_resolver(local_data.pop("concepts"))  # type: ignore[misc]
+
+    assert s3_data == local_data
+    assert s3_concepts.get(5) == local_concepts.get(5)
+
+
+@patch("litigation_data_mapper.data_sources.fetch_litigation_data")
+def test_api_source_fetches_from_wordpress(mock_fetch_litigation_data):
+    modified_after = datetime(2025, 6, 1)
+
+    WordPressApiSource().load(modified_after=modified_after, selective_media=True)
+
+    mock_fetch_litigation_data.assert_called_once_with(
+        modified_after=modified_after,
+        checkpoints=None,
+        deadline=None,
+        selective_media=True,
+    )
+
+
+@patch("litigation_data_mapper.data_sources.iter_word_press_data")
+def test_api_source_streams_from_wordpress(mock_iter_word_press_data):
+    mock_iter_word_press_data.return_value = iter([{"id": 1}])
+    modified_after = datetime(2025, 6, 1)
+    source = WordPressApiSource()
+
+    assert list(source.iter_records("us_cases", modified_after)) == [{"id": 1}]
+    assert list(source.iter_records("case_bundles", modified_after)) == []
+
+    [us_cases_call, case_bundles_call] = mock_iter_word_press_data.call_args_list
+    assert us_cases_call.args == (ENDPOINTS["us_cases"],)
+    assert us_cases_call.kwargs["fields"] == ENDPOINT_FIELDS["us_cases"]
+    assert us_cases_call.kwargs["modified_after"] == modified_after
+    # Case bundles have no modified date to filter on
+    assert case_bundles_call.kwargs["modified_after"] is None
+    assert us_cases_call.kwargs["deadline"] is case_bundles_call.kwargs["deadline"]
+
+
+@patch("litigation_data_mapper.extract_concepts.fetch_individual_concepts")
+@patch("litigation_data_mapper.data_sources.extract_concepts")
+def test_api_source_prefetches_the_concepts_it_is_given_by_taxonomy(
+    mock_extract_concepts, mock_fetch_individual_concepts
+):
+    mock_extract_concepts.return_value = {1: "known"}
+    mock_fetch_individual_concepts.return_value = {2: "missing"}
+
+    concepts = WordPressApiSource().load_concepts({"entity": {1, 2}, "court": set()})
+
+    assert concepts == {1: "known", 2: "missing"}
+    mock_fetch_individual_concepts.assert_called_once()
+    assert mock_fetch_individual_concepts.call_args.args[:2] == ([2], "entity")
+
+
+def test_get_data_source():
+    assert isinstance(get_data_source("api"), WordPressApiSource)
+    local_source = get_data_source("local", snapshot_dir="./snapshot")
+    assert isinstance(local_source, LocalSnapshotSource)
+    assert local_source.directory == "./snapshot"
+
+    with pytest.raises(ValueError):
+        get_data_source("ftp")
+
+
+def test_snapshot_sources_must_say_how_to_read_an_endpoint():
+    with pytest.raises(TypeError):
+        SnapshotSource()  # type: ignore[abstract]
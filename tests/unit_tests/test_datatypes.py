@@ -0,0 +1,101 @@
+from datetime import datetime
+
+from litigation_data_mapper.datatypes import (
+    Failure,
+    FailureLog,
+    LitigationContext,
+    SkipIndex,
+)
+from litigation_data_mapper.parsers.helpers import write_error_log
+
+
+def new_context(**kwargs) -> LitigationContext:
+    return LitigationContext(
+        **{
+            "failures": [],
+            "debug": False,
+            "get_modified_data": False,
+            "last_import_date": datetime(2025, 1, 1),
+            "case_bundles": {},
+            "skipped_families": [],
+            "skipped_documents": [],
+            **kwargs,
+        }
+    )
+
+
+def test_skip_index_keeps_every_skip_in_order():
+    skipped = SkipIndex([3, 1])
+    skipped.append(3)
+    skipped.extend([2])
+
+    assert 3 in skipped
+    assert 4 not in skipped
+    assert list(skipped) == [3, 1, 3, 2]
+    assert skipped == [3, 1, 3, 2]
+    assert len(skipped) == 4
+    assert skipped[1:] == [1, 3, 2]
+
+
+def test_failure_log_buckets_failures_by_type():
+    failures = FailureLog(
+        [
+            Failure(id=1, type="us_case", reason="Missing docket number"),
+            Failure(id=10, type="document", reason="Missing a valid source url"),
+        ]
+    )
+    failures.append(
+        Failure(id=11, type="document", reason="Missing a valid source url")
+    )
+
+    assert [failure.id for failure in failures] == [1, 10, 11]
+    assert [failure.id for failure in failures.of_type("document")] == [10, 11]
+    assert failures.of_type("event") == []
+    assert failures.counts() == {"us_case": 1, "document": 2}
+    assert Failure(id=1, type="us_case", reason="Missing docket number") in failures
+    assert failures[-1].id == 11
+
+
+def test_context_indexes_the_lists_it_is_created_with():
+    context = new_context(
+        failures=[Failure(id=1, type="case", reason="No id")],
+        skipped_families=[1],
+        skipped_documents=[10],
+    )
+
+    assert isinstance(context.failures, FailureLog)
+    assert isinstance(context.skipped_families, SkipIndex)
+    assert isinstance(context.skipped_documents, SkipIndex)
+    assert 1 in context.skipped_families
+    assert context.skipped_documents == [10]
+
+
+def test_merges_contexts_in_order(tmp_path):
+    first = new_context(
+        failures=[Failure(id=1, type="us_case", reason="Missing title")],
+        skipped_families=[1],
+        case_bundles={5: {"description": "Bundle"}},
+    )
+    second = new_context(
+        failures=[
+            Failure(id=20, type="document", reason="Missing a valid source url"),
+            Failure(id=2, type="event", reason="Invalid filing year"),
+        ],
+        skipped_families=[1],
+        skipped_documents=[20],
+    )
+
+    first.merge(second)
+
+    assert [failure.id for failure in first.failures] == [1, 20, 2]
+    assert first.failures.counts() == {"us_case": 1, "document": 1, "event": 1}
+    assert first.skipped_families == [1, 1]
+    assert 20 in first.skipped_documents
+    assert first.case_bundles == {5: {"description": "Bundle"}}
+
+    output_path = tmp_path / "error_log.txt"
+    write_error_log(first, str(output_path))
+    error_log = output_path.read_text()
+    assert "#1: Family/Case ID 1\n#2: Family/Case ID 1\n" in error_log
+    assert "Total failures: 3\n" in error_log
+    assert "Total skipped families/cases: 2\n" in error_log
@@ -6,6 +6,8 @@ from litigation_data_mapper.extract_concepts import (
     Concept,
     ConceptType,
     extract_concepts,
+    fetch_individual_concepts,
+    prefetch_missing_concepts,
 )
 
 
@@ -35,3 +37,91 @@ def test_extract_concepts_adds_synthetic_us_principal_law_and_jurisdiction_conce
             relation="jurisdiction",
         ),
     }
+
+
+@patch("litigation_data_mapper.extract_concepts.fetch_word_press_data")
+def test_extract_concepts_merges_taxonomies_in_order(mock_fetch_word_press_data):
+    # The same term id in two taxonomies resolves to the later taxonomy, as it did when
+    # the taxonomies were fetched one at a time
+    def fetch(endpoint, **kwargs):
+        taxonomy = endpoint.rsplit("/", 1)[-1]
+        if taxonomy in ("entity", "jurisdiction"):
+            return [{"id": 1, "name": taxonomy, "parent": 0}]
+        return []
+
+    mock_fetch_word_press_data.side_effect = fetch
+
+    concepts = extract_concepts()
+
+    assert concepts[1].preferred_label == "jurisdiction"
+    assert mock_fetch_word_press_data.call_count == 6
+
+
+@patch("litigation_data_mapper.extract_concepts.fetch_word_press_resources")
+def test_fetch_individual_concepts_fetches_missing_parents_in_one_batch(
+    mock_fetch_word_press_resources,
+):
+    known_parent = Concept(
+        internal_id=1,
+        id="Federal",
+        type=ConceptType.LegalEntity,
+        preferred_label="Federal",
+    )
+    mock_fetch_word_press_resources.side_effect = [
+        {
+            10: {"id": 10, "name": "Courts &amp; Tribunals", "parent": 1},
+            11: {"id": 11, "name": "Supreme Court", "parent": 2},
+            12: {"id": 12, "name": "District Court", "parent": 2},
+        },
+        {2: {"id": 2, "name": "State", "parent": 0}},
+    ]
+
+    concepts = fetch_individual_concepts([10, 11, 12, 13], "entity", {1: known_parent})
+
+    assert sorted(concepts) == [10, 11, 12]
+    assert concepts[10].preferred_label == "Courts & Tribunals"
+    assert concepts[10].subconcept_of_labels == ["Federal"]
+    assert concepts[11].subconcept_of_labels == ["State"]
+    assert concepts[12].subconcept_of_labels == ["State"]
+    assert mock_fetch_word_press_resources.call_count == 2
+    assert mock_fetch_word_press_resources.call_args_list[1].args[1] == {2}
+
+
+@patch("litigation_data_mapper.extract_concepts.fetch_individual_concepts")
+def test_prefetch_missing_concepts_fetches_only_unknown_ids_per_taxonomy(
+    mock_fetch_individual_concepts,
+):
+    known = Concept(
+        internal_id=1, id="Known", type=ConceptType.LegalEntity, preferred_label="Known"
+    )
+    missing = Concept(
+        internal_id=2,
+        id="Missing",
+        type=ConceptType.LegalEntity,
+        preferred_label="Missing",
+    )
+    mock_fetch_individual_concepts.side_effect = lambda ids, taxonomy, *args: (
+        {2: missing} if taxonomy == "entity" else {}
+    )
+    records = [
+        {"id": 10, "entity": [1, 2]},
+        {"id": 11, "entity": [2], "principal_law": [3]},
+        {"id": 12, "jurisdiction": []},
+    ]
+
+    concepts = prefetch_missing_concepts(records, {1: known})
+
+    assert concepts == {2: missing}
+    requested = {
+        call.args[1]: call.args[0]
+        for call in mock_fetch_individual_concepts.call_args_list
+    }
+    assert requested == {"entity": [2], "principal_law": [3]}
+
+
+@patch("litigation_data_mapper.extract_concepts.fetch_individual_concepts")
+def test_prefetch_missing_concepts_does_nothing_when_every_concept_is_known(
+    mock_fetch_individual_concepts,
+):
+    assert prefetch_missing_concepts([{"id": 10, "entity": []}], {}) == {}
+    mock_fetch_individual_concepts.assert_not_called()
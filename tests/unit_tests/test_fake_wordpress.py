@@ -0,0 +1,116 @@
+import requests
+
+from litigation_data_mapper.fake_wordpress import (
+    FakeWordPressConfig,
+    build_corpus,
+    run_fake_wordpress,
+)
+from litigation_data_mapper.retry_policy import RetryPolicy, get_retry_stats
+from litigation_data_mapper.wordpress import (
+    fetch_individual_wordpress_resource,
+    fetch_word_press_data,
+    fetch_word_press_resources,
+)
+
+SMALL_CORPUS = FakeWordPressConfig(
+    us_cases=25, global_cases=5, case_bundles=3, terms_per_taxonomy=10
+)
+
+FAST_RETRY_POLICY = RetryPolicy(retries=3, backoff_factor=0.01)
+
+
+def test_builds_the_same_corpus_from_the_same_config():
+    corpus = build_corpus(SMALL_CORPUS)
+
+    assert corpus == build_corpus(SMALL_CORPUS)
+    assert len(corpus["case"]) == 25
+    assert len(corpus["non_us_case"]) == 5
+    assert len(corpus["media"]) == 30 * SMALL_CORPUS.documents_per_case
+
+    media_ids = {media["id"] for media in corpus["media"]}
+    for case in corpus["case"]:
+        assert {d["ccl_file"] for d in case["acf"]["ccl_case_documents"]} <= media_ids
+    for bundle in corpus["case_bundle"]:
+        for case_id in bundle["acf"]["ccl_cases"]:
+            case = next(case for case in corpus["case"] if case["id"] == case_id)
+            assert bundle["id"] in case["acf"]["ccl_case_bundle"]
+
+
+def test_pages_records_with_wordpress_headers():
+    with run_fake_wordpress(SMALL_CORPUS) as server:
+        response = requests.get(
+            f"{server.base_url}/case",
+            params={"page": 3, "per_page": 10, "_fields": "id,type"},
+            timeout=5,
+        )
+
+    assert response.status_code == 200
+    assert response.headers["X-WP-Total"] == "25"
+    assert response.headers["X-WP-TotalPages"] == "3"
+    assert len(response.json()) == 5
+    assert all(set(record) == {"id", "type"} for record in response.json())
+
+
+def test_rejects_pages_past_the_last():
+    with run_fake_wordpress(SMALL_CORPUS) as server:
+        response = requests.get(
+            f"{server.base_url}/case", params={"page": 4, "per_page": 10}, timeout=5
+        )
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "rest_post_invalid_page_number"
+
+
+def test_fetches_every_record_concurrently():
+    corpus = build_corpus(SMALL_CORPUS)
+
+    with run_fake_wordpress(SMALL_CORPUS) as server:
+        data = fetch_word_press_data(
+            f"{server.base_url}/case", per_page=10, max_workers=3
+        )
+
+    assert sorted(record["id"] for record in data) == sorted(
+        case["id"] for case in corpus["case"]
+    )
+
+
+def test_fetches_records_by_id_and_individually():
+    corpus = build_corpus(SMALL_CORPUS)
+    ids = [case["id"] for case in corpus["case"][:3]]
+
+    with run_fake_wordpress(SMALL_CORPUS) as server:
+        records = fetch_word_press_resources(f"{server.base_url}/case", ids)
+        found = fetch_individual_wordpress_resource(f"{server.base_url}/case/{ids[0]}")
+        missing = fetch_individual_wordpress_resource(
+            f"{server.base_url}/case/999999", retry_policy=FAST_RETRY_POLICY
+        )
+
+    assert sorted(records) == sorted(ids)
+    assert found == corpus["case"][0]
+    assert missing is None
+
+
+def test_retries_through_injected_errors_and_rate_limiting():
+    config = FakeWordPressConfig(
+        us_cases=25,
+        global_cases=0,
+        case_bundles=0,
+        terms_per_taxonomy=0,
+        error_rate=0.3,
+        rate_limit_every=2,
+        retry_after=0.05,
+        seed=1,
+    )
+
+    with run_fake_wordpress(config) as server:
+        data = fetch_word_press_data(
+            f"{server.base_url}/case",
+            per_page=5,
+            retry_policy=RetryPolicy(retries=10, backoff_factor=0.01),
+        )
+        stats = server.stats()
+
+    assert len(data) == 25
+    assert stats.rate_limited > 0
+    assert stats.errors > 0
+    assert get_retry_stats().total_retries == stats.errors + stats.rate_limited
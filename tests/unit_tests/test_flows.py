@@ -1,9 +1,19 @@
-from unittest.mock import patch
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 from prefect.testing.utilities import prefect_test_harness
 
-from litigation_data_mapper.flows import sync_wordpress_to_s3
+from litigation_data_mapper.checkpoints import PageCheckpoint, S3CheckpointStore
+from litigation_data_mapper.flows import (
+    ENDPOINT_PROBE_MAX_AGE,
+    fetch_litigation_data_task,
+    load_endpoint_probe,
+    save_endpoint_probe,
+    sync_wordpress_to_s3,
+)
+from litigation_data_mapper.wordpress import EndpointProbe
 from litigation_data_mapper.wordpress_data import endpoints
 
 
@@ -17,8 +27,14 @@ def prefect_test_fixture():
     "endpoint",
     endpoints,
 )
+@patch(
+    "litigation_data_mapper.flows.probe_word_press_endpoint",
+    return_value=EndpointProbe(total=3, newest="2025-06-01T00:00:00"),
+)
 @patch("litigation_data_mapper.flows.fetch_word_press_data", return_value=[1, 2, 3])
-def test_sync_wordpress_to_s3(mock_fetch_word_press_data, mock_s3_client, endpoint):
+def test_sync_wordpress_to_s3(
+    mock_fetch_word_press_data, mock_probe_word_press_endpoint, mock_s3_client, endpoint
+):
     mock_s3_client.create_bucket(
         Bucket="cpr-cache",
         CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
@@ -30,3 +46,132 @@ def test_sync_wordpress_to_s3(mock_fetch_word_press_data, mock_s3_client, endpoi
     assert mock_s3_client.head_object(
         Bucket="cpr-cache", Key=f"litigation/wordpress/{endpoint}.json"
     )
+
+
+@patch("litigation_data_mapper.flows.probe_word_press_endpoint")
+@patch("litigation_data_mapper.flows.fetch_word_press_data", return_value=[1, 2, 3])
+def test_sync_wordpress_to_s3_skips_endpoints_that_have_not_changed(
+    mock_fetch_word_press_data, mock_probe_word_press_endpoint, mock_s3_client
+):
+    mock_s3_client.create_bucket(
+        Bucket="cpr-cache",
+        CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+    )
+    probes = {
+        endpoint: EndpointProbe(total=3, newest=str(i))
+        for i, endpoint in enumerate(endpoints)
+    }
+    mock_probe_word_press_endpoint.side_effect = lambda url, **kwargs: probes[
+        url.rsplit("/", 1)[-1]
+    ]
+
+    sync_wordpress_to_s3()
+    assert mock_fetch_word_press_data.call_count == len(endpoints)
+
+    mock_fetch_word_press_data.reset_mock()
+    probes["case"] = EndpointProbe(total=4, newest="2025-06-01T00:00:00")
+
+    sync_wordpress_to_s3()
+
+    mock_fetch_word_press_data.assert_called_once()
+    assert mock_fetch_word_press_data.call_args.args[0].endswith("/case")
+    assert load_endpoint_probe(mock_s3_client, "case")[0] == probes["case"]  # type: ignore[index]
+
+    # Each dated snapshot holds every endpoint, skipped or not
+    snapshots: dict[str, set[str]] = {}
+    for s3_object in mock_s3_client.list_objects_v2(
+        Bucket="cpr-cache", Prefix="litigation/wordpress/"
+    )["Contents"]:
+        prefix, _, name = (
+            s3_object["Key"].removeprefix("litigation/wordpress/").rpartition("/")
+        )
+        if prefix and prefix != "probes":
+            snapshots.setdefault(prefix, set()).add(name)
+    assert len(snapshots) == 2
+    assert all(
+        names == {f"{endpoint}.json" for endpoint in endpoints}
+        for names in snapshots.values()
+    )
+
+
+@patch(
+    "litigation_data_mapper.flows.probe_word_press_endpoint",
+    return_value=EndpointProbe(total=3, newest="2025-06-01T00:00:00"),
+)
+@patch("litigation_data_mapper.flows.fetch_word_press_data", return_value=[1, 2, 3])
+def test_sync_wordpress_to_s3_resyncs_endpoints_last_synced_long_ago(
+    mock_fetch_word_press_data, mock_probe_word_press_endpoint, mock_s3_client
+):
+    mock_s3_client.create_bucket(
+        Bucket="cpr-cache",
+        CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+    )
+    long_ago = datetime.now(tz=timezone.utc) - ENDPOINT_PROBE_MAX_AGE
+    for endpoint in endpoints:
+        save_endpoint_probe(
+            mock_s3_client,
+            endpoint,
+            EndpointProbe(total=3, newest="2025-06-01T00:00:00"),
+            long_ago,
+        )
+
+    sync_wordpress_to_s3()
+
+    assert mock_fetch_word_press_data.call_count == len(endpoints)
+
+
+@patch(
+    "litigation_data_mapper.flows.probe_word_press_endpoint",
+    side_effect=requests.ConnectionError("Error"),
+)
+@patch("litigation_data_mapper.flows.fetch_word_press_data", return_value=[1, 2, 3])
+def test_sync_wordpress_to_s3_syncs_endpoints_that_could_not_be_probed(
+    mock_fetch_word_press_data, mock_probe_word_press_endpoint, mock_s3_client
+):
+    mock_s3_client.create_bucket(
+        Bucket="cpr-cache",
+        CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+    )
+
+    sync_wordpress_to_s3()
+    sync_wordpress_to_s3()
+
+    assert mock_fetch_word_press_data.call_count == 2 * len(endpoints)
+    assert load_endpoint_probe(mock_s3_client, "case") is None
+
+
+@pytest.mark.parametrize("checkpoint_pages", [False, True])
+@patch("litigation_data_mapper.flows.get_data_source")
+def test_fetch_litigation_data_task_only_checkpoints_when_asked_to(
+    mock_get_data_source, mock_s3_client, checkpoint_pages
+):
+    mock_s3_client.create_bucket(
+        Bucket="cpr-cache",
+        CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+    )
+    # Left behind by an earlier run that failed
+    PageCheckpoint(store=S3CheckpointStore(mock_s3_client), key="case").put(
+        1, [{"id": 1}], total_pages=2
+    )
+    source = MagicMock()
+    source.load.return_value = {
+        "collections": [{"id": 1}],
+        "families": {
+            "us_cases": [{"id": 2}],
+            "global_cases": [{"id": 3}],
+            "jurisdictions": [{"id": 4}],
+        },
+        "documents": [{"id": 5}],
+        "concepts": {},
+    }
+    mock_get_data_source.return_value = source
+
+    fetch_litigation_data_task.fn(checkpoint_pages=checkpoint_pages)
+
+    checkpoints = mock_get_data_source.call_args.kwargs["checkpoints"]
+    assert isinstance(checkpoints, S3CheckpointStore) is checkpoint_pages
+    # A completed run clears every checkpoint it could have resumed from
+    remaining = mock_s3_client.list_objects_v2(
+        Bucket="cpr-cache", Prefix="litigation/wordpress/checkpoints/"
+    )
+    assert ("Contents" in remaining) is not checkpoint_pages
@@ -0,0 +1,40 @@
+from litigation_data_mapper.litigation_index import (
+    LitigationIndex,
+    get_litigation_index,
+)
+
+
+def test_builds_an_index_of_the_litigation_data():
+    data = {
+        "collections": [{"id": 1, "title": "Bundle"}],
+        "families": {
+            "us_cases": [{"id": 10, "type": "case"}],
+            "global_cases": [{"id": 20, "type": "non_us_case"}],
+            "jurisdictions": [{"id": 5, "name": "Canada", "parent": 0}],
+        },
+        "documents": [{"id": 100, "source_url": "https://example.org/100.pdf"}],
+        "concepts": {},
+    }
+
+    index = LitigationIndex.build(data)
+
+    assert index.bundles == {1: {"id": 1, "title": "Bundle"}}
+    assert sorted(index.cases) == [10, 20]
+    assert index.media[100]["source_url"] == "https://example.org/100.pdf"
+    assert index.jurisdictions[5]["name"] == "Canada"
+
+
+def test_keeps_the_first_record_with_each_id_and_skips_records_without_one():
+    index = LitigationIndex.from_records(
+        bundles=[{"id": 1, "title": "First"}, {"id": 1, "title": "Second"}, {}]
+    )
+
+    assert index.bundles == {1: {"id": 1, "title": "First"}}
+
+
+def test_indexes_a_list_of_case_bundles_unless_already_an_index():
+    index = LitigationIndex.from_records(bundles=[{"id": 1}])
+
+    assert get_litigation_index(index) is index
+    assert get_litigation_index([{"id": 1}]) == index
+    assert get_litigation_index(None) == LitigationIndex()
@@ -0,0 +1,263 @@
+import copy
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from litigation_data_mapper.datatypes import LitigationContext
+from litigation_data_mapper.parsers.case import map_cases
+from litigation_data_mapper.parsers.collection import map_collections
+from litigation_data_mapper.parsers.document import map_documents
+from litigation_data_mapper.parsers.event import map_events
+from litigation_data_mapper.parsers.family import map_families
+
+
+def us_case(case_id: int, **acf) -> dict:
+    return {
+        "id": case_id,
+        "modified_gmt": "2025-02-01T12:00:00",
+        "title": {"rendered": f"US case {case_id}"},
+        "type": "case",
+        "entity": [],
+        "acf": {
+            "ccl_case_bundle": [1],
+            "ccl_docket_number": f"1:20-cv-{case_id}",
+            "ccl_filing_year_for_action": "2020",
+            "ccl_state": "NY",
+            "ccl_case_documents": [
+                {
+                    "ccl_document_type": "petition",
+                    "ccl_filing_date": "20250122",
+                    "ccl_file": case_id * 10 + 2,
+                    "ccl_document_headline": "",
+                    "ccl_document_summary": "Summary",
+                    "ccl_outcome": "Outcome",
+                },
+                {
+                    "ccl_document_type": "complaint",
+                    "ccl_filing_date": "",
+                    "ccl_file": case_id * 10 + 1,
+                    "ccl_document_headline": "Headline",
+                    "ccl_document_summary": "Summary",
+                    "ccl_outcome": "",
+                },
+            ],
+            **acf,
+        },
+    }
+
+
+def global_case(case_id: int, **acf) -> dict:
+    return {
+        "id": case_id,
+        "modified_gmt": "2025-02-01T12:00:00",
+        "title": {"rendered": f"Global case {case_id}"},
+        "type": "non_us_case",
+        "jurisdiction": [1],
+        "acf": {
+            "ccl_nonus_case_name": f"Global case {case_id}",
+            "ccl_nonus_summary": "Summary",
+            "ccl_nonus_reporter_info": "",
+            "ccl_nonus_filing_year_for_action": "2022",
+            "ccl_nonus_status": "Pending",
+            "ccl_nonus_core_object": "Core object",
+            "ccl_nonus_case_country": "GB",
+            "ccl_nonus_case_documents": [
+                {
+                    "ccl_nonus_document_type": "judgment",
+                    "ccl_nonus_filing_date": "20230718",
+                    "ccl_nonus_file": case_id * 10 + 1,
+                    "ccl_nonus_document_summary": "Summary",
+                },
+            ],
+            **acf,
+        },
+    }
+
+
+@pytest.fixture()
+def litigation_data():
+    unmodified = us_case(105)
+    unmodified["modified_gmt"] = ""
+    untitled = global_case(203)
+    untitled["title"] = {}
+    without_id = global_case(205)
+    del without_id["id"]
+
+    yield {
+        "collections": [
+            {
+                "id": 1,
+                "modified_gmt": "2025-02-01T12:00:00",
+                "type": "case_bundle",
+                "title": {"rendered": "Bundle"},
+                "acf": {"ccl_cases": [101], "ccl_core_object": "Bundle summary"},
+            }
+        ],
+        "families": {
+            "us_cases": [
+                us_case(101),
+                us_case(102, ccl_docket_number=""),
+                us_case(103, ccl_case_documents=[]),
+                {"title": {"rendered": "No id"}, "type": "case", "acf": {}},
+                unmodified,
+                us_case(106, ccl_filing_year_for_action="sometime"),
+            ],
+            "global_cases": [
+                global_case(201),
+                global_case(202, ccl_nonus_case_documents=None),
+                untitled,
+                global_case(
+                    204,
+                    ccl_nonus_filing_year_for_action="",
+                    ccl_nonus_case_documents=[
+                        {
+                            "ccl_nonus_document_type": "unknown",
+                            "ccl_nonus_filing_date": "20230718",
+                            "ccl_nonus_file": 2041,
+                            "ccl_nonus_document_summary": "Summary",
+                        },
+                        {
+                            "ccl_nonus_document_type": "decision",
+                            "ccl_nonus_filing_date": "20240101",
+                            "ccl_nonus_file": "",
+                            "ccl_nonus_document_summary": "Summary",
+                        },
+                    ],
+                ),
+                without_id,
+            ],
+            "jurisdictions": [{"id": 1, "name": "United Kingdom", "parent": 0}],
+        },
+        "documents": [
+            {"id": 1011, "source_url": "https://admin.example.org/1011.pdf"},
+            {"id": 1012, "source_url": "https://example.org/1012.jpg"},
+            {"id": 1021, "source_url": "https://example.org/1021.pdf"},
+            {"id": 1022, "source_url": "https://example.org/1022.pdf"},
+            {"id": 1061, "source_url": "https://example.org/1061.pdf"},
+            {"id": 2011, "source_url": "https://example.org/2011.docx"},
+            {"id": 2031, "source_url": "https://example.org/2031.pdf"},
+            {"id": 2041, "source_url": "https://example.org/2041.pdf"},
+        ],
+        "concepts": {},
+    }
+
+
+def new_context() -> LitigationContext:
+    return LitigationContext(
+        failures=[],
+        debug=False,
+        get_modified_data=False,
+        last_import_date=datetime(2025, 1, 1),
+        case_bundles={},
+        skipped_families=[],
+        skipped_documents=[],
+    )
+
+
+def map_in_three_passes(data, context):
+    return {
+        "families": map_families(
+            data["families"], context, data["collections"], data["concepts"]
+        ),
+        "documents": map_documents(
+            {"documents": data["documents"], "families": data["families"]}, context
+        ),
+        "events": map_events(data["families"], context),
+    }
+
+
+@pytest.mark.parametrize(
+    "remove",
+    [None, "documents", "jurisdictions"],
+)
+@patch("litigation_data_mapper.parsers.family.fetch_individual_concept")
+def test_maps_cases_in_one_pass_like_the_separate_passes(
+    mock_fetch_individual_concept, remove, litigation_data, tmp_path, monkeypatch
+):
+    mock_fetch_individual_concept.return_value = None
+    monkeypatch.chdir(tmp_path)
+    if remove == "documents":
+        litigation_data["documents"] = []
+    elif remove == "jurisdictions":
+        litigation_data["families"]["jurisdictions"] = []
+
+    three_pass_context = new_context()
+    map_collections(litigation_data["collections"], three_pass_context)
+    expected = map_in_three_passes(copy.deepcopy(litigation_data), three_pass_context)
+    expected_error_log = (tmp_path / "error_log.txt").read_text()
+
+    single_pass_context = new_context()
+    map_collections(litigation_data["collections"], single_pass_context)
+    mapped = map_cases(copy.deepcopy(litigation_data), single_pass_context)
+
+    assert mapped == expected
+    assert list(mapped) == ["families", "documents", "events"]
+    assert single_pass_context.failures == three_pass_context.failures
+    assert single_pass_context.skipped_families == three_pass_context.skipped_families
+    assert single_pass_context.skipped_documents == three_pass_context.skipped_documents
+    assert (tmp_path / "error_log.txt").read_text() == expected_error_log
+
+
+@patch("litigation_data_mapper.parsers.family.fetch_individual_concept")
+def test_maps_cases_with_every_step_failing_somewhere(
+    mock_fetch_individual_concept, litigation_data, tmp_path, monkeypatch
+):
+    mock_fetch_individual_concept.return_value = None
+    monkeypatch.chdir(tmp_path)
+    context = new_context()
+    map_collections(litigation_data["collections"], context)
+
+    mapped = map_cases(litigation_data, context)
+
+    assert [family["import_id"] for family in mapped["families"]] == [
+        "Sabin.family.101.0",
+        "Sabin.family.103.0",
+        "Sabin.family.106.0",
+        "Sabin.family.201.0",
+        "Sabin.family.202.0",
+        "Sabin.family.204.0",
+    ]
+    # Documents map the global cases first
+    assert [document["import_id"] for document in mapped["documents"]] == [
+        "Sabin.document.201.2011",
+        "Sabin.document.202.placeholder",
+        "Sabin.document.204.2041",
+        "Sabin.document.101.1011",
+        "Sabin.document.103.placeholder",
+        "Sabin.document.106.1061",
+    ]
+    assert [event["import_id"] for event in mapped["events"]] == [
+        "Sabin.event.101.n0000",
+        "Sabin.event.101.n0001",
+        "Sabin.event.103.n0000",
+        "Sabin.event.201.n0000",
+        "Sabin.event.201.n0001",
+        "Sabin.event.202.n0000",
+        "Sabin.event.204.n0000",
+        "Sabin.event.204.n0001",
+    ]
+    assert context.skipped_families == [102, 105, 203]
+    assert context.skipped_documents == [1012, 1062]
+    assert [(failure.id, failure.reason) for failure in context.failures] == [
+        (102, "Missing the following values: docket_number"),
+        (None, "Does not contain a us case id at index (3)."),
+        (105, "Does not contain a modified_gmt timestamp."),
+        (203, "Missing the following values: title"),
+        (None, "Does not contain a us case id at index (4)."),
+        (202, "Does not contain documents - events will still be mapped"),
+        (
+            None,
+            "Document-id is an empty string, assuming no associated files. "
+            "Case-id(204)",
+        ),
+        (None, "Does not contain a case id at index (4). Mapping documents."),
+        (1012, "Document has unsupported file extension [.jpg]"),
+        (103, "Does not contain documents - events will still be mapped"),
+        (None, "Does not contain a case id at index (8). Mapping documents."),
+        (1062, "Missing a valid source url"),
+        (None, "Does not contain a case id at index (3). Mapping events."),
+        (106, "Event does not have valid filing year for action [sometime]"),
+        (204, "Event has invalid event type: (unknown)"),
+        (None, "Does not contain a case id at index (10). Mapping events."),
+    ]
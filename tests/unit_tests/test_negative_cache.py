@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+import requests
+
+from litigation_data_mapper.extract_concepts import fetch_individual_concepts
+from litigation_data_mapper.negative_cache import NegativeCache, get_negative_cache
+
+
+def test_remembers_unresolvable_concepts_and_counts_lookups_avoided():
+    cache = NegativeCache()
+    cache.add("entity", [1, 2])
+
+    assert cache.is_unresolvable("entity", 1)
+    assert cache.is_unresolvable("entity", 2)
+    assert not cache.is_unresolvable("principal_law", 1)
+    assert cache.lookups_avoided == 2
+
+
+def test_forgets_unresolvable_concepts_once_expired():
+    cache = NegativeCache(ttl_seconds=0)
+    cache.add("entity", [1])
+
+    assert not cache.is_unresolvable("entity", 1)
+    assert len(cache) == 0
+
+
+def test_persists_unresolvable_concepts_between_runs(tmp_path):
+    path = str(tmp_path / "negative_cache.json")
+    NegativeCache(path=path).add("entity", [1])
+
+    cache = NegativeCache(path=path)
+
+    assert cache.is_unresolvable("entity", 1)
+    assert not NegativeCache(path=path, ttl_seconds=0).is_unresolvable("entity", 2)
+
+
+@patch("litigation_data_mapper.extract_concepts.fetch_word_press_resources")
+def test_fetch_individual_concepts_does_not_request_missing_concepts_twice(
+    mock_fetch_word_press_resources,
+):
+    mock_fetch_word_press_resources.return_value = {
+        1: {"id": 1, "name": "Found", "parent": 0}
+    }
+
+    assert list(fetch_individual_concepts([1, 2], "entity", {})) == [1]
+    assert fetch_individual_concepts([2], "entity", {}) == {}
+
+    mock_fetch_word_press_resources.assert_called_once()
+    assert get_negative_cache().lookups_avoided == 1
+
+
+@patch("litigation_data_mapper.extract_concepts.fetch_word_press_resources")
+def test_fetch_individual_concepts_does_not_remember_failed_requests(
+    mock_fetch_word_press_resources,
+):
+    mock_fetch_word_press_resources.side_effect = requests.ConnectionError("Error")
+
+    assert fetch_individual_concepts([2], "entity", {}) == {}
+    assert fetch_individual_concepts([2], "entity", {}) == {}
+
+    assert mock_fetch_word_press_resources.call_count == 2
+    assert len(get_negative_cache()) == 0
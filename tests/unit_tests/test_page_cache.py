@@ -0,0 +1,122 @@
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+from litigation_data_mapper.page_cache import CachedPage, PageCache
+from litigation_data_mapper.schemas import CaseBundle, RecordDecoder
+from litigation_data_mapper.wordpress import fetch_word_press_data
+
+ENDPOINT = "https://admin.climatecasechart.com/wp-json/wp/v2/case_bundle"
+
+
+def _mock_response(status_code, data=None, headers=None):
+    mock_response = MagicMock()
+    mock_response.status_code = status_code
+    mock_response.json.return_value = data
+    mock_response.headers = {"X-WP-TotalPages": "1", **(headers or {})}
+    mock_response.__enter__.return_value = mock_response
+    mock_response.__exit__.return_value = None
+    return mock_response
+
+
+def test_page_cache_round_trip(tmp_path):
+    cache = PageCache(str(tmp_path))
+    page = CachedPage(etag='"abc"', last_modified=None, total_pages=3, data=[{"id": 1}])
+
+    cache.put(ENDPOINT, {"page": 1}, page)
+
+    assert cache.get(ENDPOINT, {"page": 1}) == page
+    assert cache.get(ENDPOINT, {"page": 2}) is None
+
+
+def test_page_cache_evicts_least_recently_used_pages(tmp_path):
+    cache = PageCache(str(tmp_path))
+    page = CachedPage(etag='"abc"', last_modified=None, total_pages=1, data=[{"id": 1}])
+    cache.put(ENDPOINT, {"page": 1}, page)
+    page_size = cache.size()
+
+    cache.max_bytes = page_size * 2
+    cache.put(ENDPOINT, {"page": 2}, page)
+    # Using page 1 leaves page 2 as the least recently used
+    cache.get(ENDPOINT, {"page": 1})
+    cache.put(ENDPOINT, {"page": 3}, page)
+
+    assert cache.size() == page_size * 2
+    assert cache.get(ENDPOINT, {"page": 2}) is None
+    assert cache.get(ENDPOINT, {"page": 1}) == page
+    assert cache.get(ENDPOINT, {"page": 3}) == page
+
+
+def test_page_cache_scans_the_directory_once(tmp_path):
+    page = CachedPage(etag='"abc"', last_modified=None, total_pages=1, data=[{"id": 1}])
+    PageCache(str(tmp_path)).put(ENDPOINT, {"page": 1}, page)
+    old_page = os.path.join(str(tmp_path), os.listdir(tmp_path)[0])
+    os.utime(old_page, (0, 0))
+
+    cache = PageCache(str(tmp_path))
+    with patch(
+        "litigation_data_mapper.page_cache.os.listdir", wraps=os.listdir
+    ) as mock_listdir:
+        page_size = cache.size()
+        cache.max_bytes = page_size * 2
+        for number in range(2, 6):
+            cache.put(ENDPOINT, {"page": number}, page)
+
+    assert mock_listdir.call_count == 1
+    assert cache.size() == page_size * 2
+    # The page left by an earlier run was the least recently used
+    assert not os.path.exists(old_page)
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        os.path.basename(cache._path(ENDPOINT, {"page": number})) for number in (4, 5)
+    )
+
+
+def test_fetch_word_press_data_serves_not_modified_pages_from_cache(tmp_path):
+    cache = PageCache(str(tmp_path))
+
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_get = mock_session.return_value.get
+        mock_get.return_value = _mock_response(
+            200, data=[{"id": 1}], headers={"ETag": '"v1"'}
+        )
+        first = fetch_word_press_data(ENDPOINT, cache=cache)
+
+        mock_get.return_value = _mock_response(304)
+        second = fetch_word_press_data(ENDPOINT, cache=cache)
+
+    assert first == second == [{"id": 1}]
+    assert mock_get.call_args_list[0].kwargs["headers"] == {}
+    assert mock_get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_fetch_word_press_data_caches_decoded_pages_apart_from_full_pages(tmp_path):
+    cache = PageCache(str(tmp_path))
+    bundle = {"id": 1, "type": "case_bundle", "yoast_head": "<meta>"}
+
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_get = mock_session.return_value.get
+        mock_get.return_value = _mock_response(
+            200, data=[bundle], headers={"ETag": '"v1"'}
+        )
+        mock_get.return_value.content = json.dumps([bundle]).encode("utf-8")
+        decoded = fetch_word_press_data(
+            ENDPOINT, cache=cache, decoder=RecordDecoder(CaseBundle)
+        )
+        full = fetch_word_press_data(ENDPOINT, cache=cache)
+
+    assert decoded == [{"id": 1, "type": "case_bundle"}]
+    assert full == [bundle]
+    # The page decoded through the schema is not revalidated as the full page
+    assert mock_get.call_args_list[1].kwargs["headers"] == {}
+
+
+def test_fetch_word_press_data_does_not_cache_pages_without_validators(tmp_path):
+    cache = PageCache(str(tmp_path))
+
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_session.return_value.get.return_value = _mock_response(
+            200, data=[{"id": 1}]
+        )
+        fetch_word_press_data(ENDPOINT, cache=cache)
+
+    assert cache.size() == 0
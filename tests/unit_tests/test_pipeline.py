@@ -0,0 +1,263 @@
+import json
+import tracemalloc
+from datetime import datetime
+
+import pytest
+
+from litigation_data_mapper.cli import create_context, dump_output, wrangle_data
+from litigation_data_mapper.data_sources import LocalSnapshotSource, SnapshotSource
+from litigation_data_mapper.extract_concepts import taxonomies as concept_taxonomies
+from litigation_data_mapper.pipeline import (
+    RecordSpool,
+    stream_litigation_data,
+    write_json_sections,
+)
+
+
+def us_case(case_id: int, **acf) -> dict:
+    return {
+        "id": case_id,
+        "modified_gmt": "2025-02-01T12:00:00",
+        "title": {"rendered": f"US case {case_id} – “quoted”"},
+        "type": "case",
+        "entity": [2],
+        "yoast_head": "<meta>",
+        "acf": {
+            "ccl_case_bundle": [1],
+            "ccl_docket_number": f"1:20-cv-{case_id}",
+            "ccl_filing_year_for_action": "2020",
+            "ccl_state": "NY",
+            "ccl_case_documents": [
+                {
+                    "ccl_document_type": "petition",
+                    "ccl_filing_date": "20250122",
+                    "ccl_file": case_id * 10 + 1,
+                    "ccl_document_headline": "Headline",
+                    "ccl_document_summary": "Summary\nover two lines",
+                    "ccl_outcome": "Outcome",
+                },
+                {
+                    "ccl_document_type": "complaint",
+                    "ccl_filing_date": "",
+                    "ccl_file": case_id * 10 + 2,
+                    "ccl_document_headline": "",
+                    "ccl_document_summary": "Summary",
+                    "ccl_outcome": "",
+                },
+            ],
+            **acf,
+        },
+    }
+
+
+def global_case(case_id: int, **acf) -> dict:
+    return {
+        "id": case_id,
+        "modified_gmt": "2025-02-01T12:00:00",
+        "title": {"rendered": f"Global case {case_id}"},
+        "type": "non_us_case",
+        "jurisdiction": [1],
+        "acf": {
+            "ccl_nonus_case_name": f"Global case {case_id}",
+            "ccl_nonus_summary": "Summary",
+            "ccl_nonus_reporter_info": "",
+            "ccl_nonus_filing_year_for_action": "2022",
+            "ccl_nonus_status": "Pending",
+            "ccl_nonus_core_object": "Core object",
+            "ccl_nonus_case_country": "GB",
+            "ccl_nonus_case_documents": [
+                {
+                    "ccl_nonus_document_type": "judgment",
+                    "ccl_nonus_filing_date": "20230718",
+                    "ccl_nonus_file": case_id * 10 + 1,
+                    "ccl_nonus_document_summary": "Summary",
+                },
+            ],
+            **acf,
+        },
+    }
+
+
+def media(media_id: int) -> dict:
+    return {
+        "id": media_id,
+        "source_url": f"https://admin.example.org/{media_id}.pdf",
+        "alt_text": "",
+    }
+
+
+@pytest.fixture()
+def snapshot(tmp_path):
+    old_case = us_case(104)
+    old_case["modified_gmt"] = "2024-06-01T12:00:00"
+    endpoints = {
+        **{taxonomy: [] for taxonomy in concept_taxonomies},
+        "entity": [{"id": 2, "name": "New York", "parent": 0}],
+        "case": [
+            us_case(101),
+            us_case(102, ccl_docket_number=""),
+            {"title": {"rendered": "No id"}, "type": "case", "acf": {}},
+            old_case,
+        ],
+        "non_us_case": [
+            global_case(201),
+            global_case(202, ccl_nonus_filing_year_for_action="sometime"),
+        ],
+        "case_bundle": [
+            {
+                "id": 1,
+                "modified_gmt": "2025-02-01T12:00:00",
+                "type": "case_bundle",
+                "title": {"rendered": "Bundle"},
+                "acf": {"ccl_cases": [101], "ccl_core_object": "Bundle summary"},
+            }
+        ],
+        "jurisdiction": [{"id": 1, "name": "United Kingdom", "parent": 0}],
+        "media": [
+            media(1011),
+            media(2011),
+            media(2021),
+            media(9999),
+            {"id": 1041, "source_url": "https://example.org/1041.jpg"},
+        ],
+    }
+
+    snapshot_dir = tmp_path / "snapshot"
+    snapshot_dir.mkdir()
+    for endpoint, records in endpoints.items():
+        (snapshot_dir / f"{endpoint}.json").write_text(json.dumps(records))
+    yield str(snapshot_dir)
+
+
+def test_spools_records_to_disk_and_reads_them_back_in_order():
+    records = [{"id": 1, "title": "Line separator"}, {"id": 2, "title": "“2”"}]
+
+    with RecordSpool() as spool:
+        spool.extend(records)
+        assert len(spool) == 2
+        assert list(spool) == records
+        spool.append({"id": 3})
+        assert [record["id"] for record in spool] == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "sections",
+    [
+        {},
+        {"collections": [], "families": []},
+        {
+            "families": [{"id": 1, "title": "“Case”\nwith a newline", "tags": []}],
+            "events": [{"id": 2, "nested": {"values": [1, {"a": None}]}}, {}],
+        },
+    ],
+)
+def test_writes_sections_like_json_dump(sections, tmp_path):
+    output_path = tmp_path / "output.json"
+    with open(output_path, "w", encoding="utf-8") as f:
+        counts = write_json_sections(
+            f, {key: iter(records) for key, records in sections.items()}
+        )
+
+    assert output_path.read_text(encoding="utf-8") == json.dumps(
+        sections, ensure_ascii=False, indent=2
+    )
+    assert counts == {key: len(records) for key, records in sections.items()}
+
+
+@pytest.mark.parametrize(
+    "get_modified_data, selective_media",
+    [(False, False), (True, True)],
+)
+def test_streams_the_same_output_as_wrangling_the_loaded_data(
+    get_modified_data, selective_media, snapshot, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    source = LocalSnapshotSource(snapshot)
+    last_import_date = datetime(2025, 1, 1)
+
+    litigation_data = source.load(
+        modified_after=last_import_date if get_modified_data else None,
+        selective_media=selective_media,
+    )
+    mapped_data, failures = wrangle_data(
+        litigation_data, False, get_modified_data, last_import_date
+    )
+    dump_output(mapped_data, str(tmp_path / "expected.json"))
+    expected_error_log = (tmp_path / "error_log.txt").read_text()
+    (tmp_path / "error_log.txt").unlink()
+
+    context = create_context(False, get_modified_data, last_import_date)
+    counts = stream_litigation_data(
+        source,
+        str(tmp_path / "output.json"),
+        context,
+        selective_media=selective_media,
+    )
+
+    assert (tmp_path / "output.json").read_bytes() == (
+        tmp_path / "expected.json"
+    ).read_bytes()
+    assert counts == {key: len(entities) for key, entities in mapped_data.items()}
+    assert counts["families"] > 0 and counts["documents"] > 0
+    assert list(context.failures) == failures
+    assert (tmp_path / "error_log.txt").read_text() == expected_error_log
+
+
+class GeneratedSource(SnapshotSource):
+    """A snapshot of generated cases, made as they are read."""
+
+    def __init__(self, case_count: int):
+        self.case_count = case_count
+
+    def us_case(self, case_id: int) -> dict:
+        # Every case refers to the same media files, so the side tables stay the same
+        case = us_case(case_id)
+        for number, document in enumerate(case["acf"]["ccl_case_documents"]):
+            document["ccl_file"] = 101 + number
+        return case
+
+    def read_endpoint(self, endpoint):
+        if endpoint == "case":
+            return (
+                self.us_case(case_id) for case_id in range(1000, 1000 + self.case_count)
+            )
+        if endpoint == "non_us_case":
+            return (global_case(case_id) for case_id in range(10, 20))
+        if endpoint == "case_bundle":
+            return [
+                {
+                    "id": 1,
+                    "modified_gmt": "2025-02-01T12:00:00",
+                    "type": "case_bundle",
+                    "title": {"rendered": "Bundle"},
+                    "acf": {"ccl_cases": [], "ccl_core_object": "Bundle summary"},
+                }
+            ]
+        if endpoint == "jurisdiction":
+            return [{"id": 1, "name": "United Kingdom", "parent": 0}]
+        if endpoint == "media":
+            return [media(101), media(102)]
+        if endpoint == "entity":
+            return [{"id": 2, "name": "New York", "parent": 0}]
+        return []
+
+
+def test_keeps_peak_memory_flat_as_the_corpus_grows(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def peak_memory(case_count: int) -> int:
+        context = create_context(False, False, datetime(2025, 1, 1))
+        tracemalloc.start()
+        try:
+            stream_litigation_data(
+                GeneratedSource(case_count), str(tmp_path / "output.json"), context
+            )
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    # The first run also allocates what is cached for later runs
+    peak_memory(10)
+    small, large = peak_memory(100), peak_memory(800)
+
+    assert large < small * 1.5
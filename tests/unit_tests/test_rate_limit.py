@@ -0,0 +1,145 @@
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from litigation_data_mapper.rate_limit import (
+    RateLimitedAdapter,
+    RateLimiter,
+    get_rate_limited_session,
+    get_rate_limiter,
+    parse_retry_after,
+    rate_limited_request,
+)
+
+
+def _mock_response(status_code: int, headers: dict[str, str] | None = None):
+    response = MagicMock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def test_parses_retry_after_in_seconds_and_as_a_date():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert 55 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 60
+
+
+def test_limits_the_rate_requests_are_started_at():
+    limiter = RateLimiter(rate_per_second=20, burst=1, max_concurrency=10)
+
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(200)
+
+    # The first request uses the burst, the next two wait for a token each
+    assert time.monotonic() - start >= 0.09
+
+
+def test_throttled_response_pauses_callers_and_halves_concurrency():
+    limiter = RateLimiter(rate_per_second=1000, max_concurrency=8)
+
+    limiter.acquire()
+    limiter.release(429, "0.2")
+
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+    limiter.release(200)
+
+    stats = limiter.stats()
+    assert stats.throttled == 1
+    assert stats.requests == 2
+    assert stats.concurrency_limit == 4
+
+
+def test_retry_after_of_zero_does_not_pause_callers():
+    limiter = RateLimiter(rate_per_second=1000, max_concurrency=8)
+
+    limiter.acquire()
+    limiter.release(429, "0")
+
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start < 0.1
+
+
+def test_successful_responses_grow_concurrency_back_to_the_maximum():
+    limiter = RateLimiter(rate_per_second=1000, max_concurrency=4)
+    limiter.acquire()
+    limiter.release(503, "0")
+    assert limiter.concurrency_limit == 2
+
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(200)
+
+    assert limiter.concurrency_limit == 4
+
+
+def test_limiters_are_shared_per_host():
+    assert get_rate_limiter("https://example.com/a") is get_rate_limiter(
+        "https://example.com/b?page=2"
+    )
+    assert get_rate_limiter("https://example.com/") is not get_rate_limiter(
+        "https://example.org/"
+    )
+
+
+def test_adapter_resends_throttled_requests():
+    responses = [
+        _mock_response(429, {"Retry-After": "0"}),
+        _mock_response(200),
+    ]
+    request = requests.Request("GET", "https://example.com/wp-json").prepare()
+
+    with patch(
+        "requests.adapters.HTTPAdapter.send", side_effect=responses
+    ) as mock_send:
+        response = RateLimitedAdapter().send(request)
+
+    assert response.status_code == 200
+    assert mock_send.call_count == 2
+    assert get_rate_limiter("https://example.com").stats().throttled == 1
+
+
+def test_adapter_returns_throttled_response_once_retries_are_exhausted():
+    request = requests.Request("GET", "https://example.com/wp-json").prepare()
+
+    with patch(
+        "requests.adapters.HTTPAdapter.send",
+        return_value=_mock_response(503, {"Retry-After": "0"}),
+    ) as mock_send:
+        response = RateLimitedAdapter(rate_limit_retries=2).send(request)
+
+    assert response.status_code == 503
+    assert mock_send.call_count == 3
+
+
+def test_adapter_does_not_resend_requests_that_are_not_idempotent():
+    request = requests.Request("POST", "https://example.com/api/tokens").prepare()
+
+    with patch(
+        "requests.adapters.HTTPAdapter.send",
+        return_value=_mock_response(429, {"Retry-After": "0"}),
+    ) as mock_send:
+        response = RateLimitedAdapter().send(request)
+
+    assert response.status_code == 429
+    assert mock_send.call_count == 1
+
+
+def test_one_off_requests_share_a_session():
+    with patch.object(requests.Session, "request", autospec=True) as mock_request:
+        rate_limited_request("GET", "https://example.com/a", timeout=10)
+        rate_limited_request("POST", "https://example.com/b", timeout=10)
+
+    sessions = [call.args[0] for call in mock_request.call_args_list]
+    assert sessions[0] is sessions[1] is get_rate_limited_session()
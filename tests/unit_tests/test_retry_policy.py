@@ -0,0 +1,111 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from litigation_data_mapper.retry_policy import (
+    Deadline,
+    DeadlineExceeded,
+    RetryPolicy,
+    call_with_retries,
+    get_retry_stats,
+)
+from litigation_data_mapper.wordpress import fetch_word_press_data
+
+ENDPOINT = "https://admin.climatecasechart.com/wp-json/wp/v2/case"
+
+
+def _http_error(status_code: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code} Error", response=response)
+
+
+def _mock_page_response(data, total_pages):
+    mock_response = MagicMock()
+    mock_response.json.return_value = data
+    mock_response.headers = {"X-WP-TotalPages": str(total_pages)}
+    mock_response.__enter__.return_value = mock_response
+    mock_response.__exit__.return_value = None
+    return mock_response
+
+
+@patch("litigation_data_mapper.retry_policy.time.sleep")
+def test_retries_until_the_request_succeeds(mock_sleep):
+    request = MagicMock(
+        side_effect=[requests.ConnectionError("Error"), _http_error(502), "page"]
+    )
+
+    result = call_with_retries(
+        request, "page 1", Deadline.after(60), RetryPolicy(backoff_factor=2)
+    )
+
+    assert result == "page"
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [2, 4]
+    assert get_retry_stats().retries == {"page 1": 2}
+    assert get_retry_stats().sleep_seconds == 6
+
+
+def test_does_not_retry_client_errors():
+    request = MagicMock(side_effect=_http_error(404))
+
+    with pytest.raises(requests.HTTPError):
+        call_with_retries(request, "page 1", Deadline.after(60))
+
+    assert request.call_count == 1
+
+
+@patch("litigation_data_mapper.retry_policy.time.sleep")
+def test_gives_up_after_the_retries_of_the_request(mock_sleep):
+    request = MagicMock(side_effect=requests.Timeout("Error"))
+
+    with pytest.raises(requests.Timeout):
+        call_with_retries(request, "page 1", Deadline.after(60), RetryPolicy(retries=2))
+
+    assert request.call_count == 3
+
+
+def test_caps_the_timeout_and_backoff_by_the_remaining_budget():
+    request = MagicMock(side_effect=requests.ConnectionError("Error"))
+
+    with pytest.raises(DeadlineExceeded):
+        call_with_retries(
+            request,
+            "page 1",
+            Deadline.after(0.2),
+            RetryPolicy(backoff_factor=60, timeout=10),
+        )
+
+    assert request.call_count == 1
+    assert request.call_args.args[0] <= 0.2
+    assert get_retry_stats().sleep_seconds <= 0.2
+
+
+def test_endpoint_deadline_is_never_later_than_the_run_deadline():
+    run_deadline = Deadline.after(10)
+
+    assert run_deadline.within(60) == run_deadline
+    assert run_deadline.within(1).expires_at < run_deadline.expires_at
+
+
+@patch("litigation_data_mapper.retry_policy.time.sleep")
+def test_fetch_word_press_data_retries_each_page_on_its_own(mock_sleep):
+    failures = {2: 2, 3: 1}
+
+    def get(endpoint, params, headers, timeout):
+        page = params["page"]
+        if failures.get(page):
+            failures[page] -= 1
+            raise requests.ConnectionError("Error")
+        return _mock_page_response([{"id": 4 - page}], total_pages=3)
+
+    with patch("litigation_data_mapper.wordpress.requests.Session") as mock_session:
+        mock_session.return_value.get.side_effect = get
+
+        data = fetch_word_press_data(ENDPOINT, retry_policy=RetryPolicy(retries=2))
+
+    assert data == [{"id": 3}, {"id": 2}, {"id": 1}]
+    assert get_retry_stats().retries == {
+        f"{ENDPOINT} page 2": 2,
+        f"{ENDPOINT} page 3": 1,
+    }
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from litigation_data_mapper.schemas import (
+    WORDPRESS_TYPED_DECODING_ENV,
+    CaseBundle,
+    MalformedPayload,
+    Media,
+    RecordDecoder,
+    TaxonomyTerm,
+    UsCase,
+    get_record_decoder,
+)
+
+
+def test_decodes_only_the_fields_the_parsers_read():
+    payload = json.dumps(
+        [
+            {
+                "id": 1,
+                "type": "case",
+                "title": {"rendered": "Case"},
+                "yoast_head": "<meta>",
+                "entity": [5],
+                "acf": {
+                    "ccl_state": "NY",
+                    "ccl_internal_notes": "Not mapped",
+                    "ccl_case_documents": [{"ccl_file": 10, "ccl_extra": 1}],
+                },
+            }
+        ]
+    )
+
+    assert RecordDecoder(UsCase).decode_page(payload, "test") == [
+        {
+            "id": 1,
+            "type": "case",
+            "title": {"rendered": "Case"},
+            "entity": [5],
+            "acf": {"ccl_state": "NY", "ccl_case_documents": [{"ccl_file": 10}]},
+        }
+    ]
+
+
+def test_keeps_missing_and_empty_fields_as_they_were_sent():
+    payload = json.dumps([{"id": 1, "acf": []}, {"id": 2, "acf": {"ccl_state": False}}])
+
+    assert RecordDecoder(UsCase).decode_page(payload, "test") == [
+        {"id": 1, "acf": {}},
+        {"id": 2, "acf": {"ccl_state": False}},
+    ]
+
+
+def test_keeps_empty_acf_relationships_as_they_were_sent():
+    payload = json.dumps(
+        [
+            {"id": 1, "acf": {"ccl_case_bundle": False, "ccl_case_documents": False}},
+            {"id": 2, "acf": {"ccl_case_bundle": "", "ccl_case_documents": []}},
+            {"id": 3, "acf": {"ccl_case_bundle": ["4", 5]}},
+        ]
+    )
+
+    assert RecordDecoder(UsCase).decode_page(payload, "test") == json.loads(payload)
+
+
+def test_decoders_of_different_schemas_have_different_keys():
+    assert RecordDecoder(UsCase).key == RecordDecoder(UsCase).key
+    assert RecordDecoder(UsCase).key.startswith("UsCase-")
+    assert RecordDecoder(UsCase).key != RecordDecoder(CaseBundle).key
+
+
+def test_rejects_malformed_records_and_keeps_the_rest(capsys):
+    payload = json.dumps(
+        [
+            {"id": 1, "source_url": "https://example.org/1.pdf"},
+            {"source_url": "https://example.org/no-id.pdf"},
+            {"id": 3, "source_url": ["not", "a", "url"]},
+        ]
+    )
+
+    assert RecordDecoder(Media).decode_page(payload, "media page 1") == [
+        {"id": 1, "source_url": "https://example.org/1.pdf"}
+    ]
+    errors = capsys.readouterr().err
+    assert "Rejected malformed Media record None from media page 1" in errors
+    assert "Rejected malformed Media record 3 from media page 1" in errors
+
+
+@pytest.mark.parametrize("payload", ['{"code": "rest_no_route"}', "<html>"])
+def test_raises_for_payloads_that_are_not_a_list_of_records(payload):
+    with pytest.raises(MalformedPayload):
+        RecordDecoder(TaxonomyTerm).decode_page(payload, "test")
+
+
+def test_only_decodes_through_the_schemas_when_enabled(monkeypatch):
+    monkeypatch.delenv(WORDPRESS_TYPED_DECODING_ENV, raising=False)
+    assert get_record_decoder("case") is None
+
+    monkeypatch.setenv(WORDPRESS_TYPED_DECODING_ENV, "1")
+    assert get_record_decoder("https://example.org/wp-json/wp/v2/case").schema is UsCase
+    assert get_record_decoder("non_us_case_category").schema is TaxonomyTerm
@@ -0,0 +1,161 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from litigation_data_mapper.cli import wrangle_data
+from litigation_data_mapper.extract_concepts import transform_wordpress_concepts_data
+from litigation_data_mapper.parsers.shards import ShardedCase, shard_cases
+
+
+def us_case(case_id: int, document_count: int, **acf) -> dict:
+    return {
+        "id": case_id,
+        "modified_gmt": "2025-02-01T12:00:00",
+        "title": {"rendered": f"US case {case_id}"},
+        "type": "case",
+        "entity": [2],
+        "acf": {
+            "ccl_case_bundle": [1],
+            "ccl_docket_number": f"1:20-cv-{case_id}",
+            "ccl_filing_year_for_action": "2020",
+            "ccl_state": "NY",
+            "ccl_case_documents": [
+                {
+                    "ccl_document_type": "petition",
+                    "ccl_filing_date": f"202501{number + 10}",
+                    "ccl_file": case_id * 10 + number,
+                    "ccl_document_headline": "Headline",
+                    "ccl_document_summary": "Summary",
+                    "ccl_outcome": "Outcome",
+                }
+                for number in range(document_count)
+            ],
+            **acf,
+        },
+    }
+
+
+def global_case(case_id: int, document_count: int, **acf) -> dict:
+    return {
+        "id": case_id,
+        "modified_gmt": "2025-02-01T12:00:00",
+        "title": {"rendered": f"Global case {case_id}"},
+        "type": "non_us_case",
+        "jurisdiction": [1],
+        "acf": {
+            "ccl_nonus_case_name": f"Global case {case_id}",
+            "ccl_nonus_summary": "Summary",
+            "ccl_nonus_reporter_info": "",
+            "ccl_nonus_filing_year_for_action": "2022",
+            "ccl_nonus_status": "Pending",
+            "ccl_nonus_core_object": "Core object",
+            "ccl_nonus_case_country": "GB",
+            "ccl_nonus_case_documents": [
+                {
+                    "ccl_nonus_document_type": "judgment",
+                    "ccl_nonus_filing_date": f"202307{number + 10}",
+                    "ccl_nonus_file": case_id * 10 + number,
+                    "ccl_nonus_document_summary": "Summary",
+                }
+                for number in range(document_count)
+            ],
+            **acf,
+        },
+    }
+
+
+@pytest.fixture()
+def litigation_data():
+    us_cases = [us_case(100 + number, number % 4) for number in range(12)]
+    us_cases[3]["acf"]["ccl_docket_number"] = ""
+    us_cases.append({"title": {"rendered": "No id"}, "type": "case", "acf": {}})
+    global_cases = [global_case(200 + number, number % 3) for number in range(8)]
+    global_cases[5]["acf"]["ccl_nonus_filing_year_for_action"] = "sometime"
+
+    concepts = {
+        **transform_wordpress_concepts_data(
+            data=[{"id": 1, "name": "United Kingdom", "parent": 0}],
+            taxonomy="jurisdiction",
+        ),
+        **transform_wordpress_concepts_data(
+            data=[{"id": 2, "name": "New York", "parent": 0}], taxonomy="entity"
+        ),
+    }
+    case_ids = [case["id"] for case in us_cases + global_cases if "id" in case]
+
+    yield {
+        "collections": [
+            {
+                "id": 1,
+                "modified_gmt": "2025-02-01T12:00:00",
+                "type": "case_bundle",
+                "title": {"rendered": "Bundle"},
+                "acf": {"ccl_cases": [100], "ccl_core_object": "Bundle summary"},
+            }
+        ],
+        "families": {
+            "us_cases": us_cases,
+            "global_cases": global_cases,
+            "jurisdictions": [{"id": 1, "name": "United Kingdom", "parent": 0}],
+        },
+        "documents": [
+            {
+                "id": case_id * 10 + number,
+                "source_url": f"https://example.org/{case_id * 10 + number}.pdf",
+            }
+            for case_id in case_ids
+            # Leaves the last document of some cases without a source url
+            for number in range(3 if case_id % 5 else 2)
+        ],
+        "concepts": concepts,
+    }
+
+
+def test_shards_cases_by_document_count():
+    cases = [
+        ShardedCase(True, position, (position, position, position), case)
+        for position, case in enumerate(
+            [us_case(1, 5), us_case(2, 1), us_case(3, 3), us_case(4, 2)]
+        )
+    ]
+
+    shards = shard_cases(cases, 2)
+
+    assert [[case.data["id"] for case in shard] for shard in shards] == [
+        [1, 2],
+        [3, 4],
+    ]
+    assert shard_cases(cases, 8) == [[cases[0]], [cases[2]], [cases[3]], [cases[1]]]
+    assert shard_cases([], 2) == []
+
+
+def test_maps_cases_in_shards_like_serially(
+    litigation_data, tmp_path, monkeypatch, capsys
+):
+    monkeypatch.chdir(tmp_path)
+    last_import_date = datetime(2025, 1, 1)
+
+    serial_data, serial_failures = wrangle_data(
+        litigation_data, True, False, last_import_date
+    )
+    serial_error_log = (tmp_path / "error_log.txt").read_text()
+    (tmp_path / "error_log.txt").unlink()
+    serial_output = capsys.readouterr().out
+
+    sharded_data, sharded_failures = wrangle_data(
+        litigation_data, True, False, last_import_date, workers=3
+    )
+    sharded_output = capsys.readouterr().out
+
+    # Every concept is in the table, so no worker has to fetch one from WordPress
+    concept_lookups = "🧩 Concept lookups: 20 hits, 0 misses, 0 refetches (0 shared)."
+    assert concept_lookups in serial_output
+    assert concept_lookups in sharded_output
+    assert serial_failures
+    assert len({family["import_id"] for family in serial_data["families"]}) == 19
+    assert json.dumps(sharded_data, ensure_ascii=False, indent=2) == json.dumps(
+        serial_data, ensure_ascii=False, indent=2
+    )
+    assert sharded_failures == serial_failures
+    assert (tmp_path / "error_log.txt").read_text() == serial_error_log
@@ -1,9 +1,19 @@
+import json
 from unittest.mock import patch
 
 import pytest
 from freezegun import freeze_time
 
 from litigation_data_mapper.cli import wrangle_data
+from litigation_data_mapper.fetch_litigation_data import ENDPOINT_FIELDS
+from litigation_data_mapper.schemas import (
+    CaseBundle,
+    GlobalCase,
+    Media,
+    RecordDecoder,
+    TaxonomyTerm,
+    UsCase,
+)
 
 
 @pytest.fixture()
@@ -331,3 +341,79 @@ def test_maps_all_data_regardless_of_update_window_if_get_modified_data_flag_is_
         mock_litigation_data, debug=True, get_modified_data=False
     )
     assert mapped_data == expected_mapped_data
+
+
+@patch("litigation_data_mapper.parsers.family.fetch_individual_concept")
+@freeze_time("2025-02-02T00:00:00")
+def test_maps_modified_data_when_only_some_case_types_were_modified(
+    mock_fetch_individual_concept, mock_litigation_data, expected_mapped_data
+):
+    mock_fetch_individual_concept.return_value = None
+    # Only recently modified cases are fetched when mapping modified data, so there
+    # may be no cases of one type at all
+    mock_litigation_data["families"]["global_cases"] = []
+
+    [mapped_data, _] = wrangle_data(
+        mock_litigation_data, debug=True, get_modified_data=True
+    )
+
+    assert mapped_data["families"] == [expected_mapped_data["families"][0]]
+    assert mapped_data["documents"] == [expected_mapped_data["documents"][2]]
+    assert mapped_data["events"] == expected_mapped_data["events"][:2]
+
+
+@patch("litigation_data_mapper.parsers.family.fetch_individual_concept")
+def test_maps_the_same_data_when_only_the_requested_fields_are_fetched(
+    mock_fetch_individual_concept, mock_litigation_data, expected_mapped_data
+):
+    mock_fetch_individual_concept.return_value = None
+
+    def project(records, endpoint):
+        return [
+            {
+                key: value
+                for key, value in record.items()
+                if key in ENDPOINT_FIELDS[endpoint]
+            }
+            for record in records
+        ]
+
+    families = mock_litigation_data["families"]
+    mock_litigation_data["collections"] = project(
+        mock_litigation_data["collections"], "case_bundles"
+    )
+    families["us_cases"] = project(families["us_cases"], "us_cases")
+    families["global_cases"] = project(families["global_cases"], "global_cases")
+    families["jurisdictions"] = project(families["jurisdictions"], "jurisdictions")
+    mock_litigation_data["documents"] = project(
+        mock_litigation_data["documents"], "document_media"
+    )
+
+    [mapped_data, _] = wrangle_data(
+        mock_litigation_data, debug=True, get_modified_data=False
+    )
+    assert mapped_data == expected_mapped_data
+
+
+@patch("litigation_data_mapper.parsers.family.fetch_individual_concept")
+def test_maps_the_same_data_when_decoded_through_the_schemas(
+    mock_fetch_individual_concept, mock_litigation_data, expected_mapped_data
+):
+    mock_fetch_individual_concept.return_value = None
+
+    def decode(records, schema):
+        return RecordDecoder(schema).decode_page(json.dumps(records), "test")
+
+    families = mock_litigation_data["families"]
+    mock_litigation_data["collections"] = decode(
+        mock_litigation_data["collections"], CaseBundle
+    )
+    families["us_cases"] = decode(families["us_cases"], UsCase)
+    families["global_cases"] = decode(families["global_cases"], GlobalCase)
+    families["jurisdictions"] = decode(families["jurisdictions"], TaxonomyTerm)
+    mock_litigation_data["documents"] = decode(mock_litigation_data["documents"], Media)
+
+    [mapped_data, _] = wrangle_data(
+        mock_litigation_data, debug=True, get_modified_data=False
+    )
+    assert mapped_data == expected_mapped_data